@@ -54,6 +54,11 @@ if 'PYVISTA_BUILDING_GALLERY' in os.environ:
 # A threshold for the max cells to compute a volume for when repr-ing
 REPR_VOLUME_MAX_CELLS = 1e6
 
+# Format and XML compression used when pickling objects.  See
+# ``pyvista.set_pickle_format``
+PICKLE_FORMAT = 'buffers'
+PICKLE_COMPRESSION = 'zlib'
+
 # Set where figures are saved
 FIGURE_PATH = None
 
@@ -41,6 +41,7 @@ if VTK9:
     from vtkmodules.vtkRenderingVolumeOpenGL2 import (vtkOpenGLGPUVolumeRayCastMapper,
                                                       vtkSmartVolumeMapper)
     from vtkmodules.vtkRenderingOpenGL2 import (vtkOpenGLHardwareSelector,
+                                                vtkCompositePolyDataMapper2,
                                                 vtkRenderStepsPass,
                                                 vtkEDLShading,
                                                 vtkOpenGLRenderer,
@@ -77,6 +78,7 @@ if VTK9:
                                      vtkXMLPRectilinearGridReader,
                                      vtkXMLPUnstructuredGridReader,
                                      vtkXMLPImageDataReader,
+                                     vtkXMLPPolyDataReader,
                                      vtkXMLImageDataReader,
                                      vtkXMLImageDataWriter,
                                      vtkXMLPolyDataReader,
@@ -89,6 +91,8 @@ if VTK9:
                                      vtkXMLStructuredGridWriter,
                                      vtkXMLMultiBlockDataReader,
                                      vtkXMLMultiBlockDataWriter)
+    from vtkmodules.vtkIOParallelXML import (vtkXMLPPolyDataWriter,
+                                             vtkXMLPUnstructuredGridWriter)
     from vtkmodules.vtkIOEnSight import vtkGenericEnSightReader
     from vtkmodules.vtkIOLegacy import (vtkDataWriter,
                                         vtkDataReader,
@@ -119,6 +123,13 @@ if VTK9:
                                                vtkDataSet,
                                                vtkPointLocator,
                                                vtkCellLocator,
+                                               vtkStaticCellLocator,
+                                               vtkCellLocatorStrategy,
+                                               vtkCellTypes,
+                                               vtkPointSet,
+                                               vtkGenericCell,
+                                               vtkOctreePointLocator,
+                                               vtkKdTreePointLocator,
                                                vtkMultiBlockDataSet,
                                                vtkCompositeDataSet,
                                                vtkFieldData,
@@ -131,6 +142,8 @@ if VTK9:
                                                vtkSelection,
                                                vtkPerlinNoise,
                                                VTK_HEXAHEDRON,
+                                               VTK_PIXEL,
+                                               VTK_POLYHEDRON,
                                                VTK_PYRAMID,
                                                VTK_QUAD,
                                                VTK_QUADRATIC_HEXAHEDRON,
@@ -141,6 +154,7 @@ if VTK9:
                                                VTK_QUADRATIC_WEDGE,
                                                VTK_TETRA,
                                                VTK_TRIANGLE,
+                                               VTK_VOXEL,
                                                VTK_WEDGE)
     from vtkmodules.vtkRenderingAnnotation import (vtkScalarBarActor,
                                                    vtkCornerAnnotation,
@@ -148,7 +162,9 @@ if VTK9:
                                                    vtkAnnotatedCubeActor,
                                                    vtkLegendBoxActor,
                                                    vtkCubeAxesActor)
+    from vtkmodules.vtkRenderingLOD import vtkLODActor
     from vtkmodules.vtkRenderingCore import (vtkTexture,
+                                             vtkCompositeDataDisplayAttributes,
                                              vtkSkybox,
                                              vtkPropAssembly,
                                              vtkRenderer,
@@ -175,7 +191,9 @@ if VTK9:
                                              vtkLightActor,
                                              vtkLightKit,
                                              vtkCamera,
-                                             vtkImageActor)
+                                             vtkImageActor,
+                                             VTK_SCALAR_MODE_USE_POINT_DATA,
+                                             VTK_SCALAR_MODE_USE_CELL_DATA)
     from vtkmodules.vtkCommonComputationalGeometry import (vtkParametricSpline,
                                                            vtkParametricBour,
                                                            vtkParametricBoy,
@@ -210,6 +228,7 @@ if VTK9:
                                           vtkOutputWindow,
                                           vtkStringOutputWindow,
                                           vtkIdList,
+                                          reference,
                                           vtkStringArray,
                                           vtkCommand,
                                           vtkTypeUInt32Array,
@@ -235,6 +254,7 @@ if VTK9:
                                            vtkAppendArcLength,
                                            vtkCleanPolyData,
                                            vtkQuadricDecimation,
+                                           vtkQuadricClustering,
                                            vtkPolyDataNormals,
                                            vtkTriangleFilter,
                                            vtkSmoothPolyDataFilter,
@@ -272,6 +292,11 @@ if VTK9:
                                               vtkBooleanOperationPolyDataFilter,
                                               vtkTransformFilter,
                                               vtkAxes)
+    # moved to vtkCommonDataModel in VTK 9.2
+    try:
+        from vtkmodules.vtkCommonDataModel import vtkCellTreeLocator
+    except ImportError:  # pragma: no cover
+        from vtkmodules.vtkFiltersGeneral import vtkCellTreeLocator
     from vtkmodules.vtkFiltersModeling import (vtkOutlineFilter,
                                                vtkRibbonFilter,
                                                vtkLinearExtrusionFilter,
@@ -304,6 +329,7 @@ if VTK9:
                                                vtkCompositeDataGeometryFilter,
                                                vtkDataSetSurfaceFilter)
     from vtkmodules.vtkFiltersHybrid import vtkPolyDataSilhouette
+    from vtkmodules.vtkFiltersFlowPaths import vtkModifiedBSPTree
     from vtkmodules.vtkFiltersExtraction import (vtkExtractEdges,
                                                  vtkExtractGeometry,
                                                  vtkExtractGrid,
@@ -321,14 +347,16 @@ if VTK9:
                                            vtkImageFlip,
                                            vtkRTAnalyticSource)
     from vtkmodules.vtkFiltersFlowPaths import vtkEvenlySpacedStreamlines2D, vtkStreamTracer
-    from vtkmodules.vtkCommonExecutionModel import vtkImageToStructuredGrid
+    from vtkmodules.vtkCommonExecutionModel import (vtkImageToStructuredGrid,
+                                                    vtkStreamingDemandDrivenPipeline)
     from vtkmodules.numpy_interface.dataset_adapter import (VTKObjectWrapper,
                                                             numpyTovtkDataArray,
                                                             VTKArray)
     from vtkmodules.util.numpy_support import (vtk_to_numpy,
                                                numpy_to_vtk,
                                                numpy_to_vtkIdTypeArray,
-                                               get_vtk_array_type)
+                                               get_vtk_array_type,
+                                               get_numpy_array_type)
     from vtkmodules.vtkCommonCore import (buffer_shared,
                                           vtkAbstractArray,
                                           vtkWeakReference)
@@ -383,7 +411,8 @@ else:  # pragma: no cover
     from vtk.util.numpy_support import (vtk_to_numpy,
                                         numpy_to_vtk,
                                         numpy_to_vtkIdTypeArray,
-                                        get_vtk_array_type)
+                                        get_vtk_array_type,
+                                        get_numpy_array_type)
 
     # vtk8 already has an import all, so we can just mirror it here at
     # no cost
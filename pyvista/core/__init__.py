@@ -1,7 +1,7 @@
 """Core routines."""
 
 from .dataset import DataSet, DataObject
-from .composite import MultiBlock
+from .composite import LazyMultiBlock, MultiBlock
 from .datasetattributes import DataSetAttributes
 from .filters import (CompositeFilters, DataSetFilters, PolyDataFilters,
                       UnstructuredGridFilters, UniformGridFilters)
@@ -5,7 +5,11 @@ to VTK algorithms and PyVista filtering/plotting routines.
 """
 import pathlib
 import collections.abc
+import concurrent.futures
+import itertools
 import logging
+import os
+from xml.etree import ElementTree
 
 import numpy as np
 from typing import List, Tuple, Union, Optional, Any, cast
@@ -21,6 +25,13 @@ log = logging.getLogger(__name__)
 log.setLevel('CRITICAL')
 
 
+def _apply_to_block(func, block, args, kwargs):
+    """Apply a function or a filter given by name to a block."""
+    if isinstance(func, str):
+        return getattr(block, func)(*args, **kwargs)
+    return func(block, *args, **kwargs)
+
+
 class MultiBlock(_vtk.vtkMultiBlockDataSet, CompositeFilters, DataObject):
     """A composite class to hold many data sets which can be iterated over.
 
@@ -430,6 +441,108 @@ class MultiBlock(_vtk.vtkMultiBlockDataSet, CompositeFilters, DataObject):
         del self[index]
         return data
 
+    def _leaf_blocks(self):
+        """Return all non-empty leaf blocks in depth first order."""
+        leaves = []
+        for i in range(self.n_blocks):
+            block = self[i]
+            if isinstance(block, MultiBlock):
+                leaves.extend(block._leaf_blocks())
+            elif block is not None:
+                leaves.append(block)
+        return leaves
+
+    def _from_leaf_results(self, results):
+        """Return a copy of the structure of this dataset filled with ``results``."""
+        output = MultiBlock()
+        for i in range(self.n_blocks):
+            block = self[i]
+            if isinstance(block, MultiBlock):
+                block = block._from_leaf_results(results)
+            elif block is not None:
+                block = next(results)
+                if block is not None and not isinstance(block, _vtk.vtkDataObject):
+                    raise TypeError('The mapped function must return a dataset or '
+                                    f'None, not {type(block).__name__}.')
+            output[i, self.get_block_name(i)] = block
+        return output
+
+    def map(self, func, *args, executor=None, max_workers=None, **kwargs):
+        """Apply a function or filter to every block and return the results.
+
+        Nested ``MultiBlock`` datasets are traversed and the function
+        is applied to each of their non-empty leaf blocks.  The output
+        has the same structure and block names as this dataset.
+
+        Parameters
+        ----------
+        func : callable or str
+            Function called as ``func(block, *args, **kwargs)`` that
+            returns a dataset or ``None``, or the name of a filter
+            called as ``block.func(*args, **kwargs)``, e.g.
+            ``'clip'``.
+
+        *args : tuple
+            Additional positional arguments passed to ``func``.
+
+        executor : str or concurrent.futures.Executor, optional
+            How the blocks are processed.  ``None`` processes them one
+            after the other, ``'thread'`` in a thread pool and
+            ``'process'`` in a process pool, in which case ``func``
+            and its arguments must be picklable, such as a filter name
+            or a module level function.  An existing executor may
+            also be given.
+
+        max_workers : int, optional
+            Maximum number of workers of the thread or process pool.
+            Defaults to the default of the pool.
+
+        **kwargs : dict, optional
+            Additional keyword arguments passed to ``func``.
+
+        Returns
+        -------
+        pyvista.MultiBlock
+            The results arranged like the blocks of this dataset.
+
+        Examples
+        --------
+        Clip every block.
+
+        >>> import pyvista as pv
+        >>> blocks = pv.MultiBlock({'sphere': pv.Sphere(), 'cube': pv.Cube()})
+        >>> clipped = blocks.map('clip', normal='x')
+        >>> clipped.keys()
+        ['sphere', 'cube']
+
+        Compute the surface of every block in a process pool.
+
+        >>> surfaces = blocks.map('extract_surface', executor='process')  # doctest:+SKIP
+
+        """
+        leaves = self._leaf_blocks()
+        repeat = itertools.repeat
+        if executor is None:
+            results = [_apply_to_block(func, block, args, kwargs) for block in leaves]
+        elif isinstance(executor, concurrent.futures.Executor):
+            results = list(executor.map(_apply_to_block, repeat(func), leaves,
+                                        repeat(args), repeat(kwargs)))
+        elif executor in ('thread', 'process'):
+            if executor == 'thread':
+                pool = concurrent.futures.ThreadPoolExecutor(max_workers)
+            else:
+                pool = concurrent.futures.ProcessPoolExecutor(max_workers)
+            with pool:
+                results = list(pool.map(_apply_to_block, repeat(func), leaves,
+                                        repeat(args), repeat(kwargs)))
+        else:
+            raise ValueError(f'Invalid executor "{executor}".  Must be None, "thread", '
+                             '"process" or a concurrent.futures.Executor.')
+
+        output = self._from_leaf_results(iter(results))
+        output.wrap_nested()
+        return output
+
     def clean(self, empty=True):
         """Remove any null blocks in place.
 
@@ -572,3 +685,288 @@ class MultiBlock(_vtk.vtkMultiBlockDataSet, CompositeFilters, DataObject):
         newobject.copy_meta_from(self)
         newobject.wrap_nested()
         return newobject
+
+
+class _BlockCache:
+    """Least recently used cache of datasets read from files."""
+
+    def __init__(self, max_blocks=None, memory_budget=None):
+        self.max_blocks = max_blocks
+        self.memory_budget = memory_budget
+        self.blocks: collections.OrderedDict = collections.OrderedDict()
+        self.sizes: dict = {}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self.sizes.values())
+
+    def get(self, filename):
+        if filename in self.blocks:
+            self.blocks.move_to_end(filename)
+            return self.blocks[filename]
+        block = pyvista.read(filename)
+        self.blocks[filename] = block
+        self.sizes[filename] = block.actual_memory_size * 1024
+        self.evict()
+        return block
+
+    def evict(self):
+        """Drop the least recently used blocks until the limits are met.
+
+        The most recently used block is always kept.
+        """
+        while len(self.blocks) > 1:
+            too_many = self.max_blocks is not None and len(self.blocks) > self.max_blocks
+            too_large = self.memory_budget is not None and self.nbytes > self.memory_budget
+            if not (too_many or too_large):
+                break
+            filename, _ = self.blocks.popitem(last=False)
+            del self.sizes[filename]
+
+    def clear(self):
+        self.blocks.clear()
+        self.sizes.clear()
+
+
+def _parse_vtm_element(element, directory, cache):
+    """Return the ``(name, block)`` entries of a ``.vtm`` XML element."""
+    entries = {}
+    for child in element:
+        if child.tag not in ('DataSet', 'Block', 'Piece'):
+            continue
+        index = int(child.get('index', len(entries)))
+        if child.tag == 'DataSet':
+            block = child.get('file')
+            if block:
+                block = os.path.join(directory, block)
+        else:
+            block = LazyMultiBlock._from_entries(
+                _parse_vtm_element(child, directory, cache), cache)
+        entries[index] = (child.get('name'), block)
+    n_blocks = max(entries) + 1 if entries else 0
+    return [entries.get(i, (None, None)) for i in range(n_blocks)]
+
+
+class LazyMultiBlock:
+    """A read only ``MultiBlock`` whose blocks are read when accessed.
+
+    Blocks are read from disk the first time they are indexed and kept
+    in a least recently used cache limited by a number of blocks and
+    a memory budget.  Block names and bounds are available without
+    reading the point and cell arrays of the blocks.
+
+    Usually created with ``pyvista.read(filename, lazy=True)``.
+
+    A ``LazyMultiBlock`` is not a :class:`pyvista.MultiBlock`, as it
+    holds no VTK blocks until they are read.  Convert it with
+    :func:`LazyMultiBlock.load` to pass all its blocks to
+    :func:`pyvista.BasePlotter.add_mesh` or to the composite filters,
+    or pass them the blocks read by indexing it.
+
+    Parameters
+    ----------
+    source : str, pathlib.Path or list
+        Path to a ``.vtm`` or ``.vtmb`` file, or a list of filenames
+        with one block per file.
+
+    max_blocks : int, optional
+        Maximum number of blocks kept in memory.  Unlimited by default.
+
+    memory_budget : int, optional
+        Maximum memory in bytes used by the blocks kept in memory.  The
+        most recently accessed block is always kept.  Unlimited by
+        default.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> from pyvista import examples
+    >>> blocks = pyvista.LazyMultiBlock([examples.antfile, examples.planefile],
+    ...                                 max_blocks=1)
+    >>> blocks.keys()
+    ['ant.ply', 'airplane.ply']
+    >>> blocks[0].n_points
+    486
+    >>> blocks.n_cached_blocks
+    1
+
+    Read every block to filter them all.
+
+    >>> blocks.load().combine().n_points
+    1821
+
+    """
+
+    def __init__(self, source, max_blocks=None, memory_budget=None):
+        """Initialize the lazy multi block."""
+        self._cache = _BlockCache(max_blocks, memory_budget)
+        self._bounds: dict = {}
+        if isinstance(source, (str, pathlib.Path)):
+            filename = os.path.abspath(os.path.expanduser(str(source)))
+            if not os.path.isfile(filename):
+                raise FileNotFoundError(f'File ({filename}) not found')
+            root = ElementTree.parse(filename).getroot()
+            if root.get('type') != 'vtkMultiBlockDataSet':
+                raise ValueError(f'File ({filename}) is not a multi block file.')
+            element = root.find('vtkMultiBlockDataSet')
+            self._entries = _parse_vtm_element(element, os.path.dirname(filename),
+                                               self._cache)
+        elif isinstance(source, (list, tuple)):
+            self._entries = []
+            for each in source:
+                each = os.path.abspath(os.path.expanduser(str(each)))
+                if not os.path.isfile(each):
+                    raise FileNotFoundError(f'File ({each}) not found')
+                self._entries.append((os.path.basename(each), each))
+        else:
+            raise TypeError(f'Type {type(source)} is not supported by '
+                            'pyvista.LazyMultiBlock')
+
+    @classmethod
+    def _from_entries(cls, entries, cache):
+        """Create a nested lazy multi block sharing the cache of its parent."""
+        multi = cls.__new__(cls)
+        multi._cache = cache
+        multi._bounds = {}
+        multi._entries = entries
+        return multi
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return (f'{type(self).__name__} ({hex(id(self))})\n'
+                f'  N Blocks:\t{self.n_blocks}\n'
+                f'  N Cached:\t{self.n_cached_blocks}')
+
+    def __len__(self) -> int:
+        """Return the number of blocks."""
+        return len(self._entries)
+
+    def __iter__(self):
+        """Iterate over the blocks, reading each of them."""
+        for i in range(self.n_blocks):
+            yield self[i]
+
+    @property
+    def n_blocks(self) -> int:
+        """Return the number of blocks."""
+        return len(self._entries)
+
+    @property
+    def max_blocks(self) -> Optional[int]:
+        """Return or set the maximum number of blocks kept in memory."""
+        return self._cache.max_blocks
+
+    @max_blocks.setter
+    def max_blocks(self, max_blocks: Optional[int]):
+        self._cache.max_blocks = max_blocks
+        self._cache.evict()
+
+    @property
+    def memory_budget(self) -> Optional[int]:
+        """Return or set the memory budget in bytes of the blocks kept in memory."""
+        return self._cache.memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, memory_budget: Optional[int]):
+        self._cache.memory_budget = memory_budget
+        self._cache.evict()
+
+    @property
+    def n_cached_blocks(self) -> int:
+        """Return the number of blocks currently kept in memory."""
+        return len(self._cache.blocks)
+
+    @property
+    def cached_memory_size(self) -> int:
+        """Return the memory in bytes used by the blocks kept in memory."""
+        return self._cache.nbytes
+
+    def clear_cache(self):
+        """Release all blocks kept in memory."""
+        self._cache.clear()
+
+    def keys(self) -> List[Optional[str]]:
+        """Get all the block names in the dataset."""
+        return [name for name, _ in self._entries]
+
+    def get_block_name(self, index: int) -> Optional[str]:
+        """Return the string name of the block at the given index."""
+        return self._entries[index][0]
+
+    def get_index_by_name(self, name: str) -> int:
+        """Find the index number by block name."""
+        for i, (block_name, _) in enumerate(self._entries):
+            if block_name == name:
+                return i
+        raise KeyError(f'Block name ({name}) not found')
+
+    def get_filename(self, index: Union[int, str]) -> Optional[str]:
+        """Return the filename of a block or ``None`` for nested and empty blocks."""
+        if isinstance(index, str):
+            index = self.get_index_by_name(index)
+        block = self._entries[index][1]
+        return block if isinstance(block, str) else None
+
+    def __getitem__(self, index: Union[int, str]):
+        """Get a block by its index or name, reading it if needed."""
+        if isinstance(index, str):
+            index = self.get_index_by_name(index)
+        if index < 0:
+            index = self.n_blocks + index
+        if index < 0 or index >= self.n_blocks:
+            raise IndexError(f'index ({index}) out of range for this dataset.')
+        block = self._entries[index][1]
+        if isinstance(block, str):
+            return self._cache.get(block)
+        return block
+
+    def get(self, index: Union[int, str]):
+        """Get a block by its index or name, reading it if needed."""
+        return self[index]
+
+    def get_block_bounds(self, index: Union[int, str]) -> Optional[List[float]]:
+        """Return the bounds of a block without reading its arrays.
+
+        Returns ``None`` for empty blocks.
+        """
+        if isinstance(index, str):
+            index = self.get_index_by_name(index)
+        block = self._entries[index][1]
+        if block is None:
+            return None
+        if isinstance(block, LazyMultiBlock):
+            return block.bounds
+        if block in self._cache.blocks:
+            return list(self._cache.blocks[block].bounds)
+        if block not in self._bounds:
+            self._bounds[block] = pyvista.utilities.fileio._read_bounds(block)
+        return self._bounds[block]
+
+    @property
+    def bounds(self) -> List[float]:
+        """Find min/max for bounds across blocks without reading their arrays."""
+        block_bounds = (self.get_block_bounds(i) for i in range(self.n_blocks))
+        all_bounds = np.array([bnds for bnds in block_bounds if bnds is not None])
+        if not all_bounds.size:
+            return [np.inf, -np.inf] * 3
+        minima = all_bounds[:, ::2].min(axis=0)
+        maxima = all_bounds[:, 1::2].max(axis=0)
+        return np.column_stack((minima, maxima)).ravel().tolist()
+
+    def load(self) -> MultiBlock:
+        """Read every block and return a regular ``MultiBlock``.
+
+        Returns
+        -------
+        pyvista.MultiBlock
+            Dataset with all blocks in memory.
+
+        """
+        multi = MultiBlock()
+        for i, (name, block) in enumerate(self._entries):
+            if isinstance(block, LazyMultiBlock):
+                block = block.load()
+            elif block is not None:
+                block = pyvista.read(block)
+            multi[i, name] = block
+        return multi
@@ -11,6 +11,7 @@ import numpy as np
 import pyvista
 from pyvista import _vtk
 from pyvista.utilities import (FieldAssociation, fileio, abstract_class)
+from pyvista.utilities.serialization import dataset_to_buffers, dataset_from_buffers
 from .datasetattributes import DataSetAttributes
 
 log = logging.getLogger(__name__)
@@ -19,6 +20,18 @@ log.setLevel('CRITICAL')
 # vector array names
 DEFAULT_VECTOR_KEY = '_vectors'
 
+# XML writer and reader pairs used when pickling with the ``'xml'`` format
+_XML_PICKLE_IO = [
+    (_vtk.vtkPolyData, _vtk.vtkXMLPolyDataWriter, _vtk.vtkXMLPolyDataReader),
+    (_vtk.vtkUnstructuredGrid, _vtk.vtkXMLUnstructuredGridWriter,
+     _vtk.vtkXMLUnstructuredGridReader),
+    (_vtk.vtkStructuredGrid, _vtk.vtkXMLStructuredGridWriter,
+     _vtk.vtkXMLStructuredGridReader),
+    (_vtk.vtkRectilinearGrid, _vtk.vtkXMLRectilinearGridWriter,
+     _vtk.vtkXMLRectilinearGridReader),
+    (_vtk.vtkImageData, _vtk.vtkXMLImageDataWriter, _vtk.vtkXMLImageDataReader),
+]
+
 
 @abstract_class
 class DataObject:
@@ -64,7 +77,12 @@ class DataObject:
         ----------
         filename : str, pathlib.Path
          Filename of output file. Writer type is inferred from
-         the extension of the filename.
+         the extension of the filename.  Datasets may also be saved
+         with the ``'.pvraw'`` extension in the raw buffer format
+         that :func:`pyvista.read` maps into memory, see
+         :func:`pyvista.save_raw`, or with the ``'.pvtu'`` and
+         ``'.pvtp'`` extensions in pieces written concurrently, see
+         :func:`pyvista.save_partitioned`.
 
         binary : bool, optional
          If True, write as binary, else ASCII.
@@ -75,6 +93,13 @@ class DataObject:
         file size.
 
         """
+        if Path(filename).suffix == fileio.RAW_EXTENSION and \
+           not isinstance(self, pyvista.MultiBlock):
+            return fileio.save_raw(filename, self)
+        if Path(filename).suffix in fileio.PARTITIONED_EXTENSIONS and \
+           not isinstance(self, pyvista.MultiBlock):
+            return fileio.save_partitioned(filename, self, binary=binary)
+
         if self._WRITERS is None:
             raise NotImplementedError(f'{self.__class__.__name__} writers are not specified,'
                                       ' this should be a dict of (file extension: vtkWriter type)')
@@ -246,9 +271,48 @@ class DataObject:
         """
         self.CopyAttributes(dataset)
 
+    def _get_xml_pickle_io(self):
+        """Return the XML writer and reader types used to pickle this object."""
+        for vtk_type, writer_type, reader_type in _XML_PICKLE_IO:
+            if isinstance(self, vtk_type):
+                return writer_type, reader_type
+        return None, None
+
     def __getstate__(self):
-        """Support pickle. Serialize the VTK object to ASCII string."""
+        """Support pickle.
+
+        The VTK object is serialized according to
+        ``pyvista.PICKLE_FORMAT``.  See :func:`pyvista.set_pickle_format`.
+
+        """
         state = self.__dict__.copy()
+        # ``FieldAssociation`` members wrap VTK enums that cannot be pickled
+        state['association_bitarray_names'] = {
+            int(association.value): names
+            for association, names in self.association_bitarray_names.items()
+        }
+        pickle_format = pyvista.PICKLE_FORMAT
+
+        if pickle_format == 'buffers':
+            try:
+                state['vtk_buffers'] = dataset_to_buffers(self)
+                return state
+            except TypeError:
+                # unsupported dataset or array type, use xml instead
+                pickle_format = 'xml'
+
+        writer_type, _ = self._get_xml_pickle_io()
+        if pickle_format == 'xml' and writer_type is not None:
+            writer = writer_type()
+            writer.SetInputDataObject(self)
+            writer.SetWriteToOutputString(True)
+            writer.SetDataModeToBinary()
+            fileio.set_vtkwriter_compression(writer, pyvista.PICKLE_COMPRESSION)
+            writer.Write()
+            state['vtk_serialized'] = writer.GetOutputString()
+            state['vtk_serialized_format'] = 'xml'
+            return state
+
         writer = _vtk.vtkDataSetWriter()
         writer.SetInputDataObject(self)
         writer.SetWriteToOutputString(True)
@@ -260,10 +324,24 @@ class DataObject:
 
     def __setstate__(self, state):
         """Support unpickle."""
-        vtk_serialized = state.pop('vtk_serialized')
+        vtk_buffers = state.pop('vtk_buffers', None)
+        vtk_serialized = state.pop('vtk_serialized', None)
+        serialized_format = state.pop('vtk_serialized_format', 'legacy')
         self.__dict__.update(state)
-
-        reader = _vtk.vtkDataSetReader()
+        self.association_bitarray_names = collections.defaultdict(set, {
+            FieldAssociation(association): names
+            for association, names in state.get('association_bitarray_names', {}).items()
+        })
+
+        if vtk_buffers is not None:
+            dataset_from_buffers(*vtk_buffers, dataset=self)
+            return
+
+        if serialized_format == 'xml':
+            _, reader_type = self._get_xml_pickle_io()
+            reader = reader_type()
+        else:
+            reader = _vtk.vtkDataSetReader()
         reader.ReadFromInputStringOn()
         reader.SetInputString(vtk_serialized)
         reader.Update()
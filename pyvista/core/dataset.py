@@ -1,9 +1,13 @@
 """Attributes common to PolyData and Grid Objects."""
 
 import collections.abc
+import concurrent.futures
+import itertools
 import logging
+import os
 from typing import Optional, List, Tuple, Iterable, Union, Any, Dict
 import warnings
+import weakref
 
 import numpy as np
 
@@ -25,6 +29,86 @@ log.setLevel('CRITICAL')
 # vector array names
 DEFAULT_VECTOR_KEY = '_vectors'
 
+# Locator types available to ``DataSet.build_locator``
+POINT_LOCATORS = {
+    'uniform': _vtk.vtkPointLocator,
+    'static': _vtk.vtkStaticPointLocator,
+    'octree': _vtk.vtkOctreePointLocator,
+    'kdtree': _vtk.vtkKdTreePointLocator,
+}
+CELL_LOCATORS = {
+    'octree': _vtk.vtkCellLocator,
+    'static': _vtk.vtkStaticCellLocator,
+    'bsp': _vtk.vtkModifiedBSPTree,
+    'cell_tree': _vtk.vtkCellTreeLocator,
+}
+_DEFAULT_LOCATORS = {'point': 'static', 'cell': 'octree'}
+# point locators that require a ``vtkPointSet``
+_POINT_SET_LOCATORS = ('static', 'kdtree')
+# cell locators implementing ``FindClosestPoint``
+_CLOSEST_POINT_CELL_LOCATORS = ('octree', 'static')
+# cell array holding the cell ids in the dataset of the cell locators
+_CELL_IDS = 'vtkOriginalCellIds'
+# cached locators of each dataset by ``id`` of the dataset.  Locators
+# reference their dataset, so they are kept out of the dataset
+# attributes to let VTK release both once the dataset is collected.
+_LOCATORS: Dict[int, Dict[str, Tuple[str, Any, int]]] = {}
+
+
+def _locator_cache(dataset):
+    """Return the cached locators of a dataset."""
+    key = id(dataset)
+    if key not in _LOCATORS:
+        _LOCATORS[key] = {}
+        weakref.finalize(dataset, _LOCATORS.pop, key, None)
+    return _LOCATORS[key]
+
+
+def _query_closest_points(locator, points, k):
+    """Return the indices of the ``k`` closest points of a locator to each point."""
+    if k == 1:
+        find_closest_point = locator.FindClosestPoint
+        return np.array([find_closest_point(node) for node in points.tolist()],
+                        dtype=pyvista.ID_TYPE)
+    id_list = _vtk.vtkIdList()
+    find_closest_n_points = locator.FindClosestNPoints
+    get_id = id_list.GetId
+    flat_indices = []
+    for node in points.tolist():
+        find_closest_n_points(k, node, id_list)
+        flat_indices.extend([get_id(j) for j in range(k)])
+    return np.array(flat_indices, dtype=pyvista.ID_TYPE).reshape(-1, k)
+
+
+def _build_point_locator(mesh_points, locator_type):
+    """Return a point locator of the given points built in a worker."""
+    dataset = _vtk.vtkPolyData()
+    dataset.SetPoints(pyvista.vtk_points(mesh_points, deep=False))
+    locator = POINT_LOCATORS[locator_type]()
+    locator.SetDataSet(dataset)
+    locator.BuildLocator()
+    return locator
+
+
+def _query_closest_points_chunk(mesh_points, locator_type, points, k):
+    """Query a chunk of points with a point locator built for the chunk."""
+    return _query_closest_points(_build_point_locator(mesh_points, locator_type), points, k)
+
+
+# point locator of a process pool worker, see ``_init_closest_points_worker``
+_WORKER_LOCATOR = None
+
+
+def _init_closest_points_worker(mesh_points, locator_type):
+    """Build the point locator of a process pool worker once."""
+    global _WORKER_LOCATOR
+    _WORKER_LOCATOR = _build_point_locator(mesh_points, locator_type)
+
+
+def _query_closest_points_worker(points, k):
+    """Query a chunk of points with the point locator of this worker."""
+    return _query_closest_points(_WORKER_LOCATOR, points, k)
+
 
 class ActiveArrayInfo:
     """Active array info class with support for pickling."""
@@ -850,13 +934,157 @@ class DataSet(DataSetFilters, DataObject):
         alg.Update()
         return _get_output(alg)
 
+    def _get_structure_mtime(self) -> int:
+        """Return the modification time of the geometry and topology.
+
+        Unlike ``GetMTime``, this ignores modifications of the point,
+        cell and field data.
+
+        """
+        mtime = _vtk.vtkDataObject.GetMTime(self)
+        for getter in ('GetPoints', 'GetCells', 'GetCellTypesArray', 'GetVerts',
+                       'GetLines', 'GetPolys', 'GetStrips', 'GetXCoordinates',
+                       'GetYCoordinates', 'GetZCoordinates'):
+            if hasattr(self, getter):
+                vtk_obj = getattr(self, getter)()
+                if vtk_obj is not None:
+                    mtime = max(mtime, vtk_obj.GetMTime())
+        return mtime
+
+    def build_locator(self, kind='point', locator_type=None, force=False):
+        """Build and cache a point or cell locator for this dataset.
+
+        The locator is reused by :func:`DataSet.find_closest_point` and
+        :func:`DataSet.find_closest_cell` until the points or cells of
+        this dataset are modified, at which point it is rebuilt
+        automatically on its next use.
+
+        Parameters
+        ----------
+        kind : str, optional
+            Either ``'point'`` or ``'cell'``.
+
+        locator_type : str, optional
+            Type of the locator.  For point locators, one of
+            ``'static'`` (``vtkStaticPointLocator``), ``'uniform'``
+            (``vtkPointLocator``), ``'octree'``
+            (``vtkOctreePointLocator``) or ``'kdtree'``
+            (``vtkKdTreePointLocator``).  The default is ``'static'``
+            for datasets with explicit points and ``'uniform'`` for
+            the others, which do not support ``'static'`` and
+            ``'kdtree'``.  ``'kdtree'`` is usually the fastest for
+            query points far away from the mesh.  For cell locators,
+            one of ``'octree'`` (``vtkCellLocator``), ``'static'``
+            (``vtkStaticCellLocator``), ``'bsp'``
+            (``vtkModifiedBSPTree``) or ``'cell_tree'``
+            (``vtkCellTreeLocator``).  The default is ``'octree'``.
+            When a locator is cached, its type is used by default
+            instead.  ``'bsp'`` and ``'cell_tree'``
+            do not support closest point queries and are replaced by
+            the default cell locator in :func:`DataSet.find_closest_cell`.
+
+        force : bool, optional
+            Rebuild the locator even if the cached one is up to date.
+
+        Returns
+        -------
+        vtk.vtkLocator
+            The cached locator.
+
+        Examples
+        --------
+        Use a static point locator for many repeated queries.
+
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> locator = mesh.build_locator('point', 'static')
+        >>> locator.GetClassName()
+        'vtkStaticPointLocator'
+        >>> mesh.find_closest_point([0, 0, 0.5])
+        1
+
+        """
+        if kind == 'point':
+            locators = POINT_LOCATORS
+        elif kind == 'cell':
+            locators = CELL_LOCATORS
+        else:
+            raise ValueError(f'Invalid locator kind "{kind}".  Must be "point" or "cell".')
+
+        cached = _LOCATORS.get(id(self), {}).get(kind)
+        if locator_type is None:
+            locator_type = self._locator_type(kind)
+        if locator_type not in locators:
+            raise ValueError(f'Invalid {kind} locator type "{locator_type}".  '
+                             f'Must be one of {list(locators)}.')
+        if kind == 'point' and locator_type in _POINT_SET_LOCATORS and \
+           not isinstance(self, _vtk.vtkPointSet):
+            raise TypeError(f'The "{locator_type}" point locator requires a dataset '
+                            f'with explicit points, not {type(self).__name__}.')
+
+        mtime = self._get_structure_mtime()
+        if not force and cached is not None:
+            cached_type, locator, cached_mtime = cached
+            if cached_type == locator_type and cached_mtime == mtime:
+                return locator
+
+        locator = locators[locator_type]()
+        if kind == 'cell':
+            # locate the cells of a shallow copy holding the cell ids, which
+            # lets ``find_closest_cell`` probe all its points with this locator
+            dataset = self.NewInstance()
+            dataset.ShallowCopy(self)
+            dataset.GetPointData().Initialize()
+            dataset.GetCellData().Initialize()
+            cell_ids = _vtk.numpy_to_vtk(np.arange(self.n_cells, dtype=pyvista.ID_TYPE),
+                                         deep=True)
+            cell_ids.SetName(_CELL_IDS)
+            dataset.GetCellData().AddArray(cell_ids)
+            locator.SetDataSet(dataset)
+        else:
+            locator.SetDataSet(self)
+        locator.BuildLocator()
+        _locator_cache(self)[kind] = (locator_type, locator, mtime)
+        return locator
+
+    def _locator_type(self, kind):
+        """Return the type of the cached locator or of the default one."""
+        cached = _LOCATORS.get(id(self), {}).get(kind)
+        if cached is not None:
+            return cached[0]
+        if kind == 'point' and not isinstance(self, _vtk.vtkPointSet):
+            return 'uniform'
+        return _DEFAULT_LOCATORS[kind]
+
+    def drop_locator(self, kind=None):
+        """Remove a cached locator.
+
+        Parameters
+        ----------
+        kind : str, optional
+            Either ``'point'`` or ``'cell'``.  Removes both cached
+            locators by default.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> _ = mesh.build_locator('cell', 'static')
+        >>> mesh.drop_locator()
+
+        """
+        locators = _LOCATORS.get(id(self), {})
+        if kind is None:
+            locators.clear()
+        else:
+            locators.pop(kind, None)
+
     def find_closest_point(self, point: Iterable[float], n=1) -> int:
         """Find index of closest point in this mesh to the given point.
 
-        If wanting to query many points, use a KDTree with scipy or another
-        library as those implementations will be easier to work with.
-
-        See: https://github.com/pyvista/pyvista-support/issues/107
+        The point locator is cached on this dataset, see
+        :func:`DataSet.build_locator`.  To query many points at once,
+        use :func:`DataSet.find_closest_points`.
 
         Parameters
         ----------
@@ -878,18 +1106,137 @@ class DataSet(DataSetFilters, DataObject):
         if n < 1:
             raise ValueError("`n` must be a positive integer.")
 
-        locator = _vtk.vtkPointLocator()
-        locator.SetDataSet(self)
-        locator.BuildLocator()
+        locator = self.build_locator('point')
         if n > 1:
             id_list = _vtk.vtkIdList()
             locator.FindClosestNPoints(n, point, id_list)
             return vtk_id_list_to_array(id_list)
         return locator.FindClosestPoint(point)
 
+    def find_closest_points(self, points: np.ndarray, k=1, return_distances=True,
+                            executor=None, max_workers=None) -> Union[np.ndarray, tuple]:
+        """Find the ``k`` closest mesh points to each of many query points.
+
+        Uses the point locator cached on this dataset, see
+        :func:`DataSet.build_locator`.  VTK locators answer one query
+        at a time, so each query point costs one ``FindClosestPoint``
+        or ``FindClosestNPoints`` call.  Many queries may instead be
+        split in chunks queried in parallel by a process pool.  The
+        mesh points are sent once to each worker, which builds its own
+        locator of the same type, so this only pays off when the
+        queries largely outnumber the points of the mesh.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Query points with shape ``(N, 3)`` or a single point with
+            shape ``(3,)``.
+
+        k : int, optional
+            Number of closest points to find for each query point.
+
+        return_distances : bool, optional
+            Also return the distances from the query points to the
+            closest mesh points.
+
+        executor : str or concurrent.futures.Executor, optional
+            How the queries are run.  ``None`` queries all the points
+            with the cached locator and ``'process'`` splits them in
+            one chunk per worker of a process pool.  An existing
+            executor may also be given.
+
+        max_workers : int, optional
+            Number of chunks and maximum number of workers of the
+            process pool.  Defaults to the number of CPUs.
+
+        Returns
+        -------
+        indices : np.ndarray
+            Indices of the closest mesh points, sorted by distance.
+            Shape ``(N,)`` when ``k == 1``, otherwise ``(N, k)``.  The
+            first dimension is dropped for a single query point.
+
+        distances : np.ndarray
+            Distances to the closest mesh points with the same shape
+            as ``indices``.  Only returned when
+            ``return_distances=True``.
+
+        Examples
+        --------
+        Find the 3 closest sphere points to 1000 random points.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> points = np.random.random((1000, 3))
+        >>> indices, distances = mesh.find_closest_points(points, k=3)
+        >>> indices.shape
+        (1000, 3)
+
+        Split many queries between the cores of the machine.
+
+        >>> points = np.random.random((1000000, 3))
+        >>> indices = mesh.find_closest_points(points, return_distances=False,
+        ...                                    executor='process')  # doctest:+SKIP
+
+        """
+        points = np.asarray(points, dtype=float)
+        single = points.ndim == 1
+        if single:
+            points = points.reshape(1, -1)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError('Points must have shape (N, 3) or (3,).')
+        if not isinstance(k, (int, np.integer)) or k < 1:
+            raise ValueError('`k` must be a positive integer.')
+        if k > self.n_points:
+            raise ValueError(f'`k` ({k}) must not exceed the number of points '
+                             f'in this mesh ({self.n_points}).')
+
+        if executor is None:
+            indices = _query_closest_points(self.build_locator('point'), points, k)
+        elif executor == 'process' or isinstance(executor, concurrent.futures.Executor):
+            chunks = np.array_split(points, max_workers or os.cpu_count() or 1)
+            repeat = itertools.repeat
+            mesh_points = np.asarray(self.points)
+            locator_type = self._locator_type('point')
+            if executor == 'process':
+                # send the mesh points once to each worker rather than
+                # with every chunk
+                with concurrent.futures.ProcessPoolExecutor(
+                        max_workers, initializer=_init_closest_points_worker,
+                        initargs=(mesh_points, locator_type)) as pool:
+                    results = pool.map(_query_closest_points_worker, chunks, repeat(k))
+                    indices = np.concatenate(list(results))
+            else:
+                results = executor.map(_query_closest_points_chunk, repeat(mesh_points),
+                                       repeat(locator_type), chunks, repeat(k))
+                indices = np.concatenate(list(results))
+        else:
+            raise ValueError(f'Invalid executor "{executor}".  Must be None, "process" '
+                             'or a concurrent.futures.Executor.')
+
+        if single:
+            indices = indices[0]
+            points = points[0]
+        if not return_distances:
+            return indices
+
+        mesh_points = self.points
+        if k == 1:
+            distances = np.linalg.norm(mesh_points[indices] - points, axis=-1)
+        else:
+            distances = np.linalg.norm(mesh_points[indices] - points[..., np.newaxis, :],
+                                       axis=-1)
+        return indices, distances
+
     def find_closest_cell(self, point: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
         """Find index of closest cell in this mesh to the given point.
 
+        The cell locator is cached on this dataset, see
+        :func:`DataSet.build_locator`.  All the points are located at
+        once by ``vtkProbeFilter``, so prefer passing every query point
+        in a single array over calling this method in a loop.
+
         Parameters
         ----------
         point : iterable(float) or np.ndarray
@@ -902,6 +1249,11 @@ class DataSet(DataSetFilters, DataObject):
             Index or indices of the cell in this mesh that is closest
             to the given point.
 
+        See Also
+        --------
+        DataSet.find_nearest_cells : Find the nearest cells to points
+            outside the mesh as well.
+
         Examples
         --------
         Find nearest cell to a point on a sphere
@@ -922,6 +1274,118 @@ class DataSet(DataSetFilters, DataObject):
         >>> indices.shape
         (1000,)
         """
+        point = self._check_query_points(point)
+        closest_cells = self._locate_cells(point)
+        return int(closest_cells[0]) if len(closest_cells) == 1 else closest_cells
+
+    def find_nearest_cells(self, points: np.ndarray, return_closest_point=False,
+                           return_distance=False) -> Union[int, np.ndarray, tuple]:
+        """Find the nearest cell of this mesh to each of many points.
+
+        Unlike :func:`DataSet.find_closest_cell`, which returns ``-1``
+        for points outside of every cell, the nearest cell is found for
+        any point, along with the closest point on that cell.
+
+        Parameters
+        ----------
+        points : iterable(float) or np.ndarray
+            Length 3 coordinate of the point to query or a ``numpy`` array
+            of coordinates with shape ``(N, 3)``.
+
+        return_closest_point : bool, optional
+            Also return the closest point on the nearest cell.
+
+        return_distance : bool, optional
+            Also return the distance between the query point and the
+            closest point on the nearest cell.
+
+        Returns
+        -------
+        index : int or np.ndarray
+            Index or indices of the nearest cell.  ``-1`` when the mesh
+            has no cells.
+
+        closest_point : np.ndarray
+            Closest point or points on the nearest cells.  Only
+            returned when ``return_closest_point=True``.
+
+        distance : float or np.ndarray
+            Distance or distances to the nearest cells.  Only returned
+            when ``return_distance=True``.
+
+        Notes
+        -----
+        This method is not vectorized for every mesh.  On meshes made
+        only of 3D cells, the points inside a cell are located at once
+        like in :func:`DataSet.find_closest_cell`, and only the points
+        outside of every cell are searched one at a time.  On any other
+        mesh, such as a surface, every point is searched one at a time
+        with ``FindClosestPoint`` of the cell locator, as VTK has no
+        batched closest cell query.
+
+        Examples
+        --------
+        Find the nearest cells, the closest points on those cells and
+        the distances to them for several random points.
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> points = np.random.random((1000, 3))
+        >>> indices, closest, distance = mesh.find_nearest_cells(
+        ...     points, return_closest_point=True, return_distance=True)
+        >>> indices.shape, closest.shape, distance.shape
+        ((1000,), (1000, 3), (1000,))
+
+        """
+        points = self._check_query_points(points)
+        n_points = points.shape[0]
+        if self.n_cells:
+            # points inside 3D cells are their own closest points
+            if self._has_only_3d_cells():
+                closest_cells = self._locate_cells(points)
+            else:
+                closest_cells = np.full(n_points, -1, dtype=pyvista.ID_TYPE)
+            closest_points = points.copy()
+            dist2 = np.zeros(n_points)
+
+            outside = np.flatnonzero(closest_cells == -1)
+            if outside.size:
+                locator_type = None
+                cached = _LOCATORS.get(id(self), {}).get('cell')
+                if cached is not None and cached[0] not in _CLOSEST_POINT_CELL_LOCATORS:
+                    locator_type = _DEFAULT_LOCATORS['cell']
+                find_closest_point = self.build_locator('cell', locator_type).FindClosestPoint
+
+                # reuse the output arguments across the VTK calls
+                cell = _vtk.vtkGenericCell()
+                closest_point = [0.0, 0.0, 0.0]
+                cell_id = _vtk.reference(0)
+                sub_id = _vtk.reference(0)
+                vtk_dist2 = _vtk.reference(0.0)
+                for i, node in zip(outside.tolist(), points[outside].tolist()):
+                    find_closest_point(node, closest_point, cell, cell_id, sub_id, vtk_dist2)
+                    closest_cells[i] = cell_id.get()
+                    closest_points[i] = closest_point
+                    dist2[i] = vtk_dist2.get()
+        else:
+            closest_cells = np.full(n_points, -1, dtype=pyvista.ID_TYPE)
+            closest_points = np.full((n_points, 3), np.nan)
+            dist2 = np.full(n_points, np.nan)
+
+        if n_points == 1:
+            out = [int(closest_cells[0]), closest_points[0], float(np.sqrt(dist2[0]))]
+        else:
+            out = [closest_cells, closest_points, np.sqrt(dist2)]
+        if not return_closest_point:
+            out.pop(1)
+        if not return_distance:
+            out.pop(-1)
+        return out[0] if len(out) == 1 else tuple(out)
+
+    @staticmethod
+    def _check_query_points(point):
+        """Return query points as a ``(N, 3)`` array."""
         if isinstance(point, collections.abc.Sequence):
             point = np.array(point)
         # check if this is an array of points
@@ -937,12 +1401,48 @@ class DataSet(DataSetFilters, DataObject):
                 point = np.array([point])
         else:
             raise TypeError("Given point must be an iterable or an array.")
-
-        locator = _vtk.vtkCellLocator()
-        locator.SetDataSet(self)
-        locator.BuildLocator()
-        closest_cells = np.array([locator.FindCell(node) for node in point])
-        return int(closest_cells[0]) if len(closest_cells) == 1 else closest_cells
+        return point.astype(float, copy=False)
+
+    def _has_only_3d_cells(self):
+        """Return ``True`` when all the cells of this dataset are 3D."""
+        cell_types = _vtk.vtkCellTypes()
+        self.GetCellTypes(cell_types)
+        cell = _vtk.vtkGenericCell()
+        for i in range(cell_types.GetNumberOfTypes()):
+            cell.SetCellType(cell_types.GetCellType(i))
+            if cell.GetCellDimension() != 3:
+                return False
+        return True
+
+    def _locate_cells(self, points):
+        """Return the cells containing each point, ``-1`` outside of the mesh.
+
+        Probes the points through the dataset of the cached cell
+        locator, which holds the cell ids.
+        """
+        if not self.n_cells:
+            return np.full(points.shape[0], -1, dtype=pyvista.ID_TYPE)
+        locator = self.build_locator('cell')
+        query = _vtk.vtkPolyData()
+        query.SetPoints(pyvista.vtk_points(points, deep=False))
+
+        probe = _vtk.vtkProbeFilter()
+        probe.SetInputData(query)
+        probe.SetSourceData(locator.GetDataSet())
+        if _vtk.VTK9:
+            # locate the cells of point sets with the cached locator
+            strategy = _vtk.vtkCellLocatorStrategy()
+            strategy.SetCellLocator(locator)
+            probe.SetFindCellStrategy(strategy)
+        # match ``vtkAbstractCellLocator.FindCell``
+        probe.ComputeToleranceOff()
+        probe.SetTolerance(0.0)
+        probe.Update()
+
+        point_data = probe.GetOutput().GetPointData()
+        valid = _vtk.vtk_to_numpy(point_data.GetArray(probe.GetValidPointMaskArrayName()))
+        cell_ids = _vtk.vtk_to_numpy(point_data.GetArray(_CELL_IDS))
+        return np.where(valid.view(bool), cell_ids, -1).astype(pyvista.ID_TYPE, copy=False)
 
     def cell_n_points(self, ind: int) -> int:
         """Return the number of points in a cell.
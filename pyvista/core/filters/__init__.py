@@ -23,17 +23,33 @@ Example
 
 """
 
+import functools
+import sys
+
 import pyvista
 from pyvista.utilities import wrap, ProgressMonitor
+from pyvista.utilities.filter_executor import _active_future
+from pyvista.utilities.profiling import _profiled_update, _profiling
 
 
 def _update_alg(alg, progress_bar=False, message=''):
-    """Update an algorithm with or without a progress bar."""
+    """Update an algorithm with or without a progress bar.
+
+    Within a :class:`pyvista.FilterExecutor`, the algorithm reports its
+    progress to the future of the filter and is aborted when the
+    future is aborted.  Within :func:`pyvista.profile`, the update
+    is recorded under the name of the calling filter.
+    """
+    future = _active_future()
+    update = alg.Update if future is None else lambda: future._update(alg)
+    if _profiling():
+        update = functools.partial(_profiled_update, update, alg,
+                                   sys._getframe(1).f_code.co_name)
     if progress_bar:
         with ProgressMonitor(alg, message=message):
-            alg.Update()
+            update()
     else:
-        alg.Update()
+        update()
 
 
 def _get_output(algorithm, iport=0, iconnection=0, oport=0, active_scalars=None,
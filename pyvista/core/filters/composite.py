@@ -1,6 +1,7 @@
 """Filters module with a class to manage filters/algorithms for composite datasets."""
 import pyvista
 from pyvista import abstract_class, _vtk, wrap
+from pyvista.core.filters import _update_alg
 from pyvista.core.filters.data_set import DataSetFilters
 
 
@@ -18,7 +19,7 @@ class CompositeFilters:
         """
         gf = _vtk.vtkCompositeDataGeometryFilter()
         gf.SetInputData(composite)
-        gf.Update()
+        _update_alg(gf)
         return wrap(gf.GetOutputDataObject(0))
 
     def combine(composite, merge_points=False):
@@ -36,7 +37,7 @@ class CompositeFilters:
                 block = CompositeFilters.combine(block, merge_points=merge_points)
             alg.AddInputData(block)
         alg.SetMergePoints(merge_points)
-        alg.Update()
+        _update_alg(alg)
         return wrap(alg.GetOutputDataObject(0))
 
     clip = DataSetFilters.clip
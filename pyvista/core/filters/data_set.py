@@ -34,7 +34,7 @@ class DataSetFilters:
         alg.SetInsideOut(invert)  # invert the clip if needed
         if return_clipped:
             alg.GenerateClippedOutputOn()
-        alg.Update()  # Perform the Cut
+        _update_alg(alg)  # Perform the Cut
 
         if return_clipped:
             a = _get_output(alg, oport=0)
@@ -198,7 +198,7 @@ class DataSetFilters:
             # invert the clip if needed
             port = 1
             alg.GenerateClippedOutputOn()
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg, oport=port)
 
     def compute_implicit_distance(dataset, surface, inplace=False):
@@ -315,7 +315,7 @@ class DataSetFilters:
         # SetInputArrayToProcess(idx, port, connection, field, name)
         alg.SetInputArrayToProcess(0, 0, 0, field.value, scalars)
         alg.SetInsideOut(invert)  # invert the clip if needed
-        alg.Update()  # Perform the Cut
+        _update_alg(alg)  # Perform the Cut
         result = _get_output(alg)
 
         if inplace:
@@ -433,7 +433,7 @@ class DataSetFilters:
         alg.SetCutFunction(plane)  # the cutter to use the plane we made
         if not generate_triangles:
             alg.GenerateTrianglesOff()
-        alg.Update()  # Perform the Cut
+        _update_alg(alg)  # Perform the Cut
         output = _get_output(alg)
         if contour:
             return output.contour()
@@ -654,7 +654,7 @@ class DataSetFilters:
         alg.SetCutFunction(polyplane)  # the cutter to use the poly planes
         if not generate_triangles:
             alg.GenerateTrianglesOff()
-        alg.Update()  # Perform the Cut
+        _update_alg(alg)  # Perform the Cut
         output = _get_output(alg)
         if contour:
             return output.contour()
@@ -766,7 +766,7 @@ class DataSetFilters:
             appender = _vtk.vtkAppendFilter()
             appender.AddInputData(t1)
             appender.AddInputData(t2)
-            appender.Update()
+            _update_alg(appender)
             return _get_output(appender)
 
         # Run a standard threshold algorithm
@@ -793,7 +793,7 @@ class DataSetFilters:
             else:
                 alg.ThresholdByUpper(value)
         # Run the threshold
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def threshold_percent(dataset, percent=0.50, scalars=None, invert=False,
@@ -905,7 +905,7 @@ class DataSetFilters:
         alg = _vtk.vtkOutlineFilter()
         alg.SetInputDataObject(dataset)
         alg.SetGenerateFaces(generate_faces)
-        alg.Update()
+        _update_alg(alg)
         return wrap(alg.GetOutputDataObject(0))
 
     def outline_corners(dataset, factor=0.2):
@@ -931,7 +931,7 @@ class DataSetFilters:
         alg = _vtk.vtkOutlineCornerFilter()
         alg.SetInputDataObject(dataset)
         alg.SetCornerFactor(factor)
-        alg.Update()
+        _update_alg(alg)
         return wrap(alg.GetOutputDataObject(0))
 
     def extract_geometry(dataset):
@@ -969,7 +969,7 @@ class DataSetFilters:
         """
         alg = _vtk.vtkGeometryFilter()
         alg.SetInputDataObject(dataset)
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def extract_all_edges(dataset, progress_bar=False):
@@ -1260,7 +1260,7 @@ class DataSetFilters:
             alg.SetPoint1(point_u) # BOTTOM RIGHT CORNER
             alg.SetPoint2(point_v) # TOP LEFT CORNER
         alg.SetInputDataObject(dataset)
-        alg.Update()
+        _update_alg(alg)
         output = _get_output(alg)
         if not inplace:
             return output
@@ -1318,7 +1318,7 @@ class DataSetFilters:
             alg.SetCenter(center)
         alg.SetPreventSeam(prevent_seam)
         alg.SetInputDataObject(dataset)
-        alg.Update()
+        _update_alg(alg)
         output = _get_output(alg)
         if not inplace:
             return output
@@ -1396,7 +1396,7 @@ class DataSetFilters:
         alg = _vtk.vtkCellCenters()
         alg.SetInputDataObject(dataset)
         alg.SetVertexCells(vertex)
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def glyph(dataset, orient=True, scale=True, factor=1.0, geom=None,
@@ -1493,7 +1493,7 @@ class DataSetFilters:
         # Make glyphing geometry if necessary
         if geom is None:
             arrow = _vtk.vtkArrowSource()
-            arrow.Update()
+            _update_alg(arrow)
             geom = arrow.GetOutput()
         # Check if a table of geometries was passed
         if isinstance(geom, (np.ndarray, collections.abc.Sequence)):
@@ -1598,7 +1598,7 @@ class DataSetFilters:
         else:
             alg.SetExtractionModeToAllRegions()
         alg.SetColorRegions(True)
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def extract_largest(dataset, inplace=False):
@@ -1738,7 +1738,7 @@ class DataSetFilters:
         if normal is not None:
             alg.SetNormal(normal)
             alg.SetUseNormal(True)
-        alg.Update()
+        _update_alg(alg)
         output = _get_output(alg)
         if inplace:
             if isinstance(dataset, (_vtk.vtkImageData, _vtk.vtkRectilinearGrid)):
@@ -1809,7 +1809,7 @@ class DataSetFilters:
         alg.SetInputDataObject(dataset)
         alg.SetInputArrayToProcess(0, 0, 0, field.value, vectors)
         alg.SetScaleFactor(factor)
-        alg.Update()
+        _update_alg(alg)
         warped_mesh = _get_output(alg)
         if inplace:
             dataset.overwrite(warped_mesh)
@@ -1858,7 +1858,7 @@ class DataSetFilters:
         alg = _vtk.vtkCellDataToPointData()
         alg.SetInputDataObject(dataset)
         alg.SetPassCellData(pass_cell_data)
-        alg.Update()
+        _update_alg(alg)
         active_scalars = None
         if not isinstance(dataset, pyvista.MultiBlock):
             active_scalars = dataset.active_scalars_name
@@ -1917,7 +1917,7 @@ class DataSetFilters:
         alg = _vtk.vtkPointDataToCellData()
         alg.SetInputDataObject(dataset)
         alg.SetPassPointData(pass_point_data)
-        alg.Update()
+        _update_alg(alg)
         active_scalars = None
         if not isinstance(dataset, pyvista.MultiBlock):
             active_scalars = dataset.active_scalars_name
@@ -1968,7 +1968,7 @@ class DataSetFilters:
         """
         alg = _vtk.vtkDataSetTriangleFilter()
         alg.SetInputData(dataset)
-        alg.Update()
+        _update_alg(alg)
 
         mesh = _get_output(alg)
         if inplace:
@@ -2102,7 +2102,7 @@ class DataSetFilters:
         alg.SetSurfaceData(surface)
         alg.SetTolerance(tolerance)
         alg.SetInsideOut(inside_out)
-        alg.Update()
+        _update_alg(alg)
         result = _get_output(alg)
         out = dataset.copy()
         bools = result['SelectedPoints'].astype(np.uint8)
@@ -2171,7 +2171,7 @@ class DataSetFilters:
         if tolerance is not None:
             alg.SetComputeTolerance(False)
             alg.SetTolerance(tolerance)
-        alg.Update()  # Perform the resampling
+        _update_alg(alg)  # Perform the resampling
         return _get_output(alg)
 
     def sample(dataset, target, tolerance=None, pass_cell_arrays=True,
@@ -2235,7 +2235,7 @@ class DataSetFilters:
         if tolerance is not None:
             alg.SetComputeTolerance(False)
             alg.SetTolerance(tolerance)
-        alg.Update() # Perform the resampling
+        _update_alg(alg) # Perform the resampling
         return _get_output(alg)
 
     def interpolate(dataset, target, sharpness=2, radius=1.0,
@@ -2450,7 +2450,7 @@ class DataSetFilters:
             source.SetCenter(source_center)
             source.SetRadius(source_radius)
             source.SetNumberOfPoints(n_points)
-        source.Update()
+        _update_alg(source)
         input_source = pyvista.wrap(source.GetOutput())
         output = dataset.streamlines_from_source(input_source, vectors, **kwargs)
         if return_source:
@@ -2620,7 +2620,7 @@ class DataSetFilters:
         else:
             alg.SetInterpolatorTypeToDataSetPointLocator()
         # run the algorithm
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def streamlines_evenly_spaced_2D(dataset, vectors=None, start_position=None,
@@ -2775,7 +2775,7 @@ class DataSetFilters:
             alg.SetInterpolatorTypeToDataSetPointLocator()
 
         # Run the algorithm
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def decimate_boundary(dataset, target_reduction=0.5):
@@ -3334,7 +3334,7 @@ class DataSetFilters:
         extract_sel = _vtk.vtkExtractSelection()
         extract_sel.SetInputData(0, dataset)
         extract_sel.SetInputData(1, selection)
-        extract_sel.Update()
+        _update_alg(extract_sel)
         subgrid = _get_output(extract_sel)
 
         # extracts only in float32
@@ -3401,7 +3401,7 @@ class DataSetFilters:
         extract_sel = _vtk.vtkExtractSelection()
         extract_sel.SetInputData(0, dataset)
         extract_sel.SetInputData(1, selection)
-        extract_sel.Update()
+        _update_alg(extract_sel)
         return _get_output(extract_sel)
 
     def extract_surface(dataset, pass_pointid=True, pass_cellid=True,
@@ -3465,7 +3465,7 @@ class DataSetFilters:
         # available in 9.0.2
         # surf_filter.SetDelegation(delegation)
 
-        surf_filter.Update()
+        _update_alg(surf_filter)
         return _get_output(surf_filter)
 
     def surface_indices(dataset):
@@ -3555,7 +3555,7 @@ class DataSetFilters:
         featureEdges.SetBoundaryEdges(boundary_edges)
         featureEdges.SetFeatureEdges(feature_edges)
         featureEdges.SetColoring(False)
-        featureEdges.Update()
+        _update_alg(featureEdges)
         return _get_output(featureEdges)
 
     def merge(dataset, grid=None, merge_points=True, inplace=False,
@@ -3628,7 +3628,7 @@ class DataSetFilters:
         if main_has_priority:
             append_filter.AddInputData(dataset)
 
-        append_filter.Update()
+        _update_alg(append_filter)
         merged = _get_output(append_filter)
         if inplace:
             if type(dataset) == type(merged):
@@ -3755,7 +3755,7 @@ class DataSetFilters:
             raise KeyError(f'Cell quality type ({quality_measure}) not available. Options are: {options}')
         alg.SetInputData(dataset)
         alg.SetUndefinedQuality(null_value)
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def compute_derivative(dataset, scalars=None, gradient=True,
@@ -3866,7 +3866,7 @@ class DataSetFilters:
         # args: (idx, port, connection, field, name)
         alg.SetInputArrayToProcess(0, 0, 0, field.value, scalars)
         alg.SetInputData(dataset)
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def shrink(dataset, shrink_factor=1.0, progress_bar=False):
@@ -3991,7 +3991,7 @@ class DataSetFilters:
                 raise VTKVersionError('The installed version of VTK does not support '
                                       'transformation of all input vectors.')
 
-        f.Update()
+        _update_alg(f)
         res = pyvista.core.filters._get_output(f)
 
         # make the previously active scalars active again
@@ -1,5 +1,6 @@
 """Filters module with a class to manage filters/algorithms for polydata datasets."""
 import collections.abc
+import importlib.util
 import logging
 
 import numpy as np
@@ -53,7 +54,7 @@ class PolyDataFilters(DataSetFilters):
         featureEdges.NonManifoldEdgesOff()
         featureEdges.ManifoldEdgesOff()
         featureEdges.SetFeatureAngle(angle)
-        featureEdges.Update()
+        _update_alg(featureEdges)
         edges = _get_output(featureEdges)
         orig_id = pyvista.point_array(edges, 'point_ind')
 
@@ -80,7 +81,7 @@ class PolyDataFilters(DataSetFilters):
         bfilter.SetInputData(1, other_mesh)
         bfilter.ReorientDifferenceCellsOn()  # this is already default
         bfilter.SetTolerance(tolerance)
-        bfilter.Update()
+        _update_alg(bfilter)
 
         return _get_output(bfilter)
 
@@ -356,7 +357,7 @@ class PolyDataFilters(DataSetFilters):
             for data in dataset:
                 append_filter.AddInputData(data)
 
-        append_filter.Update()
+        _update_alg(append_filter)
         merged = _get_output(append_filter)
         if merge_points:
             merged = merged.clean(lines_to_points=False, polys_to_lines=False,
@@ -435,7 +436,7 @@ class PolyDataFilters(DataSetFilters):
         intfilter.SetComputeIntersectionPointArray(True)
         intfilter.SetSplitFirstOutput(split_first)
         intfilter.SetSplitSecondOutput(split_second)
-        intfilter.Update()
+        _update_alg(intfilter)
 
         intersection = _get_output(intfilter, oport=0)
         first = _get_output(intfilter, oport=1)
@@ -495,7 +496,7 @@ class PolyDataFilters(DataSetFilters):
         else:
             raise ValueError('``curv_type`` must be either "Mean", '
                              '"Gaussian", "Maximum", or "Minimum".')
-        curvefilter.Update()
+        _update_alg(curvefilter)
 
         # Compute and return curvature
         curv = _get_output(curvefilter)
@@ -577,7 +578,7 @@ class PolyDataFilters(DataSetFilters):
         trifilter.SetInputData(poly_data)
         trifilter.PassVertsOff()
         trifilter.PassLinesOff()
-        trifilter.Update()
+        _update_alg(trifilter)
 
         mesh = _get_output(trifilter)
         if inplace:
@@ -654,7 +655,7 @@ class PolyDataFilters(DataSetFilters):
         alg.SetEdgeAngle(edge_angle)
         alg.SetBoundarySmoothing(boundary_smoothing)
         alg.SetRelaxationFactor(relaxation_factor)
-        alg.Update()
+        _update_alg(alg)
 
         mesh = _get_output(alg)
         if inplace:
@@ -742,7 +743,7 @@ class PolyDataFilters(DataSetFilters):
         alg.SetSplitting(splitting)
         alg.SetSplitAngle(split_angle)
         alg.SetPreSplitMesh(pre_split_mesh)
-        alg.Update()
+        _update_alg(alg)
 
         mesh = _get_output(alg)
         if inplace:
@@ -827,7 +828,7 @@ class PolyDataFilters(DataSetFilters):
             tube.SetInputArrayToProcess(0, 0, 0, field.value, scalars)
             tube.SetVaryRadiusToVaryRadiusByScalar()
         # Apply the filter
-        tube.Update()
+        _update_alg(tube)
 
         mesh = _get_output(tube)
         if inplace:
@@ -919,7 +920,7 @@ class PolyDataFilters(DataSetFilters):
         # Subdivide
         sfilter.SetNumberOfSubdivisions(nsub)
         sfilter.SetInputData(poly_data)
-        sfilter.Update()
+        _update_alg(sfilter)
 
         submesh = _get_output(sfilter)
         if inplace:
@@ -1010,7 +1011,7 @@ class PolyDataFilters(DataSetFilters):
             sfilter.SetMaximumNumberOfPasses(max_n_passes)
 
         sfilter.SetInputData(poly_data)
-        sfilter.Update()
+        _update_alg(sfilter)
         submesh = _get_output(sfilter)
 
         if inplace:
@@ -1265,7 +1266,7 @@ class PolyDataFilters(DataSetFilters):
         normal.SetNonManifoldTraversal(non_manifold_traversal)
         normal.SetFeatureAngle(feature_angle)
         normal.SetInputData(poly_data)
-        normal.Update()
+        _update_alg(normal)
 
         mesh = _get_output(normal)
         if point_normals:
@@ -1359,7 +1360,7 @@ class PolyDataFilters(DataSetFilters):
         alg.SetInputDataObject(poly_data)
         alg.SetTolerance(tolerance)
         alg.SetClippingPlanes(collection)
-        alg.Update()  # Perform the Cut
+        _update_alg(alg)  # Perform the Cut
         result = _get_output(alg)
 
         if inplace:
@@ -1574,7 +1575,7 @@ class PolyDataFilters(DataSetFilters):
         dijkstra.SetInputData(poly_data)
         dijkstra.SetStartVertex(start_vertex)
         dijkstra.SetEndVertex(end_vertex)
-        dijkstra.Update()
+        _update_alg(dijkstra)
         original_ids = vtk_id_list_to_array(dijkstra.GetIdList())
 
         output = _get_output(dijkstra)
@@ -1714,19 +1715,27 @@ class PolyDataFilters(DataSetFilters):
 
         return intersection_points, intersection_cells
 
-    def multi_ray_trace(poly_data, origins, directions, first_point=False, retry=False):
+    def multi_ray_trace(poly_data, origins, directions, first_point=False, retry=False,
+                        engine=None):
         """Perform multiple ray trace calculations.
 
-        This requires a mesh with only triangular faces, an array of
-        origin points and an equal sized array of direction vectors to
-        trace along.
+        This requires an array of origin points and an equal sized
+        array of direction vectors to trace along.
 
-        The embree library used for vectorization of the ray traces is
-        known to occasionally return no intersections where the VTK
-        implementation would return an intersection.  If the result
-        appears to be missing some intersection points, set
-        ``retry=True`` to run a second pass over rays that returned no
-        intersections, using the VTK ``ray_trace`` implementation.
+        Two engines are available.  The ``'trimesh'`` engine uses the
+        embree library through ``trimesh`` and requires a mesh with
+        only triangular faces as well as the ``trimesh``, ``rtree``
+        and ``pyembree`` packages.  The ``'vtk'`` engine has no extra
+        requirements and casts the rays against the cached cell
+        locator of the mesh (see :func:`DataSet.build_locator
+        <pyvista.DataSet.build_locator>`).
+
+        The embree library is known to occasionally return no
+        intersections where the VTK implementation would return an
+        intersection.  If the result appears to be missing some
+        intersection points, set ``retry=True`` to run a second pass
+        over rays that returned no intersections, using the ``'vtk'``
+        engine.
 
         Parameters
         ----------
@@ -1740,7 +1749,13 @@ class PolyDataFilters(DataSetFilters):
             Returns intersection of first point only.
 
         retry : bool, optional
-            Will retry rays that return no intersections using the ray_trace
+            Will retry rays that return no intersections using the
+            ``'vtk'`` engine.  Only used by the ``'trimesh'`` engine.
+
+        engine : str, optional
+            Either ``'trimesh'`` or ``'vtk'``.  Defaults to
+            ``'trimesh'`` when ``trimesh``, ``rtree`` and ``pyembree``
+            are installed and ``'vtk'`` otherwise.
 
         Returns
         -------
@@ -1762,14 +1777,31 @@ class PolyDataFilters(DataSetFilters):
         directions ``[1, 0, 0]``, ``[0, 1, 0]`` and ``[0, 0, 1]``, and
         a sphere with radius 0.5 centered at the origin
 
-        >>> import pyvista as pv # doctest: +SKIP
-        >>> sphere = pv.Sphere() # doctest: +SKIP
-        >>> points, rays, cells = sphere.multi_ray_trace([[0, 0, 0]]*3, [[1, 0, 0], [0, 1, 0], [0, 0, 1]], first_point=True) # doctest: +SKIP
-        >>> string = ", ".join([f"({point[0]:.3f}, {point[1]:.3f}, {point[2]:.3f})" for point in points]) # doctest: +SKIP
-        >>> f'Rays intersected at {string}' # doctest: +SKIP
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere()
+        >>> points, rays, cells = sphere.multi_ray_trace([[0, 0, 0]]*3, [[1, 0, 0], [0, 1, 0], [0, 0, 1]], first_point=True, engine='vtk')
+        >>> string = ", ".join([f"({point[0]:.3f}, {point[1]:.3f}, {point[2]:.3f})" for point in points])
+        >>> f'Rays intersected at {string}'
         'Rays intersected at (0.499, 0.000, 0.000), (0.000, 0.497, 0.000), (0.000, 0.000, 0.500)'
 
         """
+        origins = np.asarray(origins, dtype=float)
+        directions = np.asarray(directions, dtype=float)
+        if origins.ndim != 2 or origins.shape[1] != 3 or origins.shape != directions.shape:
+            raise ValueError('``origins`` and ``directions`` must be arrays of the '
+                             'same shape (N, 3).')
+
+        if engine is None:
+            modules = ('trimesh', 'rtree', 'pyembree')
+            if all(importlib.util.find_spec(module) is not None for module in modules):
+                engine = 'trimesh'
+            else:
+                engine = 'vtk'
+        if engine == 'vtk':
+            return _multi_ray_trace_vtk(poly_data, origins, directions, first_point)
+        if engine != 'trimesh':
+            raise ValueError(f'Invalid engine "{engine}".  Must be "trimesh" or "vtk".')
+
         if not poly_data.is_all_triangles():
             raise NotAllTrianglesError
 
@@ -1781,43 +1813,27 @@ class PolyDataFilters(DataSetFilters):
                 "\tconda install trimesh rtree pyembree"
             )
 
-        origins = np.asarray(origins)
-        directions = np.asarray(directions)
         faces_as_array = poly_data.faces.reshape((poly_data.n_faces, 4))[:, 1:]
         tmesh = trimesh.Trimesh(poly_data.points, faces_as_array)
         locations, index_ray, index_tri = tmesh.ray.intersects_location(
             origins, directions, multiple_hits=not first_point
         )
         if retry:
-            # gather intersecting rays in lists
-            loc_lst, ray_lst, tri_lst = [arr.tolist() for arr in [locations, index_ray, index_tri]]
-
             # find indices that trimesh failed on
             all_ray_indices = np.arange(len(origins))
             retry_ray_indices = np.setdiff1d(all_ray_indices, index_ray, assume_unique=True)
 
-            # compute ray points for all failed rays at once
-            origins_retry = origins[retry_ray_indices, :]  # shape (n_retry, 3)
-            directions_retry = directions[retry_ray_indices, :]
-            unit_directions = directions_retry / np.linalg.norm(directions_retry,
-                                                                axis=1, keepdims=True)
-            second_points = origins_retry + unit_directions * poly_data.length  # shape (n_retry, 3)
-
-            for id_r, origin, second_point in zip(retry_ray_indices, origins_retry, second_points):
-                locs, indices = poly_data.ray_trace(origin, second_point, first_point=first_point)
-                if locs.any():
-                    if first_point:
-                        locs = locs.reshape([1, 3])
-                    ray_lst.extend([id_r] * indices.size)
-                    tri_lst.extend(indices)
-                    loc_lst.extend(locs)
+            # trace all failed rays at once
+            locs, rays, tris = _multi_ray_trace_vtk(poly_data, origins[retry_ray_indices],
+                                                    directions[retry_ray_indices],
+                                                    first_point)
 
             # sort result arrays by ray index
-            index_ray = np.array(ray_lst)
-            sorting_inds = index_ray.argsort()
+            index_ray = np.concatenate((index_ray, retry_ray_indices[rays]))
+            sorting_inds = index_ray.argsort(kind='stable')
             index_ray = index_ray[sorting_inds]
-            index_tri = np.array(tri_lst)[sorting_inds]
-            locations = np.array(loc_lst)[sorting_inds]
+            index_tri = np.concatenate((index_tri, tris))[sorting_inds]
+            locations = np.concatenate((np.reshape(locations, (-1, 3)), locs))[sorting_inds]
 
         return locations, index_ray, index_tri
 
@@ -2136,7 +2152,7 @@ class PolyDataFilters(DataSetFilters):
         """
         alg = _vtk.vtkAppendArcLength()
         alg.SetInputData(poly_data)
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def project_points_to_plane(poly_data, origin=None, normal=(0, 0, 1),
@@ -2266,7 +2282,7 @@ class PolyDataFilters(DataSetFilters):
                 alg.SetGenerateTCoordsToUseLength()
         else:
             alg.SetGenerateTCoordsToOff()
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def extrude(poly_data, vector, capping=False, inplace=False, progress_bar=False):
@@ -2506,5 +2522,52 @@ class PolyDataFilters(DataSetFilters):
         alg.SetPassCellDataAsFieldData(pass_cell_data)
         alg.SetPassThroughCellIds(pass_cell_ids)
         alg.SetPassThroughPointIds(pass_point_ids)
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
+
+
+def _multi_ray_trace_vtk(poly_data, origins, directions, first_point=False):
+    """Trace rays using the cached cell locator of a mesh.
+
+    Each ray is traced as a segment long enough to cross the whole
+    mesh.  Multiple hits are found by restarting the segment just
+    after the previous intersection, so intersections closer than a
+    millionth of the mesh length are reported once.
+
+    """
+    norm = np.linalg.norm(directions, axis=1, keepdims=True)
+    if np.any(norm == 0):
+        raise ValueError('``directions`` must not contain zero length vectors.')
+    unit_directions = directions / norm
+
+    # distance from each origin to the farthest corner of the bounds
+    corners = np.array(np.meshgrid(*np.reshape(poly_data.bounds, (3, 2)),
+                                   indexing='ij')).reshape(3, -1).T
+    lengths = np.linalg.norm(origins[:, np.newaxis] - corners, axis=-1).max(axis=1)
+    step = max(poly_data.length, np.finfo(float).eps) * 1e-6
+    end_points = origins + unit_directions * (lengths[:, np.newaxis] + step)
+
+    locations, index_ray, index_tri = [], [], []
+    if poly_data.n_cells:
+        locator = poly_data.build_locator('cell')
+        t = _vtk.reference(0.0)
+        x = [0.0, 0.0, 0.0]
+        pcoords = [0.0, 0.0, 0.0]
+        sub_id = _vtk.reference(0)
+        cell_id = _vtk.reference(0)
+        cell = _vtk.vtkGenericCell()
+        for i, (start, end_point, direction) in enumerate(zip(origins.tolist(),
+                                                              end_points.tolist(),
+                                                              unit_directions.tolist())):
+            while locator.IntersectWithLine(start, end_point, 0.0, t, x, pcoords,
+                                            sub_id, cell_id, cell):
+                locations.append(list(x))
+                index_ray.append(i)
+                index_tri.append(int(cell_id))
+                if first_point:
+                    break
+                start = [x[j] + direction[j] * step for j in range(3)]
+
+    return (np.array(locations, dtype=float).reshape(-1, 3),
+            np.array(index_ray, dtype=int),
+            np.array(index_tri, dtype=int))
@@ -3,7 +3,7 @@ import numpy as np
 
 import pyvista
 from pyvista import abstract_class, _vtk
-from pyvista.core.filters import _get_output
+from pyvista.core.filters import _get_output, _update_alg
 from pyvista.core.filters.data_set import DataSetFilters
 
 
@@ -67,7 +67,7 @@ class StructuredGridFilters(DataSetFilters):
         alg.SetInputDataObject(dataset)
         alg.SetSampleRate(rate)
         alg.SetIncludeBoundary(boundary)
-        alg.Update()
+        _update_alg(alg)
         return _get_output(alg)
 
     def concatenate(dataset, other, axis, tolerance=0.0):
@@ -89,7 +89,7 @@ class UniformGridFilters(DataSetFilters):
         alg.SetInputDataObject(dataset)
         alg.SetSampleRate(rate)
         alg.SetIncludeBoundary(boundary)
-        alg.Update()
+        _update_alg(alg)
         result = _get_output(alg)
         # Adjust for the confusing issue with the extents
         #   see https://gitlab.kitware.com/vtk/vtk/-/issues/17938
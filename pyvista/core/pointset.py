@@ -11,8 +11,9 @@ import numpy as np
 
 import pyvista
 from pyvista import _vtk
-from pyvista.utilities import abstract_class
+from pyvista.utilities import abstract_class, assert_empty_kwargs
 from pyvista.utilities.cells import (CellArray, numpy_to_idarr,
+                                     numpy_to_cell_array,
                                      generate_cell_offsets,
                                      create_mixed_cells,
                                      get_mixed_cells)
@@ -543,6 +544,17 @@ class UnstructuredGrid(_vtk.vtkUnstructuredGrid, PointGrid, UnstructuredGridFilt
     >>> # from arrays (vtk<9)
     >>> #grid = pyvista.UnstructuredGrid(offset, cells, celltypes, points)
 
+    From VTK 9 offset and connectivity arrays without copying
+
+    >>> import numpy as np
+    >>> points = np.random.random((4, 3))
+    >>> grid = pyvista.UnstructuredGrid(offsets=np.array([0, 4]),
+    ...                                 connectivity=np.array([0, 1, 2, 3]),
+    ...                                 celltypes=np.array([vtk.VTK_TETRA], np.uint8),
+    ...                                 points=points)
+    >>> grid.n_cells
+    1
+
     From a string filename
 
     >>> grid = pyvista.UnstructuredGrid(examples.hexbeamfile)
@@ -557,6 +569,22 @@ class UnstructuredGrid(_vtk.vtkUnstructuredGrid, PointGrid, UnstructuredGridFilt
         super().__init__()
         deep = kwargs.pop('deep', False)
 
+        if 'connectivity' in kwargs:
+            if args:
+                raise TypeError('Initialization from ``connectivity`` does not '
+                                'accept positional arguments')
+            try:
+                offsets, connectivity, celltypes, points = [
+                    kwargs.pop(key) for key in ('offsets', 'connectivity', 'celltypes', 'points')]
+            except KeyError:
+                raise TypeError('Initialization from ``connectivity`` requires the '
+                                '`offsets`, `connectivity`, `celltypes` and '
+                                '`points` keyword arguments') from None
+            assert_empty_kwargs(**kwargs)
+            self._from_offsets_connectivity(offsets, connectivity, celltypes, points, deep=deep)
+            self._check_for_consistency()
+            return
+
         if not len(args):
             return
         if len(args) == 1:
@@ -710,6 +738,54 @@ class UnstructuredGrid(_vtk.vtkUnstructuredGrid, PointGrid, UnstructuredGridFilt
 
             self.SetCells(cell_type, numpy_to_idarr(offset), vtkcells)
 
+    def _from_offsets_connectivity(self, offsets, connectivity, celltypes, points,
+                                   deep=False):
+        """Create VTK unstructured grid from VTK 9 offsets and connectivity arrays.
+
+        The arrays are wrapped without copying when ``deep=False`` and
+        their dtypes already match the ones used by VTK:
+        ``pyvista.ID_TYPE`` for ``offsets`` and ``connectivity`` and
+        ``np.uint8`` for ``celltypes``.
+
+        Parameters
+        ----------
+        offsets : np.ndarray
+            Offsets of each cell within ``connectivity`` followed by
+            the length of ``connectivity``.
+
+        connectivity : np.ndarray
+            Point ids of all cells.
+
+        celltypes : np.ndarray
+            Cell types of each cell.
+
+        points : np.ndarray
+            Numpy array containing point locations.
+
+        deep : bool, optional
+            Copy the arrays instead of wrapping them.
+
+        """
+        if not _vtk.VTK9:
+            raise AttributeError('VTK 9 or higher is required')
+        offsets = np.asarray(offsets)
+        connectivity = np.asarray(connectivity)
+        if offsets.ndim != 1 or not offsets.size or offsets[0] != 0 \
+           or offsets[-1] != connectivity.size:
+            raise ValueError('``offsets`` must start with 0 and end with the length '
+                             'of ``connectivity``.')
+        if np.any(offsets[1:] < offsets[:-1]):
+            raise ValueError('``offsets`` must be monotonically increasing.')
+
+        vtkcells = numpy_to_cell_array(offsets, connectivity, deep=deep)
+        celltypes = np.asarray(celltypes)
+        if celltypes.dtype != np.uint8:
+            celltypes = celltypes.astype(np.uint8)
+        vtk_celltypes = _vtk.numpy_to_vtk(np.ascontiguousarray(celltypes), deep=deep)
+
+        self.SetPoints(pyvista.vtk_points(points, deep=deep))
+        self.SetCells(vtk_celltypes, vtkcells)
+
     def _check_for_consistency(self):
         """Check if size of offsets and celltypes match the number of cells.
 
@@ -733,7 +809,11 @@ class UnstructuredGrid(_vtk.vtkUnstructuredGrid, PointGrid, UnstructuredGridFilt
 
     @property
     def cells(self):
-        """Legacy method: Return a pointer to the cells as a numpy object."""
+        """Legacy method: Return a pointer to the cells as a numpy object.
+
+        With VTK 9 this array is created from :attr:`offset` and
+        :attr:`cell_connectivity` on each access, so prefer those.
+        """
         return _vtk.vtk_to_numpy(self.GetCells().GetData())
 
     @property
@@ -754,7 +834,10 @@ class UnstructuredGrid(_vtk.vtkUnstructuredGrid, PointGrid, UnstructuredGridFilt
 
     @property
     def cell_connectivity(self):
-        """Return a the vtk cell connectivity as a numpy array."""
+        """Return a the vtk cell connectivity as a numpy array.
+
+        The array shares memory with the grid.
+        """
         carr = self.GetCells()
         if _vtk.VTK9:
             return _vtk.vtk_to_numpy(carr.GetConnectivityArray())
@@ -845,7 +928,12 @@ class UnstructuredGrid(_vtk.vtkUnstructuredGrid, PointGrid, UnstructuredGridFilt
 
     @property
     def offset(self):
-        """Get cell locations Array."""
+        """Get cell locations Array.
+
+        With VTK 9 these are the offsets of each cell within
+        :attr:`cell_connectivity` followed by its length.  The array
+        shares memory with the grid.
+        """
         carr = self.GetCells()
         if _vtk.VTK9:
             # This will be the number of cells + 1.
@@ -1,7 +1,8 @@
 """Support for the ipygany plotter."""
 
-from array import array
+from typing import Any
 import warnings
+import weakref
 
 import numpy as np
 from IPython import display
@@ -20,18 +21,127 @@ except ImportError:  # pragma: no cover
     raise ImportError('Install ``ipywidgets`` to use this feature.')
 
 
-from ipygany.vtk_loader import get_ugrid_data
-from ipygany.ipygany import _grid_data_to_data_widget
 from ipygany import Scene, PolyMesh, Component, IsoColor, PointCloud
 from ipygany.colormaps import colormaps
 
 import pyvista as pv
+from pyvista import _vtk
 
+# triangulated surfaces of the converted meshes, see ``_triangulated_surface``
+_SURFACE_CACHE: 'weakref.WeakKeyDictionary[Any, tuple]' = weakref.WeakKeyDictionary()
 
-def pyvista_polydata_to_polymesh(obj):
+
+def _triangulated_surface(mesh, max_triangles=None):
+    """Return the triangulated surface of a mesh with point data only.
+
+    The surface is cached until the mesh is modified.
+    """
+    mtime = mesh.GetMTime()
+    cached = _SURFACE_CACHE.get(mesh)
+    if cached is not None and cached[:2] == (mtime, max_triangles):
+        return cached[2]
+
+    # PolyMesh requires vertices and triangles, so we need to
+    # convert the mesh to an all triangle polydata
+    if not isinstance(mesh, pv.PolyData):
+        # unlikely case that mesh does not have extract_surface
+        if not hasattr(mesh, 'extract_surface'):  # pragma: no cover
+            mesh = mesh.cast_to_unstructured_grid()
+        surf = mesh.extract_surface()
+    else:
+        surf = mesh
+
+    # convert to an all-triangular surface
+    if surf.is_all_triangles():
+        trimesh = surf
+    else:
+        trimesh = surf.triangulate()
+
+    # ipygany only supports data at the vertices
+    if trimesh.GetCellData().GetNumberOfArrays():
+        trimesh = trimesh.cell_data_to_point_data()
+
+    # decimation keeps the point data of the remaining points
+    if max_triangles is not None and trimesh.n_faces > max_triangles:
+        trimesh = trimesh.decimate_pro(1 - max_triangles / trimesh.n_faces)
+
+    # caching the mesh itself would keep it alive forever
+    if trimesh is not mesh:
+        _SURFACE_CACHE[mesh] = (mtime, max_triangles, trimesh)
+    return trimesh
+
+
+def _triangle_indices(trimesh):
+    """Return the triangles of an all-triangle surface as a uint32 array."""
+    polys = trimesh.GetPolys()
+    if hasattr(polys, 'GetConnectivityArray'):
+        # VTK9 stores the connectivity without the cell sizes
+        triangles = _vtk.vtk_to_numpy(polys.GetConnectivityArray())
+    else:  # pragma: no cover
+        triangles = trimesh.faces.reshape(-1, 4)[:, 1:]
+    return triangles.astype(np.uint32).reshape(-1, 3)
+
+
+def _data_buffers(mesh, arrays='active'):
+    """Return the point arrays of a mesh as float32 component buffers.
+
+    Returns a dictionary mapping each array name to one contiguous
+    buffer per component.  Arrays that are not numeric are skipped.
+    """
+    if isinstance(arrays, str):
+        if arrays == 'all':
+            names = mesh.point_arrays.keys()
+        elif arrays == 'active':
+            names = [mesh.active_scalars_name]
+        else:
+            raise ValueError(f'Invalid arrays "{arrays}".  Should be "active", "all" '
+                             'or a sequence of array names.')
+    else:
+        names = arrays
+
+    buffers = {}
+    for name in names:
+        if name is None or name not in mesh.point_arrays:
+            continue
+        values = np.asarray(mesh.point_arrays[name])
+        if not np.issubdtype(values.dtype, np.number):
+            continue
+        values = values.reshape(mesh.n_points, -1)
+        # copy, as buffers must not change with the mesh once sent
+        buffers[name] = [np.array(values[:, i], dtype=np.float32)
+                         for i in range(values.shape[1])]
+    return buffers
+
+
+def _data_widgets(buffers):
+    """Convert the buffers of ``_data_buffers`` to ``ipygany.Data`` widgets."""
+    return [ipygany.Data(name, [Component(f'X{i + 1}', values)
+                                for i, values in enumerate(components)])
+            for name, components in buffers.items()]
+
+
+def _block_buffers(mesh, points_only=False, arrays='active', max_triangles=None):
+    """Return the vertices, triangles and data buffers of a block.
+
+    The triangles are ``None`` for point clouds.
+    """
+    if points_only:
+        triangles = None
+    else:
+        mesh = _triangulated_surface(mesh, max_triangles)
+        triangles = _triangle_indices(mesh).ravel()
+    return {'vertices': np.array(mesh.points, dtype=np.float32).ravel(),
+            'triangles': triangles,
+            'data': _data_buffers(mesh, arrays)}
+
+
+def pyvista_polydata_to_polymesh(obj, arrays='active', max_triangles=None):
     """Import a mesh from ``pyvista`` or ``vtk``.
 
-    Copies over the active scalars and only the active scalars.
+    The vertices, triangles and point arrays are passed to ``ipygany``
+    as contiguous float32 and uint32 buffers.  Cell arrays are
+    converted to point arrays.  The triangulated surface is cached and
+    reused until the mesh is modified.
 
     Parameters
     ----------
@@ -39,6 +149,15 @@ def pyvista_polydata_to_polymesh(obj):
         Any object compatible with pyvista.  Includes most ``vtk``
         objects.
 
+    arrays : str or sequence of str, optional
+        Arrays to copy.  ``'active'`` copies only the active scalars,
+        ``'all'`` copies every numeric array, or give the names of the
+        arrays to copy.  Default ``'active'``.
+
+    max_triangles : int, optional
+        Maximum number of triangles.  Larger surfaces are decimated
+        down to this budget before being sent to ``ipygany``.
+
     Returns
     -------
     PolyMesh
@@ -53,47 +172,22 @@ def pyvista_polydata_to_polymesh(obj):
     else:
         mesh = obj
 
-    # PolyMesh requires vertices and triangles, so we need to
-    # convert the mesh to an all triangle polydata
-    if not isinstance(obj, pv.PolyData):
-        # unlikely case that mesh does not have extract_surface
-        if not hasattr(mesh, 'extract_surface'):  # pragma: no cover
-            mesh = mesh.cast_to_unstructured_grid()
-        surf = mesh.extract_surface()
-    else:
-        surf = mesh
-
-    # convert to an all-triangular surface
-    if surf.is_all_triangles():
-        trimesh = surf
-    else:
-        trimesh = surf.triangulate()
-
-    # finally, pass the triangle vertices to PolyMesh
-    triangle_indices = trimesh.faces.reshape(-1, 4)[:, 1:]
-
-    if not triangle_indices.size:
+    buffers = _block_buffers(mesh, arrays=arrays, max_triangles=max_triangles)
+    if not buffers['triangles'].size:
         warnings.warn('Unable to convert mesh to triangular PolyMesh')
 
-    # only copy active scalars
-    data = []
-    if trimesh.active_scalars is not None:
-        arr = array('f', trimesh.active_scalars)
-        components = [ipygany.Component('X1', arr)]
-        data = [ipygany.Data(trimesh.active_scalars_name, components)]
-
-    # for speed, only convert the active scalars later
     return PolyMesh(
-        vertices=trimesh.points,
-        triangle_indices=triangle_indices,
-        data=data
+        vertices=buffers['vertices'],
+        triangle_indices=buffers['triangles'],
+        data=_data_widgets(buffers['data'])
     )
 
 
-def pyvista_object_to_pointcloud(pv_object):
+def pyvista_object_to_pointcloud(pv_object, arrays='all'):
     """Convert any pyvista object into a ``ipygany.PointCloud``."""
-    pc = PointCloud(vertices=pv_object.points,
-                    data=_grid_data_to_data_widget(get_ugrid_data(pv_object)))
+    buffers = _block_buffers(pv_object, points_only=True, arrays=arrays)
+    pc = PointCloud(vertices=buffers['vertices'],
+                    data=_data_widgets(buffers['data']))
     return pc
 
 
@@ -121,8 +215,13 @@ def check_colormap(cmap):
     return cmap
 
 
-def ipygany_block_from_actor(actor):
-    """Convert a vtk actor to a ipygany Block."""
+def _actor_block(actor, max_triangles=None):
+    """Convert a vtk actor to ipygany widgets.
+
+    Returns ``None`` when the actor cannot be converted.  Otherwise,
+    returns the widget to show, which may be an ``IsoColor`` effect,
+    the underlying block and the buffers sent for it.
+    """
     mapper = actor.GetMapper()
     if mapper is None:
         return
@@ -137,28 +236,204 @@ def ipygany_block_from_actor(actor):
             rep_type = 'Points'
 
     if rep_type == 'Points':
-        pmesh = pyvista_object_to_pointcloud(dataset)
+        buffers = _block_buffers(dataset, points_only=True, arrays='all')
+        pmesh = PointCloud(vertices=buffers['vertices'],
+                           data=_data_widgets(buffers['data']))
     elif rep_type == 'Wireframe':
         warnings.warn('Wireframe style is not supported in ipygany')
         return
     else:
-        pmesh = pyvista_polydata_to_polymesh(dataset)
+        buffers = _block_buffers(dataset, max_triangles=max_triangles)
+        if not buffers['triangles'].size:
+            warnings.warn('Unable to convert mesh to triangular PolyMesh')
+        pmesh = PolyMesh(vertices=buffers['vertices'],
+                         triangle_indices=buffers['triangles'],
+                         data=_data_widgets(buffers['data']))
     pmesh.default_color = color_float_to_hex(*prop.GetColor())
 
     # determine if there are active scalars
     valid_mode = mapper.GetScalarModeAsString() in ['UsePointData', 'UseCellData']
     if valid_mode:
         # verify dataset is in pmesh
-        names = [dataset.name for dataset in pmesh.data]
-        if dataset.active_scalars_name in names:
+        if dataset.active_scalars_name in buffers['data']:
             mn, mx = mapper.GetScalarRange()
             cmesh = IsoColor(pmesh, input=dataset.active_scalars_name, min=mn, max=mx)
             if hasattr(mapper, 'cmap'):
                 cmap = check_colormap(mapper.cmap)
                 cmesh.colormap = colormaps[cmap]
-            return cmesh
+            return cmesh, pmesh, buffers
+
+    return pmesh, pmesh, buffers
+
+
+def ipygany_block_from_actor(actor, max_triangles=None):
+    """Convert a vtk actor to a ipygany Block.
+
+    Surfaces with more than ``max_triangles`` triangles are decimated.
+    """
+    block = _actor_block(actor, max_triangles)
+    if block is not None:
+        return block[0]
+
+
+class _SyncedBlock:
+    """Widgets of an actor along with the buffers last sent for them."""
+
+    def __init__(self, actor, max_triangles):
+        self.actor = actor
+        self.max_triangles = max_triangles
+        self.state = self._state()
+        block = _actor_block(actor, max_triangles)
+        self.widget, self.block, self.buffers = (None, None, None) if block is None else block
+
+    def _state(self):
+        """Return the dataset, representation and modification time of the actor."""
+        mapper = self.actor.GetMapper()
+        if mapper is None:
+            return None, None, None
+        dataset = mapper.GetInputAsDataSet()
+        return dataset, self.actor.GetProperty().GetRepresentation(), dataset.GetMTime()
+
+    @property
+    def n_buffers(self):
+        """Return the number of buffers of the block."""
+        if self.buffers is None:
+            return 0
+        n_buffers = 1 if self.buffers['triangles'] is None else 2
+        return n_buffers + sum(len(components) for components in self.buffers['data'].values())
+
+    def sync(self):
+        """Send the buffers that changed since the last synchronization.
+
+        Returns the number of buffers sent, or ``None`` when the block
+        must be rebuilt.
+        """
+        state = self._state()
+        # datasets compare their contents with ``==``
+        if state[0] is not self.state[0] or state[1] != self.state[1]:
+            return
+        if state[2] == self.state[2]:
+            return 0
+        self.state = state
+        if self.block is None:
+            return
+
+        points_only = self.buffers['triangles'] is None
+        buffers = _block_buffers(state[0], points_only=points_only,
+                                 arrays='all' if points_only else 'active',
+                                 max_triangles=self.max_triangles)
+        layout = {name: len(components) for name, components in buffers['data'].items()}
+        old_layout = {name: len(components) for name, components in self.buffers['data'].items()}
+        if layout != old_layout:
+            return
+
+        n_sent = 0
+        with self.block.hold_sync():
+            if not points_only and not np.array_equal(buffers['triangles'],
+                                                      self.buffers['triangles']):
+                self.block.triangle_indices = buffers['triangles']
+                n_sent += 1
+            if not np.array_equal(buffers['vertices'], self.buffers['vertices']):
+                self.block.vertices = buffers['vertices']
+                n_sent += 1
+            for name, components in buffers['data'].items():
+                for i, values in enumerate(components):
+                    if not np.array_equal(values, self.buffers['data'][name][i]):
+                        self.block[name, f'X{i + 1}'].array = values
+                        n_sent += 1
+
+        if isinstance(self.widget, IsoColor):
+            self.widget.min, self.widget.max = self.actor.GetMapper().GetScalarRange()
+        self.buffers = buffers
+        return n_sent
+
+
+class IpyganySession:
+    """Persistent ``ipygany`` scene of a plotter.
+
+    The scene is built once and kept in sync with the plotter by
+    :func:`IpyganySession.update`.  Meshes modified since the last
+    update are converted again and compared with the buffers
+    previously sent, and only the vertices, triangles or array
+    components that changed are sent to the notebook, as binary
+    buffers.
+
+    Showing a plotter with the ``'ipygany'`` jupyter backend creates
+    its session, which is then updated on each render, for example by
+    :func:`pyvista.BasePlotter.update_scalars`, and reused when the
+    plotter is shown again.
+
+    Parameters
+    ----------
+    plotter : pyvista.BasePlotter
+        Plotter to show.
+
+    max_triangles : int, optional
+        Maximum number of triangles of each surface.  Larger surfaces
+        are decimated.
+
+    Examples
+    --------
+    Only the updated scalars are sent to the notebook.
 
-    return pmesh
+    >>> import pyvista as pv
+    >>> mesh = pv.Sphere()
+    >>> mesh['height'] = mesh.points[:, 2]
+    >>> pl = pv.Plotter(notebook=True)
+    >>> _ = pl.add_mesh(mesh, scalars='height')
+    >>> scene = pl.show(jupyter_backend='ipygany', return_viewer=True)  # doctest:+SKIP
+    >>> pl.update_scalars(-mesh.points[:, 2], mesh=mesh)  # doctest:+SKIP
+
+    """
+
+    def __init__(self, plotter, max_triangles=None):
+        """Initialize the session."""
+        self._plotter = plotter
+        self._max_triangles = max_triangles
+        self._blocks = {}
+        self._scene = Scene([])
+        self.update()
+
+    @property
+    def scene(self):
+        """Return the ``ipygany.Scene`` of the session."""
+        return self._scene
+
+    @property
+    def max_triangles(self):
+        """Return the maximum number of triangles of each surface."""
+        return self._max_triangles
+
+    def update(self):
+        """Send the changes of the plotter to the notebook.
+
+        Returns
+        -------
+        int
+            Number of vertex, triangle and array component buffers
+            sent.
+
+        """
+        n_sent = 0
+        blocks = {}
+        for name, actor in self._plotter.renderer._actors.items():
+            block = self._blocks.get(name)
+            n_block = None
+            if block is not None and block.actor is actor:
+                n_block = block.sync()
+            if n_block is None:
+                block = _SyncedBlock(actor, self._max_triangles)
+                n_block = block.n_buffers
+            n_sent += n_block
+            blocks[name] = block
+        self._blocks = blocks
+
+        # traits only sync when their value changes
+        self._scene.children = [block.widget for block in blocks.values()
+                                if block.widget is not None]
+        self._scene.background_color = color_float_to_hex(*self._plotter.background_color)
+        self._scene.camera = ipygany_camera_from_plotter(self._plotter)
+        return n_sent
 
 
 def ipygany_camera_from_plotter(plotter):
@@ -174,20 +449,22 @@ def ipygany_camera_from_plotter(plotter):
             'up': up}
 
 
-def show_ipygany(plotter, return_viewer, height=None, width=None):
-    """Show an ipygany scene."""
-    # convert each mesh in the plotter to an ipygany scene
-    actors = plotter.renderer._actors
-    meshes = []
-    for actor in actors.values():
-        ipygany_obj = ipygany_block_from_actor(actor)
-        if ipygany_obj is not None:
-            meshes.append(ipygany_obj)
-
-    bc_color = color_float_to_hex(*plotter.background_color)
-    scene = Scene(meshes,
-                  background_color=bc_color,
-                  camera=ipygany_camera_from_plotter(plotter))
+def show_ipygany(plotter, return_viewer, height=None, width=None,
+                 max_triangles=None):
+    """Show an ipygany scene.
+
+    Surfaces with more than ``max_triangles`` triangles are decimated
+    before being sent to the notebook.
+    """
+    # reuse the session of the plotter to only send what changed
+    session = plotter._jupyter_session
+    if isinstance(session, IpyganySession) and session.max_triangles == max_triangles:
+        session.update()
+    else:
+        session = IpyganySession(plotter, max_triangles)
+        plotter._jupyter_session = session
+    scene = session.scene
+    meshes = scene.children
 
     # optionally size of the plotter
     if height is not None:
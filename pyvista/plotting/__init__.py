@@ -15,6 +15,7 @@ from .widgets import WidgetHelper
 from .lights import Light
 from .camera import Camera
 from .axes import Axes
+from .composite import CompositeAttributes
 
 
 class QtDeprecationError(Exception):
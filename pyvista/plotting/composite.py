@@ -0,0 +1,196 @@
+"""Render composite datasets through a single actor."""
+import pyvista
+from pyvista import _vtk
+from .tools import parse_color
+
+
+def _iter_leaves(dataset):
+    """Yield the datasets of a composite dataset, depth first."""
+    for i in range(dataset.GetNumberOfBlocks()):
+        block = dataset.GetBlock(i)
+        if isinstance(block, _vtk.vtkMultiBlockDataSet):
+            yield from _iter_leaves(block)
+        elif block is not None:
+            yield block
+
+
+def composite_surface(dataset):
+    """Return a composite dataset made only of ``vtkPolyData`` blocks.
+
+    ``vtkCompositePolyDataMapper2`` only renders polydata.  Composite
+    datasets already made of polydata are returned as is, otherwise
+    the surfaces of all blocks are extracted at once, keeping the
+    structure and the names of the blocks.
+
+    """
+    if all(isinstance(block, _vtk.vtkPolyData) for block in _iter_leaves(dataset)):
+        return dataset
+    alg = _vtk.vtkDataSetSurfaceFilter()
+    alg.SetInputData(dataset)
+    alg.Update()
+    return pyvista.wrap(alg.GetOutputDataObject(0))
+
+
+class CompositeAttributes:
+    """Display attributes of the blocks of a composite actor.
+
+    Blocks of a ``MultiBlock`` added with ``add_mesh(...,
+    composite=True)`` are all rendered by a single actor.  Their
+    color, opacity and visibility can be changed without rebuilding
+    the actor.  Attributes of a nested ``MultiBlock`` apply to all of
+    its blocks.
+
+    Blocks are given by their index or name in the top-level
+    ``MultiBlock``, or by a tuple of indices and names for nested
+    blocks, e.g. ``('assembly', 2)``.
+
+    Parameters
+    ----------
+    actor : vtk.vtkActor
+        Actor returned by :func:`pyvista.BasePlotter.add_mesh` for a
+        ``MultiBlock`` added with ``composite=True``.
+
+    Examples
+    --------
+    Hide a block and color another one.
+
+    >>> import pyvista
+    >>> blocks = pyvista.MultiBlock({'sphere': pyvista.Sphere(),
+    ...                              'cube': pyvista.Cube()})
+    >>> pl = pyvista.Plotter()
+    >>> actor = pl.add_mesh(blocks, composite=True)
+    >>> attributes = pyvista.CompositeAttributes(actor)
+    >>> attributes.set_block_visibility('cube', False)
+    >>> attributes.set_block_color(0, 'red')
+    >>> attributes.block_visibility('cube')
+    False
+
+    """
+
+    def __init__(self, actor):
+        """Initialize the attributes of a composite actor."""
+        mapper = actor.GetMapper()
+        if not isinstance(mapper, _vtk.vtkCompositePolyDataMapper2):
+            raise TypeError('The actor does not render a composite dataset.  Add the '
+                            'MultiBlock with ``add_mesh(..., composite=True)``.')
+        self._mapper = mapper
+        self._attributes = mapper.GetCompositeDataDisplayAttributes()
+
+    @property
+    def dataset(self):
+        """Return the composite dataset rendered by the actor."""
+        return pyvista.wrap(self._mapper.GetInputDataObject(0, 0))
+
+    def _locate(self, block):
+        """Return the data object of a block."""
+        path = block if isinstance(block, tuple) else (block,)
+        if not path:
+            raise KeyError('Empty block path.')
+        data_object = self._mapper.GetInputDataObject(0, 0)
+        for key in path:
+            if not isinstance(data_object, _vtk.vtkMultiBlockDataSet):
+                raise KeyError(f'Block {block} not found.')
+            n_blocks = data_object.GetNumberOfBlocks()
+            if isinstance(key, str):
+                names = [data_object.GetMetaData(i).Get(_vtk.vtkCompositeDataSet.NAME())
+                         if data_object.HasMetaData(i) else None for i in range(n_blocks)]
+                if key not in names:
+                    raise KeyError(f'Block {key!r} not found.')
+                index = names.index(key)
+            else:
+                index = key + n_blocks if key < 0 else key
+                if not 0 <= index < n_blocks:
+                    raise IndexError(f'Block index ({key}) out of range.')
+            data_object = data_object.GetBlock(index)
+        if data_object is None:
+            raise KeyError(f'Block {block} is empty.')
+        return data_object
+
+    def _modified(self):
+        """Render the new attributes on the next render."""
+        self._mapper.Modified()
+
+    def set_block_visibility(self, block, visible):
+        """Show or hide a block.
+
+        Parameters
+        ----------
+        block : int, str or tuple
+            Index, name or path of the block.
+
+        visible : bool
+            Visibility of the block.
+
+        """
+        self._attributes.SetBlockVisibility(self._locate(block), visible)
+        self._modified()
+
+    def block_visibility(self, block):
+        """Return the visibility of a block."""
+        data_object = self._locate(block)
+        if not self._attributes.HasBlockVisibility(data_object):
+            return True
+        return bool(self._attributes.GetBlockVisibility(data_object))
+
+    def set_block_color(self, block, color):
+        """Set the color of a block.
+
+        Parameters
+        ----------
+        block : int, str or tuple
+            Index, name or path of the block.
+
+        color : string or 3 item list
+            Color of the block.  ``None`` restores the color of the
+            actor.
+
+        """
+        data_object = self._locate(block)
+        if color is None:
+            self._attributes.RemoveBlockColor(data_object)
+        else:
+            self._attributes.SetBlockColor(data_object, parse_color(color))
+        self._modified()
+
+    def block_color(self, block):
+        """Return the color of a block, or ``None`` when using the actor color."""
+        data_object = self._locate(block)
+        if not self._attributes.HasBlockColor(data_object):
+            return None
+        color = [0.0, 0.0, 0.0]
+        self._attributes.GetBlockColor(data_object, color)
+        return tuple(color)
+
+    def set_block_opacity(self, block, opacity):
+        """Set the opacity of a block.
+
+        Parameters
+        ----------
+        block : int, str or tuple
+            Index, name or path of the block.
+
+        opacity : float
+            Opacity between 0 and 1.  ``None`` restores the opacity of
+            the actor.
+
+        """
+        data_object = self._locate(block)
+        if opacity is None:
+            self._attributes.RemoveBlockOpacity(data_object)
+        else:
+            self._attributes.SetBlockOpacity(data_object, opacity)
+        self._modified()
+
+    def block_opacity(self, block):
+        """Return the opacity of a block, or ``None`` when using the actor opacity."""
+        data_object = self._locate(block)
+        if not self._attributes.HasBlockOpacity(data_object):
+            return None
+        return self._attributes.GetBlockOpacity(data_object)
+
+    def reset(self):
+        """Remove the attributes of all blocks."""
+        self._attributes.RemoveBlockVisibilities()
+        self._attributes.RemoveBlockColors()
+        self._attributes.RemoveBlockOpacities()
+        self._modified()
@@ -42,15 +42,15 @@ NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 """
-import errno
 import gzip
 import hashlib
 import json
 import os
-import shutil
 import sys
-import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 
 FILENAME_EXTENSION = '.vtkjs'
@@ -113,36 +113,110 @@ def get_object_id(obj):
 
 # -----------------------------------------------------------------------------
 
-def dump_data_array(dataset_dir, data_dir, array, root=None, compress=True):
-    """Dump vtkjs data array."""
+class _SceneWriter:
+    """Write the arrays and index files of a VTKjs scene.
+
+    Files are written either into a directory or straight into an open
+    ``zipfile.ZipFile``.  Arrays are identified by the MD5 hash of their
+    content, so identical arrays are compressed only once even when
+    shared by several actors.  VTKjs reads arrays relative to their
+    dataset, so an array is still stored once per dataset using it.
+    Arrays are compressed in a pool of ``max_workers`` threads when
+    given, else one after the other.
+
+    """
+
+    def __init__(self, archive=None, compress=True, max_workers=None):
+        """Initialize the writer."""
+        self._archive = archive
+        self._compress = compress
+        self._executor = ThreadPoolExecutor(max_workers) if compress and max_workers else None
+        self._payloads = {}
+        self._pending = []
+        self._paths = set()
+
+    def add_array(self, data_dir, buffer):
+        """Add an array buffer to ``data_dir``.
+
+        Uncompressed arrays are written immediately while compressed
+        arrays are queued until :func:`_SceneWriter.flush`.  Returns
+        the MD5 hash identifying the array.
+
+        """
+        buffer = memoryview(buffer).cast('B')
+        md5 = hashlib.md5(buffer).hexdigest()
+        path = os.path.join(data_dir, f'{md5}.gz' if self._compress else md5)
+        if path in self._paths:
+            return md5
+        self._paths.add(path)
+
+        if not self._compress:
+            self.write(path, buffer)
+            return md5
+        if md5 not in self._payloads:
+            if self._executor is None:
+                self._payloads[md5] = gzip.compress(buffer)
+            else:
+                self._payloads[md5] = self._executor.submit(gzip.compress, buffer)
+        self._pending.append((path, md5))
+        return md5
+
+    def write(self, path, data, compress_type=zipfile.ZIP_DEFLATED):
+        """Write ``data`` to ``path`` in the archive or directory."""
+        if self._archive is not None:
+            self._archive.writestr(path, data, compress_type=compress_type)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(data)
+
+    def flush(self):
+        """Write every queued array."""
+        for path, md5 in self._pending:
+            payload = self._payloads[md5]
+            if self._executor is not None:
+                payload = payload.result()
+            # gzip payloads are not worth deflating a second time
+            self.write(path, payload, zipfile.ZIP_STORED)
+        self._pending.clear()
+
+    def close(self):
+        """Write every queued array and release the thread pool, if any."""
+        self.flush()
+        self._payloads.clear()
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+def _array_to_buffer(array):
+    """Return the content of a VTK array as a contiguous NumPy array.
+
+    VTKjs does not support 64 bit integers, so IdType arrays are
+    converted to unsigned 32 bit integers, with negative ids mapped to
+    ``-1``.
+
+    """
     # import here to avoid circular imports
     from pyvista import _vtk
+    values = _vtk.vtk_to_numpy(array).ravel()
+    if array.GetDataType() == 12:  # IdType
+        values = np.where(values < 0, -1, values).astype(np.uint32)
+    return np.ascontiguousarray(values)
+
+
+def dump_data_array(dataset_dir, data_dir, array, root=None, compress=True, writer=None):
+    """Dump vtkjs data array."""
     if root is None:
         root = {}
     if not array:
         return None
 
-    if array.GetDataType() == 12:
-        # IdType need to be converted to Uint32
-        array_size = array.GetNumberOfTuples() * array.GetNumberOfComponents()
-        new_array = _vtk.vtkTypeUInt32Array()
-        new_array.SetNumberOfTuples(array_size)
-        for i in range(array_size):
-            new_array.SetValue(i, -1 if array.GetValue(i) < 0 else array.GetValue(i))
-        pbuffer = memoryview(new_array)
+    if writer is None:
+        scene_writer = _SceneWriter(compress=compress)
+        pMd5 = scene_writer.add_array(data_dir, _array_to_buffer(array))
+        scene_writer.close()
     else:
-        pbuffer = memoryview(array)
-
-    pMd5 = hashlib.md5(pbuffer).hexdigest()
-    ppath = os.path.join(data_dir, pMd5)
-    with open(ppath, 'wb') as f:
-        f.write(pbuffer)
-
-    if compress:
-        with open(ppath, 'rb') as f_in, gzip.open(os.path.join(data_dir, pMd5 + '.gz'), 'wb') as f_out:
-            shutil.copyfileobj(f_in, f_out)
-        # Close then remove.
-        os.remove(ppath)
+        pMd5 = writer.add_array(data_dir, _array_to_buffer(array))
 
     root['ref'] = get_ref(os.path.relpath(data_dir, dataset_dir), pMd5)
     root['vtkClass'] = 'vtkDataArray'
@@ -163,7 +237,7 @@ def dump_data_array(dataset_dir, data_dir, array, root=None, compress=True):
 # -----------------------------------------------------------------------------
 
 
-def dump_color_array(dataset_dir, data_dir, color_array_info, root=None, compress=True):
+def dump_color_array(dataset_dir, data_dir, color_array_info, root=None, compress=True, writer=None):
     """Dump vtkjs color array."""
     if root is None:
         root = {}
@@ -204,7 +278,7 @@ def dump_color_array(dataset_dir, data_dir, color_array_info, root=None, compres
     colorArray = color_array_info['colorArray']
     location = color_array_info['location']
 
-    dumped_array = dump_data_array(dataset_dir, data_dir, colorArray, {}, compress)
+    dumped_array = dump_data_array(dataset_dir, data_dir, colorArray, {}, compress, writer)
 
     if dumped_array:
         root[location]['activeScalars'] = 0
@@ -215,33 +289,33 @@ def dump_color_array(dataset_dir, data_dir, color_array_info, root=None, compres
 # -----------------------------------------------------------------------------
 
 
-def dump_t_coords(dataset_dir, data_dir, dataset, root=None, compress=True):
+def dump_t_coords(dataset_dir, data_dir, dataset, root=None, compress=True, writer=None):
     """Dump vtkjs texture coordinates."""
     if root is None:
         root = {}
     tcoords = dataset.GetPointData().GetTCoords()
     if tcoords:
-        dumped_array = dump_data_array(dataset_dir, data_dir, tcoords, {}, compress)
+        dumped_array = dump_data_array(dataset_dir, data_dir, tcoords, {}, compress, writer)
         root['pointData']['activeTCoords'] = len(root['pointData']['arrays'])
         root['pointData']['arrays'].append({'data': dumped_array})
 
 # -----------------------------------------------------------------------------
 
 
-def dump_normals(dataset_dir, data_dir, dataset, root=None, compress=True):
+def dump_normals(dataset_dir, data_dir, dataset, root=None, compress=True, writer=None):
     """Dump vtkjs normal vectors."""
     if root is None:
         root = {}
     normals = dataset.GetPointData().GetNormals()
     if normals:
-        dumped_array = dump_data_array(dataset_dir, data_dir, normals, {}, compress)
+        dumped_array = dump_data_array(dataset_dir, data_dir, normals, {}, compress, writer)
         root['pointData']['activeNormals'] = len(root['pointData']['arrays'])
         root['pointData']['arrays'].append({'data': dumped_array})
 
 # -----------------------------------------------------------------------------
 
 
-def dump_all_arrays(dataset_dir, data_dir, dataset, root=None, compress=True):
+def dump_all_arrays(dataset_dir, data_dir, dataset, root=None, compress=True, writer=None):
     """Dump all data arrays to vtkjs."""
     if root is None:
         root = {}
@@ -286,7 +360,7 @@ def dump_all_arrays(dataset_dir, data_dir, dataset, root=None, compress=True):
         array = pd.GetArray(i)
         if array:
             dumped_array = dump_data_array(
-                dataset_dir, data_dir, array, {}, compress)
+                dataset_dir, data_dir, array, {}, compress, writer)
             root['pointData']['activeScalars'] = 0
             root['pointData']['arrays'].append({'data': dumped_array})
 
@@ -297,7 +371,7 @@ def dump_all_arrays(dataset_dir, data_dir, dataset, root=None, compress=True):
         array = cd.GetArray(i)
         if array:
             dumped_array = dump_data_array(
-                dataset_dir, data_dir, array, {}, compress)
+                dataset_dir, data_dir, array, {}, compress, writer)
             root['cellData']['activeScalars'] = 0
             root['cellData']['arrays'].append({'data': dumped_array})
 
@@ -306,7 +380,7 @@ def dump_all_arrays(dataset_dir, data_dir, dataset, root=None, compress=True):
 # -----------------------------------------------------------------------------
 
 
-def dump_poly_data(dataset_dir, data_dir, dataset, color_array_info, root=None, compress=True):
+def dump_poly_data(dataset_dir, data_dir, dataset, color_array_info, root=None, compress=True, writer=None):
     """Dump poly data object to vtkjs."""
     if root is None:
         root = {}
@@ -315,7 +389,7 @@ def dump_poly_data(dataset_dir, data_dir, dataset, color_array_info, root=None,
 
     # Points
     points = dump_data_array(dataset_dir, data_dir,
-                             dataset.GetPoints().GetData(), {}, compress)
+                             dataset.GetPoints().GetData(), {}, compress, writer)
     points['vtkClass'] = 'vtkPoints'
     container['points'] = points
 
@@ -325,36 +399,36 @@ def dump_poly_data(dataset_dir, data_dir, dataset, color_array_info, root=None,
     # Verts
     if dataset.GetVerts() and dataset.GetVerts().GetData().GetNumberOfTuples() > 0:
         _verts = dump_data_array(dataset_dir, data_dir,
-                                 dataset.GetVerts().GetData(), {}, compress)
+                                 dataset.GetVerts().GetData(), {}, compress, writer)
         _cells['verts'] = _verts
         _cells['verts']['vtkClass'] = 'vtkCellArray'
 
     # Lines
     if dataset.GetLines() and dataset.GetLines().GetData().GetNumberOfTuples() > 0:
         _lines = dump_data_array(dataset_dir, data_dir,
-                                 dataset.GetLines().GetData(), {}, compress)
+                                 dataset.GetLines().GetData(), {}, compress, writer)
         _cells['lines'] = _lines
         _cells['lines']['vtkClass'] = 'vtkCellArray'
 
     # Polys
     if dataset.GetPolys() and dataset.GetPolys().GetData().GetNumberOfTuples() > 0:
         _polys = dump_data_array(dataset_dir, data_dir,
-                                 dataset.GetPolys().GetData(), {}, compress)
+                                 dataset.GetPolys().GetData(), {}, compress, writer)
         _cells['polys'] = _polys
         _cells['polys']['vtkClass'] = 'vtkCellArray'
 
     # Strips
     if dataset.GetStrips() and dataset.GetStrips().GetData().GetNumberOfTuples() > 0:
         _strips = dump_data_array(dataset_dir, data_dir,
-                                  dataset.GetStrips().GetData(), {}, compress)
+                                  dataset.GetStrips().GetData(), {}, compress, writer)
         _cells['strips'] = _strips
         _cells['strips']['vtkClass'] = 'vtkCellArray'
 
-    dump_color_array(dataset_dir, data_dir, color_array_info, container, compress)
+    dump_color_array(dataset_dir, data_dir, color_array_info, container, compress, writer)
 
     # PointData TCoords
-    dump_t_coords(dataset_dir, data_dir, dataset, container, compress)
-    # dump_normals(dataset_dir, data_dir, dataset, container, compress)
+    dump_t_coords(dataset_dir, data_dir, dataset, container, compress, writer)
+    # dump_normals(dataset_dir, data_dir, dataset, container, compress, writer)
 
     return root
 
@@ -364,7 +438,7 @@ writer_mapping['vtkPolyData'] = dump_poly_data
 # -----------------------------------------------------------------------------
 
 
-def dump_image_data(dataset_dir, data_dir, dataset, color_array_info, root=None, compress=True):
+def dump_image_data(dataset_dir, data_dir, dataset, color_array_info, root=None, compress=True, writer=None):
     """Dump image data object to vtkjs."""
     if root is None:
         root = {}
@@ -375,7 +449,7 @@ def dump_image_data(dataset_dir, data_dir, dataset, color_array_info, root=None,
     container['origin'] = dataset.GetOrigin()
     container['extent'] = dataset.GetExtent()
 
-    dump_all_arrays(dataset_dir, data_dir, dataset, container, compress)
+    dump_all_arrays(dataset_dir, data_dir, dataset, container, compress, writer)
 
     return root
 
@@ -385,27 +459,35 @@ writer_mapping['vtkImageData'] = dump_image_data
 # -----------------------------------------------------------------------------
 
 
-def write_data_set(file_path, dataset, output_dir, color_array_info, new_name=None, compress=True):
-    """Write dataset to vtkjs."""
+def write_data_set(file_path, dataset, output_dir, color_array_info, new_name=None, compress=True, writer=None):
+    """Write dataset to vtkjs.
+
+    When ``writer`` is given, ``output_dir`` is a path within the
+    writer's archive and the arrays are only queued for writing.
+
+    """
     fileName = new_name if new_name else os.path.basename(file_path)
     dataset_dir = os.path.join(output_dir, fileName)
     data_dir = os.path.join(dataset_dir, 'data')
 
-    if not os.path.exists(data_dir):
-        os.makedirs(data_dir)
+    scene_writer = writer
+    if scene_writer is None:
+        scene_writer = _SceneWriter(compress=compress)
 
     root = {}
     root['metadata'] = {}
     root['metadata']['name'] = fileName
 
-    writer = writer_mapping[dataset.GetClassName()]
-    if writer:
-        writer(dataset_dir, data_dir, dataset, color_array_info, root, compress)
+    dump = writer_mapping[dataset.GetClassName()]
+    if dump:
+        dump(dataset_dir, data_dir, dataset, color_array_info, root, compress, scene_writer)
     else:
         print(dataset.GetClassName(), 'is not supported')
 
-    with open(os.path.join(dataset_dir, "index.json"), 'w') as f:
-        f.write(json.dumps(root, indent=2))
+    scene_writer.write(os.path.join(dataset_dir, "index.json"),
+                       json.dumps(root, indent=2).encode())
+    if writer is None:
+        scene_writer.close()
 
     return dataset_dir
 
@@ -413,31 +495,40 @@ def write_data_set(file_path, dataset, output_dir, color_array_info, new_name=No
 ###                          Main script contents                           ###
 ### ----------------------------------------------------------------------- ###
 
-def mkdir_p(path):
-    """Make directory at path."""
-    try:
-        os.makedirs(path)
-    except OSError as exc:  # Python >2.5
-        if exc.errno == errno.EEXIST and os.path.isdir(path):
-            pass
-        else:
-            raise
+def export_plotter_vtkjs(plotter, filename, compress_arrays=False, max_workers=None):
+    """Export a plotter's rendering window to the VTKjs format.
 
+    The scene is streamed directly into the ``.vtkjs`` archive.
+    Arrays shared by several actors are compressed only once, though
+    stored for each of them.  Arrays are compressed in a pool of
+    ``max_workers`` threads when given, else one after the other.
 
-def export_plotter_vtkjs(plotter, filename, compress_arrays=False):
-    """Export a plotter's rendering window to the VTKjs format."""
+    """
     arrays = []  # assist in cleaning up references
 
-    # import here to avoid circular imports
-    from pyvista import _vtk
     sceneName = os.path.split(filename)[1]
     doCompressArrays = compress_arrays
 
-    # Generate timestamp and use it to make subdirectory within the top level output dir
-    timeStamp = time.strftime("%a-%d-%b-%Y-%H-%M-%S")
     root_output_directory = os.path.split(filename)[0]
-    output_dir = os.path.join(root_output_directory, timeStamp)
-    mkdir_p(output_dir)
+    sceneFileName = os.path.join(
+        root_output_directory, f'{sceneName}{FILENAME_EXTENSION}')
+    zf = zipfile.ZipFile(sceneFileName, mode='w')
+    writer = _SceneWriter(zf, compress=doCompressArrays, max_workers=max_workers)
+    try:
+        _write_scene(plotter, writer, sceneName, doCompressArrays, arrays)
+    finally:
+        writer.close()
+        zf.close()
+
+        # this must occur to avoid leaks
+        for array in arrays:
+            array.SetReferenceCount(0)
+
+
+def _write_scene(plotter, writer, output_dir, doCompressArrays, arrays):
+    """Write the datasets and the scene description of a plotter."""
+    # import here to avoid circular imports
+    from pyvista import _vtk
 
     renderers = plotter.ren_win.GetRenderers()
 
@@ -525,7 +616,8 @@ def export_plotter_vtkjs(plotter, filename, compress_arrays=False):
                     scDirs.append(write_data_set('', dataset, output_dir,
                                                  color_array_info,
                                                  new_name=componentName,
-                                                 compress=doCompressArrays))
+                                                 compress=doCompressArrays,
+                                                 writer=writer))
 
                     # Handle texture if any
                     textureName = None
@@ -593,7 +685,7 @@ def export_plotter_vtkjs(plotter, filename, compress_arrays=False):
     # Save texture data if any
     for key, val in textureToSave.items():
         write_data_set('', val, output_dir, None, new_name=key,
-                       compress=doCompressArrays)
+                       compress=doCompressArrays, writer=writer)
 
     cameraClippingRange = plotter.camera.clipping_range
 
@@ -610,39 +702,8 @@ def export_plotter_vtkjs(plotter, filename, compress_arrays=False):
         "scene": sceneComponents
     }
 
-    indexFilePath = os.path.join(output_dir, 'index.json')
-    with open(indexFilePath, 'w') as outfile:
-        json.dump(sceneDescription, outfile, indent=4)
-
-# -----------------------------------------------------------------------------
-
-    # Now zip up the results and get rid of the temp directory
-    sceneFileName = os.path.join(
-        root_output_directory, f'{sceneName}{FILENAME_EXTENSION}')
-
-    try:
-        import zlib
-        compression = zipfile.ZIP_DEFLATED
-    except:
-        compression = zipfile.ZIP_STORED
-
-    zf = zipfile.ZipFile(sceneFileName, mode='w')
-
-    try:
-        for dirName, subdirList, fileList in os.walk(output_dir):
-            for fname in fileList:
-                fullPath = os.path.join(dirName, fname)
-                relPath = f'{sceneName}/{os.path.relpath(fullPath, output_dir)}'
-                zf.write(fullPath, arcname=relPath, compress_type=compression)
-    finally:
-        zf.close()
-
-    shutil.rmtree(output_dir)
-
-    # this must occur to avoid leaks
-    scDirs.clear()
-    for array in arrays:
-        array.SetReferenceCount(0)
+    writer.write(os.path.join(output_dir, 'index.json'),
+                 json.dumps(sceneDescription, indent=4).encode())
 
 
 def convert_dropbox_url(url):
@@ -0,0 +1,75 @@
+"""Level of detail representations of large meshes."""
+import pyvista
+from pyvista import _vtk
+
+# default target reductions of the levels of detail
+DEFAULT_REDUCTIONS = (0.9, 0.99)
+
+# divisions along each axis of the trial clustering used to size the levels
+_TRIAL_DIVISIONS = 32
+
+
+def _cluster(surface, divisions):
+    """Return the surface clustered on a grid with the given divisions per axis."""
+    alg = _vtk.vtkQuadricClustering()
+    alg.SetInputData(surface)
+    alg.SetNumberOfDivisions(divisions, divisions, divisions)
+    alg.AutoAdjustNumberOfDivisionsOn()
+    alg.CopyCellDataOn()
+    alg.Update()
+    return pyvista.wrap(alg.GetOutput())
+
+
+def lod_levels(mesh, reductions=DEFAULT_REDUCTIONS, scalars=None):
+    """Return decimated representations of a mesh.
+
+    The surface of the mesh is clustered with
+    ``vtkQuadricClustering``, which is much faster than
+    :func:`pyvista.PolyDataFilters.decimate` on large meshes.  Point
+    arrays are converted to cell arrays first, as only cell arrays
+    are kept by the clustering.
+
+    Parameters
+    ----------
+    mesh : pyvista.DataSet
+        Mesh to decimate.
+
+    reductions : sequence of float, optional
+        Target reduction of each level, between 0 and 1.  ``0.9``
+        keeps about a tenth of the triangles of the surface.
+
+    scalars : str, optional
+        Name of the array set as the active scalars of each level.
+
+    Returns
+    -------
+    list of pyvista.PolyData
+        One surface per reduction.  Levels that would not remove any
+        triangle are the surface itself.
+
+    """
+    surface = mesh if isinstance(mesh, pyvista.PolyData) else mesh.extract_surface()
+    if surface.GetPointData().GetNumberOfArrays():
+        surface = surface.point_data_to_cell_data(pass_point_data=False)
+
+    n_faces = surface.n_faces
+    trial = None
+    levels = []
+    for reduction in reductions:
+        if not 0 <= reduction < 1:
+            raise ValueError(f'Invalid reduction ({reduction}).  Must be between 0 and 1.')
+        target = n_faces * (1 - reduction)
+        if target >= n_faces or n_faces < 2:
+            levels.append(surface)
+            continue
+        # the number of triangles scales with the square of the divisions
+        if trial is None:
+            trial = max(_cluster(surface, _TRIAL_DIVISIONS).n_faces, 1)
+        divisions = max(int(round(_TRIAL_DIVISIONS * (target / trial) ** 0.5)), 2)
+        levels.append(_cluster(surface, divisions))
+
+    if scalars is not None:
+        for level in levels:
+            if scalars in level.cell_arrays:
+                level.set_active_scalars(scalars, preference='cell')
+    return levels
@@ -3,6 +3,7 @@
 import sys
 import pathlib
 import collections.abc
+import concurrent.futures
 from typing import Sequence
 import logging
 import os
@@ -27,11 +28,14 @@ from pyvista.utilities import (assert_empty_kwargs, convert_array,
 from ..utilities.regression import image_from_window
 from ..utilities.misc import PyvistaDeprecationWarning
 from .colors import get_cmap_safe
+from .composite import CompositeAttributes, _iter_leaves, composite_surface
+from .lod import DEFAULT_REDUCTIONS, lod_levels
 from .export_vtkjs import export_plotter_vtkjs
 from .mapper import make_mapper
 from .picking import PickingHelper
 from .renderer import Renderer, Camera
-from .tools import (normalize, opacity_transfer_function, parse_color,
+from .tools import (_VolumeTransfer, _set_volume_transfer_functions,
+                    normalize, opacity_transfer_function, parse_color,
                     parse_font_family, FONTS)
 from .widgets import WidgetHelper
 from .scalar_bars import ScalarBars
@@ -199,6 +203,10 @@ class BasePlotter(PickingHelper, WidgetHelper):
 
         # track if the camera has been setup
         self._first_time = True
+        # notebook viewer kept in sync on each render, see ``IpyganySession``
+        self._jupyter_session = None
+        # computes the levels of detail of meshes added with ``lod``
+        self._lod_executor = None
         # Keep track of the scale
         self._labels = []
 
@@ -875,12 +883,16 @@ class BasePlotter(PickingHelper, WidgetHelper):
     def render(self):
         """Render the main window.
 
-        Does nothing until ``show`` has been called.
+        Does nothing until ``show`` has been called.  Notebook viewers
+        supporting incremental updates are sent the changes of the
+        scene.
         """
         if hasattr(self, 'ren_win') and not self._first_time:
             log.debug('Rendering')
             self.ren_win.Render()
             self._rendered = True
+            if self._jupyter_session is not None:
+                self._jupyter_session.update()
 
     @wraps(RenderWindowInteractor.add_key_event)
     def add_key_event(self, *args, **kwargs):
@@ -1097,7 +1109,8 @@ class BasePlotter(PickingHelper, WidgetHelper):
                  use_transparency=False, below_color=None, above_color=None,
                  annotations=None, pickable=True, preference="point",
                  log_scale=False, pbr=False, metallic=0.0, roughness=0.5,
-                 render=True, component=None, **kwargs):
+                 render=True, component=None, composite=False, lod=None,
+                 **kwargs):
         """Add any PyVista/VTK mesh or dataset that PyVista can wrap to the scene.
 
         This method is using a mesh representation to view the surfaces
@@ -1352,10 +1365,38 @@ class BasePlotter(PickingHelper, WidgetHelper):
             nonnegative, if supplied. If ``None``, the magnitude of
             the vector is plotted.
 
+        composite : bool, optional
+            Render a ``MultiBlock`` through a single actor and
+            ``vtkCompositePolyDataMapper2`` instead of adding one
+            actor per block, which is much faster for many blocks.
+            The color, opacity and visibility of each block can then
+            be changed with :class:`pyvista.CompositeAttributes`.
+            ``scalars`` must be the name of an array.  Labels,
+            textures, silhouettes, levels of detail, opacity arrays,
+            ``rgb``, ``categories``, ``use_transparency``,
+            ``below_color``, ``above_color``, ``annotations`` and
+            ``component`` are not supported.  Surfaces are extracted
+            from blocks that are not ``PolyData``.  Default ``False``.
+
+        lod : bool or sequence of float, optional
+            Render the mesh through a ``vtkLODActor`` swapping to
+            decimated representations of the mesh while interacting
+            with the scene, and back to the full resolution mesh once
+            the interaction stops.  ``True`` uses levels with target
+            reductions of ``0.9`` and ``0.99``, or give the target
+            reduction of each level.  The levels are computed when
+            adding the mesh, unless the plotter has already been
+            rendered, e.g. a ``pyvistaqt.BackgroundPlotter``.  They
+            are then computed in a background thread and used from
+            the first render after they are ready, the full
+            resolution mesh being rendered until then.  Textures are
+            not supported.  Default ``None``.
+
         Returns
         -------
-        actor : vtk.vtkActor
-            VTK actor of the mesh.
+        actor : vtk.vtkActor or list of vtk.vtkActor
+            VTK actor of the mesh, or the actor of each block of a
+            ``MultiBlock`` unless ``composite=True``.
 
         Examples
         --------
@@ -1489,6 +1530,12 @@ class BasePlotter(PickingHelper, WidgetHelper):
             the_arguments.pop('mesh')
             the_arguments.pop('kwargs')
 
+            if composite:
+                # the opacity of NaN values is already part of ``nan_color``
+                the_arguments.pop('composite')
+                the_arguments.pop('nan_opacity')
+                return self._add_composite_mesh(mesh, **the_arguments)
+
             if multi_colors:
                 # Compute unique colors for each index of the block
                 if _has_matplotlib():
@@ -1611,7 +1658,7 @@ class BasePlotter(PickingHelper, WidgetHelper):
         if interpolate_before_map:
             self.mapper.InterpolateScalarsBeforeMappingOn()
 
-        actor = _vtk.vtkActor()
+        actor = _vtk.vtkLODActor() if lod else _vtk.vtkActor()
         prop = _vtk.vtkProperty()
         actor.SetMapper(self.mapper)
         actor.SetProperty(prop)
@@ -1629,6 +1676,8 @@ class BasePlotter(PickingHelper, WidgetHelper):
             texture = mesh._activate_texture(texture)
 
         if texture:
+            if lod:
+                raise ValueError('Textures are not supported with levels of detail.')
 
             if isinstance(texture, np.ndarray):
                 texture = numpy_to_texture(texture)
@@ -1846,7 +1895,54 @@ class BasePlotter(PickingHelper, WidgetHelper):
             self.mapper.SetScalarModeToUseFieldData()
 
         # Set actor properties ================================================
+        rgb_color = self._set_mesh_property(
+            prop, style=style, color=color, point_size=point_size, ambient=ambient,
+            diffuse=diffuse, specular=specular, specular_power=specular_power, pbr=pbr,
+            metallic=metallic, roughness=roughness, smooth_shading=smooth_shading,
+            show_edges=show_edges, opacity=opacity, edge_color=edge_color,
+            render_points_as_spheres=render_points_as_spheres,
+            render_lines_as_tubes=render_lines_as_tubes, lighting=lighting,
+            line_width=line_width)
 
+        # legend label
+        if label:
+            if not isinstance(label, str):
+                raise TypeError('Label must be a string')
+            geom = pyvista.Triangle()
+            if scalars is not None:
+                geom = pyvista.Box()
+                rgb_color = parse_color('black')
+            geom.points -= geom.center
+            self._labels.append([geom, label, rgb_color])
+
+        if lod:
+            self._add_lod_levels(actor, DEFAULT_REDUCTIONS if lod is True else lod)
+
+        self.add_actor(actor, reset_camera=reset_camera, name=name, culling=culling,
+                       pickable=pickable, render=render)
+
+        # hide scalar bar if using special scalars
+        if scalar_bar_args.get('title') == '__custom_rgba':
+            show_scalar_bar = False
+
+        # Only show scalar bar if there are scalars
+        if show_scalar_bar and scalars is not None:
+            self.add_scalar_bar(**scalar_bar_args)
+
+        self.renderer.Modified()
+
+        return actor
+
+    def _set_mesh_property(self, prop, style=None, color=None, point_size=5.0,
+                           ambient=0.0, diffuse=1.0, specular=0.0, specular_power=100.0,
+                           pbr=False, metallic=0.0, roughness=0.5, smooth_shading=False,
+                           show_edges=False, opacity=1.0, edge_color=None,
+                           render_points_as_spheres=False, render_lines_as_tubes=False,
+                           lighting=True, line_width=None):
+        """Set the property of a mesh actor from the arguments of ``add_mesh``.
+
+        Returns the RGB color of the mesh.
+        """
         # select view style
         if not style:
             style = 'surface'
@@ -1897,17 +1993,6 @@ class BasePlotter(PickingHelper, WidgetHelper):
         if render_lines_as_tubes:
             prop.SetRenderLinesAsTubes(render_lines_as_tubes)
 
-        # legend label
-        if label:
-            if not isinstance(label, str):
-                raise TypeError('Label must be a string')
-            geom = pyvista.Triangle()
-            if scalars is not None:
-                geom = pyvista.Box()
-                rgb_color = parse_color('black')
-            geom.points -= geom.center
-            self._labels.append([geom, label, rgb_color])
-
         # lighting display style
         if not lighting:
             prop.LightingOff()
@@ -1915,20 +2000,179 @@ class BasePlotter(PickingHelper, WidgetHelper):
         # set line thickness
         if line_width:
             prop.SetLineWidth(line_width)
+        return rgb_color
+
+    def _add_lod_levels(self, actor, reductions):
+        """Add the levels of detail of the mesh of an actor.
+
+        The levels are computed right away when the plotter has not
+        been rendered yet.  A plain ``show()`` runs the interactor in
+        the main thread, which would keep a background thread from
+        computing them.  Meshes added to a rendered plotter, e.g. a
+        ``pyvistaqt.BackgroundPlotter``, have their levels computed
+        from a copy of the mesh in a background thread, while their
+        mappers render the full resolution mesh.  The levels are given
+        to the mappers on the first render after they are ready.
+        """
+        mapper = actor.GetMapper()
+        scalar_mode = mapper.GetScalarMode()
+        lod_mappers = []
+        for _ in reductions:
+            lod_mapper = _vtk.vtkDataSetMapper()
+            lod_mapper.ShallowCopy(mapper)
+            lod_mapper.SetInputData(self.mesh)
+            actor.AddLODMapper(lod_mapper)
+            lod_mappers.append(lod_mapper)
+
+        scalars = self.mesh.active_scalars_name
+        if self._first_time:
+            future = concurrent.futures.Future()
+            future.set_result(lod_levels(self.mesh, reductions, scalars))
+        else:
+            if self._lod_executor is None:
+                self._lod_executor = concurrent.futures.ThreadPoolExecutor(1)
+            # the mesh may be modified while the levels are computed
+            future = self._lod_executor.submit(lod_levels, self.mesh.copy(), reductions,
+                                               scalars)
+
+        renderer = self.renderer
+
+        def use_levels(*args):
+            # VTK objects are only modified from the main thread
+            if not future.done():
+                return
+            renderer.RemoveObserver(observer)
+            try:
+                levels = future.result()
+            except Exception as e:
+                warnings.warn(f'Unable to compute the levels of detail:\n{e}')
+                return
+            for lod_mapper, level in zip(lod_mappers, levels):
+                # follow the changes made to the mapper since adding the mesh
+                lod_mapper.ShallowCopy(mapper)
+                lod_mapper.SetInputData(level)
+                # point scalars are converted to cell scalars by ``lod_levels``
+                if scalar_mode in (_vtk.VTK_SCALAR_MODE_USE_POINT_DATA,
+                                   _vtk.VTK_SCALAR_MODE_USE_CELL_DATA):
+                    lod_mapper.SetScalarModeToUseCellData()
+
+        observer = renderer.AddObserver(_vtk.vtkCommand.StartEvent, use_levels)
+
+    def _add_composite_mesh(self, mesh, color=None, style=None, scalars=None,
+                            clim=None, show_edges=False, edge_color=None,
+                            point_size=5.0, line_width=None, opacity=1.0,
+                            flip_scalars=False, lighting=True, n_colors=256,
+                            interpolate_before_map=True, cmap=None,
+                            reset_camera=None, scalar_bar_args=None,
+                            show_scalar_bar=True, multi_colors=False, name=None,
+                            render_points_as_spheres=False,
+                            render_lines_as_tubes=False, smooth_shading=False,
+                            ambient=0.0, diffuse=1.0, specular=0.0,
+                            specular_power=100.0, nan_color=None, culling=None,
+                            pickable=True, preference='point', log_scale=False,
+                            pbr=False, metallic=0.0, roughness=0.5, render=True,
+                            **kwargs):
+        """Add a ``MultiBlock`` rendered by a single composite actor.
+
+        Takes the arguments of :func:`BasePlotter.add_mesh` once they
+        have been parsed.  The other arguments of ``add_mesh``, such
+        as ``texture`` or ``annotations``, are not supported and raise
+        a ``ValueError`` when set.
+        """
+        unsupported = [key for key, value in kwargs.items()
+                       if value is not None and value is not False]
+        if unsupported:
+            raise ValueError(f'{", ".join(f"`{key}`" for key in unsupported)} '
+                             f'not supported with `composite=True`.')
+        if not isinstance(opacity, (float, int)):
+            raise ValueError('Only a single opacity is supported with `composite=True`.')
+
+        dataset = composite_surface(mesh)
+        self.mesh = mesh
+        self.mapper = make_mapper(_vtk.vtkCompositePolyDataMapper2)
+        self.mapper.SetInputDataObject(dataset)
+        self.mapper.SetCompositeDataDisplayAttributes(_vtk.vtkCompositeDataDisplayAttributes())
+        if interpolate_before_map:
+            self.mapper.InterpolateScalarsBeforeMappingOn()
+
+        actor = _vtk.vtkActor()
+        prop = _vtk.vtkProperty()
+        actor.SetMapper(self.mapper)
+        actor.SetProperty(prop)
+
+        if scalars is not None:
+            # color by the first array found in the blocks
+            for block in _iter_leaves(dataset):
+                point_array = block.GetPointData().GetAbstractArray(scalars)
+                cell_array = block.GetCellData().GetAbstractArray(scalars)
+                if point_array is not None or cell_array is not None:
+                    break
+            else:
+                raise KeyError(f'Data array ({scalars}) not present in any block.')
+            if point_array is not None and (cell_array is None or preference == 'point'):
+                self.mapper.SetScalarModeToUsePointFieldData()
+            else:
+                self.mapper.SetScalarModeToUseCellFieldData()
+            self.mapper.SelectColorArray(scalars)
+            self.mapper.SetColorModeToMapScalars()
+            self.mapper.ScalarVisibilityOn()
+
+            table = self.mapper.GetLookupTable()
+            table.SetNumberOfTableValues(n_colors)
+            if cmap is None and _has_matplotlib():
+                cmap = self._theme.cmap
+            if cmap is not None and _has_matplotlib():
+                if isinstance(cmap, str):
+                    self.mapper.cmap = cmap
+                ctable = (get_cmap_safe(cmap)(np.linspace(0, 1, n_colors))*255).astype(np.uint8)
+                if flip_scalars:
+                    ctable = np.ascontiguousarray(ctable[::-1])
+                table.SetTable(_vtk.numpy_to_vtk(ctable))
+            elif flip_scalars:
+                table.SetHueRange(0.0, 0.66667)
+            else:
+                table.SetHueRange(0.66667, 0.0)
+            table.SetNanColor(nan_color)
+
+            if isinstance(clim, (int, float)):
+                clim = [-clim, clim]
+            if log_scale:
+                if clim[0] <= 0:
+                    clim = [sys.float_info.min, clim[1]]
+                table.SetScaleToLog10()
+            self.mapper.scalar_range = clim[0], clim[1]
+            scalar_bar_args.setdefault('title', scalars)
+        else:
+            self.mapper.ScalarVisibilityOff()
+
+        if multi_colors:
+            if _has_matplotlib():
+                import matplotlib
+                from itertools import cycle
+                colors = cycle(matplotlib.rcParams['axes.prop_cycle'])
+                attributes = CompositeAttributes(actor)
+                for i in range(dataset.GetNumberOfBlocks()):
+                    if dataset.GetBlock(i) is not None:
+                        attributes.set_block_color(i, next(colors)['color'])
+            else:
+                logging.warning('Please install matplotlib for color cycles')
+
+        self._set_mesh_property(
+            prop, style=style, color=color, point_size=point_size, ambient=ambient,
+            diffuse=diffuse, specular=specular, specular_power=specular_power, pbr=pbr,
+            metallic=metallic, roughness=roughness, smooth_shading=smooth_shading,
+            show_edges=show_edges, opacity=opacity, edge_color=edge_color,
+            render_points_as_spheres=render_points_as_spheres,
+            render_lines_as_tubes=render_lines_as_tubes, lighting=lighting,
+            line_width=line_width)
 
         self.add_actor(actor, reset_camera=reset_camera, name=name, culling=culling,
                        pickable=pickable, render=render)
 
-        # hide scalar bar if using special scalars
-        if scalar_bar_args.get('title') == '__custom_rgba':
-            show_scalar_bar = False
-
-        # Only show scalar bar if there are scalars
         if show_scalar_bar and scalars is not None:
             self.add_scalar_bar(**scalar_bar_args)
 
         self.renderer.Modified()
-
         return actor
 
     def add_volume(self, volume, scalars=None, clim=None, resolution=None,
@@ -2238,7 +2482,8 @@ class BasePlotter(PickingHelper, WidgetHelper):
             idxs1 = scalars > clim[1]
         scalars[idxs0] = clim[0]
         scalars[idxs1] = clim[1]
-        scalars = ((scalars - np.nanmin(scalars)) / (np.nanmax(scalars) - np.nanmin(scalars))) * 255
+        data_range = float(np.nanmin(scalars)), float(np.nanmax(scalars))
+        scalars = ((scalars - data_range[0]) / (data_range[1] - data_range[0])) * 255
         # scalars = scalars.astype(np.uint8)
         volume[title] = scalars
 
@@ -2261,41 +2506,22 @@ class BasePlotter(PickingHelper, WidgetHelper):
             if not _has_matplotlib():
                 raise ImportError('Please install matplotlib for volume rendering.')
 
-            cmap = get_cmap_safe(cmap)
             if categories:
                 if categories is True:
                     n_colors = len(np.unique(scalars))
                 elif isinstance(categories, int):
                     n_colors = categories
-        if flip_scalars:
-            cmap = cmap.reversed()
 
-        color_tf = _vtk.vtkColorTransferFunction()
-        for ii in range(n_colors):
-            color_tf.AddRGBPoint(ii, *cmap(ii)[:-1])
-
-        # Set opacities
-        if isinstance(opacity, (float, int)):
-            opacity_values = [opacity] * n_colors
-        elif isinstance(opacity, str):
-            opacity_values = pyvista.opacity_transfer_function(opacity, n_colors)
-        elif isinstance(opacity, (np.ndarray, list, tuple)):
-            opacity = np.array(opacity)
-            opacity_values = opacity_transfer_function(opacity, n_colors)
-
-        opacity_tf = _vtk.vtkPiecewiseFunction()
-        for ii in range(n_colors):
-            opacity_tf.AddPoint(ii, opacity_values[ii] / n_colors)
-
-        # Now put color tf and opacity tf into a lookup table for the scalar bar
-        table.SetNumberOfTableValues(n_colors)
-        lut = cmap(np.array(range(n_colors))) * 255
-        lut[:,3] = opacity_values
-        lut = lut.astype(np.uint8)
-        table.SetTable(_vtk.numpy_to_vtk(lut))
-        table.SetRange(*clim)
+        prop = _vtk.vtkVolumeProperty()
+        prop.SetColor(_vtk.vtkColorTransferFunction())
+        prop.SetScalarOpacity(_vtk.vtkPiecewiseFunction())
         self.mapper.lookup_table = table
 
+        # settings kept to update the transfer functions later on
+        transfer = _VolumeTransfer(table, cmap, opacity, n_colors, flip_scalars, clim,
+                                   data_range, None)
+        _set_volume_transfer_functions(prop, transfer)
+
         self.mapper.SetInputData(volume)
 
         blending = blending.lower()
@@ -2317,10 +2543,8 @@ class BasePlotter(PickingHelper, WidgetHelper):
 
         self.volume = _vtk.vtkVolume()
         self.volume.SetMapper(self.mapper)
+        self.volume._transfer = transfer
 
-        prop = _vtk.vtkVolumeProperty()
-        prop.SetColor(color_tf)
-        prop.SetScalarOpacity(opacity_tf)
         prop.SetAmbient(ambient)
         prop.SetScalarOpacityUnitDistance(opacity_unit_distance)
         prop.SetShade(shade)
@@ -2341,6 +2565,86 @@ class BasePlotter(PickingHelper, WidgetHelper):
 
         return actor
 
+    def update_volume_transfer_function(self, volume=None, cmap=None, opacity=None,
+                                        clim=None, n_colors=None, flip_scalars=None,
+                                        render=True):
+        """Change the colors and opacities of a volume without adding it again.
+
+        Arguments left to ``None`` keep the value used by
+        :func:`BasePlotter.add_volume` or by the previous update.  The
+        transfer functions and the lookup table of the scalar bar are
+        rebuilt in place, the volume data is left untouched.
+
+        Parameters
+        ----------
+        volume : vtk.vtkVolume or str, optional
+            Volume returned by :func:`BasePlotter.add_volume`, or its
+            name.  Defaults to the last volume added.
+
+        cmap : str, list or matplotlib.colors.Colormap, optional
+            New colormap.
+
+        opacity : float, str or numpy.ndarray, optional
+            New opacity of the volume, or opacity mapping, see
+            :func:`BasePlotter.add_volume`.
+
+        clim : 2 item list, optional
+            New color range.  Scalars were clipped to the color range
+            given to :func:`BasePlotter.add_volume`, so values outside
+            of it keep the colors of its bounds.
+
+        n_colors : int, optional
+            New number of colors.
+
+        flip_scalars : bool, optional
+            Reverse the colormap.
+
+        render : bool, optional
+            Force a render when ``True``.  Default ``True``.
+
+        Examples
+        --------
+        Switch the colormap of a volume.
+
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> pl = pyvista.Plotter()
+        >>> _ = pl.add_volume(examples.load_uniform(), cmap='viridis')
+        >>> pl.update_volume_transfer_function(cmap='bone', opacity='sigmoid')
+
+        """
+        if volume is None:
+            volume = getattr(self, 'volume', None)
+        elif isinstance(volume, str):
+            volume = self.renderer._actors.get(volume)
+        if getattr(volume, '_transfer', None) is None:
+            raise ValueError('No volume added with ``add_volume`` to update.')
+
+        transfer = volume._transfer
+        changes = {'cmap': cmap, 'opacity': opacity, 'n_colors': n_colors,
+                   'flip_scalars': flip_scalars}
+        transfer = transfer._replace(**{key: value for key, value in changes.items()
+                                        if value is not None})
+        if clim is not None:
+            if isinstance(clim, (float, int)):
+                clim = [-clim, clim]
+            transfer = transfer._replace(clim=clim)
+            transfer = transfer._replace(x_range=self._volume_transfer_range(transfer))
+
+        _set_volume_transfer_functions(volume.GetProperty(), transfer)
+        volume._transfer = transfer
+        if render:
+            self.render()
+
+    @staticmethod
+    def _volume_transfer_range(transfer):
+        """Return the range of the transfer functions of a volume in the rescaled scalars."""
+        data_min, data_max = transfer.data_range
+        if not data_max > data_min:
+            return None
+        scale = 255 / (data_max - data_min)
+        return tuple((value - data_min) * scale for value in transfer.clim)
+
     def update_scalar_bar_range(self, clim, name=None):
         """Update the value range of the active or named scalar bar.
 
@@ -2606,6 +2910,12 @@ class BasePlotter(PickingHelper, WidgetHelper):
             except BaseException:
                 pass
 
+        self._jupyter_session = None
+
+        if self._lod_executor is not None:
+            self._lod_executor.shutdown(wait=False)
+            self._lod_executor = None
+
         # this helps managing closed plotters
         self._closed = True
 
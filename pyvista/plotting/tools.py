@@ -1,16 +1,18 @@
 """Module containing useful plotting tools."""
 
+import collections
 import sys
 from enum import Enum
 import platform
 import os
 from subprocess import PIPE, Popen
+from typing import Tuple
 
 import numpy as np
 
 import pyvista
 from pyvista import _vtk
-from .colors import string_to_rgb
+from .colors import get_cmap_safe, string_to_rgb
 
 
 class FONTS(Enum):
@@ -21,6 +23,11 @@ class FONTS(Enum):
     times = _vtk.VTK_TIMES
 
 
+# transfer tables of the recently rendered volumes, see ``volume_transfer_tables``
+_TRANSFER_TABLES: 'collections.OrderedDict[tuple, Tuple[np.ndarray, np.ndarray]]' = \
+    collections.OrderedDict()
+_TRANSFER_TABLES_SIZE = 32
+
 # Track render window support and plotting
 SUPPORTS_OPENGL = None
 SUPPORTS_PLOTTING = None
@@ -348,6 +355,115 @@ def opacity_transfer_function(mapping, n_colors, interpolate=True,
     raise TypeError(f'Transfer function type ({type(mapping)}) not understood')
 
 
+def _transfer_key(value):
+    """Return a hashable key of a colormap or opacity mapping, or ``None``."""
+    if isinstance(value, (str, float, int)):
+        return value
+    if isinstance(value, (np.ndarray, list, tuple)):
+        array = np.asarray(value)
+        return array.dtype.str, array.shape, array.tobytes()
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return value
+
+
+def volume_transfer_tables(cmap, opacity, n_colors, flip_scalars=False):
+    """Return the colors and opacities of the transfer functions of a volume.
+
+    Tables of recently used colormaps and opacity mappings are cached,
+    as evaluating the colormap and interpolating the opacities is
+    slow for large numbers of colors.  The returned arrays are read
+    only.
+
+    Parameters
+    ----------
+    cmap : str, list or matplotlib.colors.Colormap
+        Colormap, see :func:`pyvista.plotting.colors.get_cmap_safe`.
+
+    opacity : float, str or sequence
+        Opacity of all colors, or opacity mapping, see
+        :func:`pyvista.opacity_transfer_function`.
+
+    n_colors : int
+        Number of colors of the transfer functions.
+
+    flip_scalars : bool, optional
+        Reverse the colormap.
+
+    Returns
+    -------
+    colors : numpy.ndarray
+        ``(n_colors, 3)`` RGB colors between 0 and 1.
+
+    opacities : numpy.ndarray
+        ``(n_colors,)`` opacities, between 0 and 255 for opacity
+        mappings.
+
+    """
+    key = (_transfer_key(cmap), _transfer_key(opacity), n_colors, bool(flip_scalars))
+    cache = None not in key
+    if cache and key in _TRANSFER_TABLES:
+        _TRANSFER_TABLES.move_to_end(key)
+        return _TRANSFER_TABLES[key]
+
+    cmap = get_cmap_safe(cmap)
+    if flip_scalars:
+        cmap = cmap.reversed()
+    colors = cmap(np.linspace(0, 1, n_colors))[:, :3]
+    if isinstance(opacity, (float, int)):
+        opacities = np.full(n_colors, opacity, dtype=float)
+    else:
+        opacities = opacity_transfer_function(opacity, n_colors)
+    colors.flags.writeable = False
+    opacities.flags.writeable = False
+
+    if cache:
+        _TRANSFER_TABLES[key] = colors, opacities
+        if len(_TRANSFER_TABLES) > _TRANSFER_TABLES_SIZE:
+            _TRANSFER_TABLES.popitem(last=False)
+    return colors, opacities
+
+
+# settings of the transfer functions of a volume added with ``add_volume``,
+# ``x_range`` being the range of the transfer functions in the rescaled
+# scalars, ``None`` for the range from 0 to ``n_colors - 1`` used by
+# ``add_volume``, and ``data_range`` the range of the scalars rescaled to
+# [0, 255]
+_VolumeTransfer = collections.namedtuple(
+    '_VolumeTransfer', ['table', 'cmap', 'opacity', 'n_colors', 'flip_scalars', 'clim',
+                        'data_range', 'x_range'])
+
+
+def _set_volume_transfer_functions(prop, transfer):
+    """Build the transfer functions of a volume property and its lookup table at once."""
+    colors, opacities = volume_transfer_tables(transfer.cmap, transfer.opacity,
+                                               transfer.n_colors, transfer.flip_scalars)
+    n_colors = transfer.n_colors
+    x_range = (0, n_colors - 1) if transfer.x_range is None else transfer.x_range
+    color_tf = prop.GetRGBTransferFunction()
+    opacity_tf = prop.GetScalarOpacity()
+    if n_colors > 1:
+        color_tf.BuildFunctionFromTable(*x_range, n_colors,
+                                        np.array(colors, dtype=float).ravel())
+        opacity_tf.BuildFunctionFromTable(*x_range, n_colors,
+                                          np.array(opacities, dtype=float) / n_colors)
+    else:
+        color_tf.RemoveAllPoints()
+        color_tf.AddRGBPoint(x_range[0], *colors[0])
+        opacity_tf.RemoveAllPoints()
+        opacity_tf.AddPoint(x_range[0], opacities[0] / n_colors)
+
+    # the lookup table is shown by the scalar bar
+    lut = np.empty((n_colors, 4))
+    lut[:, :3] = colors * 255
+    lut[:, 3] = opacities
+    transfer.table.SetNumberOfTableValues(n_colors)
+    transfer.table.SetTable(_vtk.numpy_to_vtk(lut.astype(np.uint8)))
+    transfer.table.SetRange(*transfer.clim)
+
+
 def parse_color(color, opacity=None, default_color=None):
     """Parse color into a vtk friendly rgb list.
 
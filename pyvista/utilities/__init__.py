@@ -4,10 +4,14 @@ from .errors import (GPUInfo, Observer, Report,
                      set_error_output_file, check_valid_vector, VtkErrorCatcher)
 from .features import *
 from .fileio import *
+from .filter_executor import FilterExecutor, FilterFuture
 from .geometric_objects import *
 from .helpers import *
 from .parametric_objects import *
+from .profiling import FilterRecord, Profile, profile
 from .sphinx_gallery import Scraper, _get_sg_image_scraper
-from .regression import compare_images
+from .regression import compare_images, compare_images_batch
+from .shared_memory import SharedDataSet, SharedDataSetHandle
+from .time_series import TimeSeriesReader
 from . import transformations
 from .xvfb import start_xvfb
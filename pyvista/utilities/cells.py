@@ -60,6 +60,53 @@ def numpy_to_idarr(ind, deep=False, return_ind=False):
     return vtk_idarr
 
 
+def numpy_to_cell_array(offsets, connectivity, deep=False):
+    """Create a ``vtkCellArray`` from VTK 9 offsets and connectivity arrays.
+
+    The arrays are wrapped without copying when ``deep=False`` and
+    they are contiguous arrays of ``pyvista.ID_TYPE``.  Requires VTK 9
+    or newer.
+
+    Parameters
+    ----------
+    offsets : np.ndarray (int)
+        Offsets of each cell within ``connectivity`` followed by the
+        length of ``connectivity``.
+
+    connectivity : np.ndarray (int)
+        Point ids of all cells.
+
+    deep : bool, optional
+        Copy the arrays instead of wrapping them.
+
+    Returns
+    -------
+    vtk.vtkCellArray
+        Cell array using ``offsets`` and ``connectivity``.
+
+    Examples
+    --------
+    >>> from pyvista.utilities.cells import numpy_to_cell_array
+    >>> cell_array = numpy_to_cell_array([0, 3, 6], [0, 1, 2, 2, 3, 0])
+    >>> cell_array.GetNumberOfCells()
+    2
+
+    """
+    if not _vtk.VTK9:  # pragma: no cover
+        raise AttributeError('VTK 9 or higher is required')
+    vtk_offsets, offsets = numpy_to_idarr(offsets, deep=deep, return_ind=True)
+    vtk_connectivity, connectivity = numpy_to_idarr(connectivity, deep=deep,
+                                                    return_ind=True)
+    cell_array = _vtk.vtkCellArray()
+    cell_array.SetData(vtk_offsets, vtk_connectivity)
+    if not deep:
+        # ``SetData`` shares the memory of the given arrays through new
+        # arrays, so the NumPy references must be moved to those arrays
+        cell_array.GetOffsetsArray()._numpy_reference = offsets
+        cell_array.GetConnectivityArray()._numpy_reference = connectivity
+    return cell_array
+
+
 class CellArray(_vtk.vtkCellArray):
     """pyvista wrapping of vtkCellArray.
 
@@ -114,6 +161,65 @@ class CellArray(_vtk.vtkCellArray):
         return self.GetNumberOfCells()
 
 
+def _cell_size_table():
+    """Return a lookup table of the number of points of each cell type.
+
+    Variable sized and unknown cell types are marked with ``-1``.
+    """
+    from .cell_type_helper import enum_cell_type_nr_points_map
+
+    table = np.full(max(enum_cell_type_nr_points_map) + 1, -1, dtype=np.int64)
+    for cell_type, n_points in enum_cell_type_nr_points_map.items():
+        if n_points > 0:
+            table[cell_type] = n_points
+    return table
+
+
+def _legacy_cell_offsets(cells):
+    """Walk a legacy cell array and return its VTK 9 offsets and connectivity.
+
+    The walk runs in compiled code through
+    ``vtkCellArray.ImportLegacyFormat``.  As the walk does not check
+    bounds, it runs on a copy of ``cells`` where every value that
+    would lead past the end of the array is clipped, which leaves
+    valid cell arrays unchanged.  Cells whose size was clipped are
+    reported as invalid afterwards.
+
+    Raises
+    ------
+    ValueError
+        If ``cells`` is not a valid legacy cell array.
+    """
+    cells = np.asarray(cells).ravel()
+    size = cells.size
+    safe_cells = np.array(cells, dtype=pyvista.ID_TYPE)
+
+    # only values within ``max(cells)`` of the end can lead past it
+    start = 0
+    if size and cells.min() >= 0:
+        start = max(size - 1 - int(cells.max()), 0)
+    tail = safe_cells[start:]
+    remaining = size - 1 - np.arange(start, size, dtype=pyvista.ID_TYPE)
+    clipped = start + np.nonzero((tail < 0) | (tail > remaining))[0]
+    np.clip(tail, 0, remaining, out=tail)
+
+    cell_array = _vtk.vtkCellArray()
+    cell_array.ImportLegacyFormat(_vtk.numpy_to_vtkIdTypeArray(safe_cells))
+    offsets = _vtk.vtk_to_numpy(cell_array.GetOffsetsArray())
+    connectivity = _vtk.vtk_to_numpy(cell_array.GetConnectivityArray())
+    n_cells = offsets.size - 1
+
+    legacy_offsets = offsets[:-1] + np.arange(n_cells)
+    if offsets[-1] + n_cells != size or np.any(cells[legacy_offsets] != np.diff(offsets)):
+        raise ValueError('Invalid legacy cell array.  The size of the last cell '
+                         'exceeds the length of the array or a cell size is negative.')
+
+    # restore the point ids that were clipped
+    n_previous_cells = np.searchsorted(legacy_offsets, clipped, side='right')
+    connectivity[clipped - n_previous_cells] = cells[clipped]
+    return offsets, connectivity
+
+
 def generate_cell_offsets_loop(cells, cell_types):
     """Create cell offsets that are required by VTK < 9 versions.
 
@@ -121,7 +227,7 @@ def generate_cell_offsets_loop(cells, cell_types):
     the vtk unstructured grid constructor. The offsets are
     automatically generated from the data. This function will generate
     the cell offset in an iterative fashion, usable also for dynamic
-    sized cells.
+    sized cells.  With VTK 9 the iteration runs in compiled code.
 
     Parameters
     ----------
@@ -143,21 +249,29 @@ def generate_cell_offsets_loop(cells, cell_types):
     if (not np.issubdtype(cells.dtype, np.integer) or not np.issubdtype(cell_types.dtype, np.integer)):
         raise ValueError("The cells and cell-type arrays must have an integral data-type")
 
-    offsets = np.zeros(shape=[cell_types.size], dtype=np.int64)
+    if not _vtk.VTK9:  # pragma: no cover
+        offsets = np.zeros(shape=[cell_types.size], dtype=np.int64)
 
-    current_cell_pos = 0
-    for cell_i, cell_t in enumerate(cell_types):
-        if current_cell_pos >= cells.size:
-            raise ValueError("Cell types and cell array are inconsistent. Got %d values left after reading all types" % (cell_types.size - current_cell_pos))
+        current_cell_pos = 0
+        for cell_i, cell_t in enumerate(cell_types):
+            if current_cell_pos >= cells.size:
+                raise ValueError("Cell types and cell array are inconsistent. Got %d values left after reading all types" % (cell_types.size - current_cell_pos))
 
-        cell_size = cells[current_cell_pos]
-        offsets[cell_i] = current_cell_pos
-        current_cell_pos += cell_size+1
+            cell_size = cells[current_cell_pos]
+            offsets[cell_i] = current_cell_pos
+            current_cell_pos += cell_size+1
 
-    if current_cell_pos != cells.size:
-        raise ValueError("Cell types and cell array are inconsistent. Got %d values left after reading all types" % (cell_types.size - current_cell_pos))
+        if current_cell_pos != cells.size:
+            raise ValueError("Cell types and cell array are inconsistent. Got %d values left after reading all types" % (cell_types.size - current_cell_pos))
 
-    return offsets
+        return offsets
+
+    offsets, _ = _legacy_cell_offsets(cells)
+    n_cells = offsets.size - 1
+    if n_cells != cell_types.size:
+        raise ValueError("Cell types and cell array are inconsistent. Got %d cell types "
+                         "for %d cells" % (cell_types.size, n_cells))
+    return (offsets[:-1] + np.arange(n_cells)).astype(np.int64, copy=False)
 
 
 def generate_cell_offsets(cells, cell_types):
@@ -184,22 +298,20 @@ def generate_cell_offsets(cells, cell_types):
     ValueError
         If cell types and cell arrays are inconsistent, or have wrong size/dtype
     """
-    from .cell_type_helper import enum_cell_type_nr_points_map
-
     if (not np.issubdtype(cells.dtype, np.integer) or not np.issubdtype(cell_types.dtype, np.integer)):
         raise ValueError("The cells and cell-type arrays must have an integral data-type")
-    
-    try:
-        cell_sizes = np.array([enum_cell_type_nr_points_map[cell_t] for cell_t in cell_types], dtype=np.int32)
-    except KeyError as err:
-        return generate_cell_offsets_loop(cells, cell_types) #Unknown requested cell type present
 
-    if np.any(cell_sizes == 0):
+    table = _cell_size_table()
+    if cell_types.size and (cell_types.min() < 0 or cell_types.max() >= table.size):
+        return generate_cell_offsets_loop(cells, cell_types)  # Unknown requested cell type present
+
+    cell_sizes = table[cell_types]
+    if np.any(cell_sizes < 0):
         return generate_cell_offsets_loop(cells, cell_types)
 
     cell_sizes_cum = np.cumsum(cell_sizes+1)
 
-    if cell_sizes_cum[-1] != cells.size:
+    if cell_sizes_cum.size and cell_sizes_cum[-1] != cells.size:
         raise ValueError("Cell types and cell array are inconsistent. Expected a cell array of length %d according to the cell types" % (cell_sizes_cum[-1]))
 
     offsets = np.concatenate([[0], cell_sizes_cum])[:-1]
@@ -207,6 +319,138 @@ def generate_cell_offsets(cells, cell_types):
     return offsets
 
 
+def legacy_to_offsets_connectivity(cells):
+    """Convert a legacy cell array to VTK 9 offsets and connectivity arrays.
+
+    Parameters
+    ----------
+    cells : np.ndarray (int)
+        Cell array in the legacy VTK layout, e.g.
+        ``[n0, p0_0, ..., p0_n, n1, p1_0, ..., p1_n, ...]``.
+
+    Returns
+    -------
+    offsets : np.ndarray (int)
+        Offsets of each cell within ``connectivity`` followed by the
+        length of ``connectivity``, i.e. one more value than the
+        number of cells.
+
+    connectivity : np.ndarray (int)
+        Point ids of all cells.
+
+    Raises
+    ------
+    ValueError
+        If ``cells`` is not a valid legacy cell array.
+
+    Examples
+    --------
+    >>> from pyvista.utilities.cells import legacy_to_offsets_connectivity
+    >>> offsets, connectivity = legacy_to_offsets_connectivity([3, 0, 1, 2, 4, 1, 2, 3, 4])
+    >>> offsets
+    array([0, 3, 7])
+    >>> connectivity
+    array([0, 1, 2, 1, 2, 3, 4])
+
+    """
+    cells = np.asarray(cells)
+    if not np.issubdtype(cells.dtype, np.integer):
+        raise ValueError("The cells array must have an integral data-type")
+    if not _vtk.VTK9:  # pragma: no cover
+        offsets = generate_cell_offsets_loop(cells, np.empty(ncells_from_cells(cells),
+                                                             dtype=np.uint8))
+        return offsets_from_legacy_offsets(cells, offsets)
+    return _legacy_cell_offsets(cells)
+
+
+def offsets_from_legacy_offsets(cells, legacy_offsets):
+    """Convert a legacy cell array with known cell locations to VTK 9 arrays.
+
+    Parameters
+    ----------
+    cells : np.ndarray (int)
+        Cell array in the legacy VTK layout.
+
+    legacy_offsets : np.ndarray (int)
+        Location of each cell within ``cells`` as returned by
+        :func:`generate_cell_offsets`.
+
+    Returns
+    -------
+    offsets : np.ndarray (int)
+        Offsets of each cell within ``connectivity`` followed by the
+        length of ``connectivity``.
+
+    connectivity : np.ndarray (int)
+        Point ids of all cells.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pyvista.utilities.cells import offsets_from_legacy_offsets
+    >>> cells = np.array([3, 0, 1, 2, 3, 2, 3, 4])
+    >>> offsets, connectivity = offsets_from_legacy_offsets(cells, [0, 4])
+    >>> offsets
+    array([0, 3, 6])
+
+    """
+    cells = np.asarray(cells).ravel()
+    legacy_offsets = np.asarray(legacy_offsets)
+    n_cells = legacy_offsets.size
+    mask = np.ones(cells.size, dtype=bool)
+    mask[legacy_offsets] = False
+    connectivity = cells[mask]
+    offsets = np.empty(n_cells + 1, dtype=legacy_offsets.dtype)
+    offsets[:-1] = legacy_offsets - np.arange(n_cells)
+    offsets[-1] = connectivity.size
+    return offsets, connectivity
+
+
+def offsets_connectivity_to_legacy(offsets, connectivity):
+    """Convert VTK 9 offsets and connectivity arrays to a legacy cell array.
+
+    Parameters
+    ----------
+    offsets : np.ndarray (int)
+        Offsets of each cell within ``connectivity`` followed by the
+        length of ``connectivity``.
+
+    connectivity : np.ndarray (int)
+        Point ids of all cells.
+
+    Returns
+    -------
+    np.ndarray (int)
+        Cell array in the legacy VTK layout.
+
+    Examples
+    --------
+    >>> from pyvista.utilities.cells import offsets_connectivity_to_legacy
+    >>> offsets_connectivity_to_legacy([0, 3, 7], [0, 1, 2, 1, 2, 3, 4])
+    array([3, 0, 1, 2, 4, 1, 2, 3, 4])
+
+    """
+    offsets = np.asarray(offsets)
+    connectivity = np.asarray(connectivity)
+    if offsets.ndim != 1 or not offsets.size or offsets[0] != 0 \
+       or offsets[-1] != connectivity.size:
+        raise ValueError('``offsets`` must start with 0 and end with the length '
+                         'of ``connectivity``.')
+    sizes = np.diff(offsets)
+    if np.any(sizes < 0):
+        raise ValueError('``offsets`` must be monotonically increasing.')
+
+    n_cells = sizes.size
+    dtype = np.result_type(offsets.dtype, connectivity.dtype)
+    cells = np.empty(connectivity.size + n_cells, dtype=dtype)
+    legacy_offsets = offsets[:-1] + np.arange(n_cells)
+    mask = np.ones(cells.size, dtype=bool)
+    mask[legacy_offsets] = False
+    cells[legacy_offsets] = sizes
+    cells[mask] = connectivity
+    return cells
+
+
 def create_mixed_cells(mixed_cell_dict, nr_points=None):
     """Generate the required cell arrays for the creation of a pyvista.UnstructuredGrid from a cell dictionary.
 
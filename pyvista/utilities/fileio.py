@@ -1,13 +1,33 @@
 """Contains a dictionary that maps file extensions to VTK readers."""
 
+import concurrent.futures
+import json
 import pathlib
 import os
+import struct
+import time
 import warnings
+from xml.etree import ElementTree
 
 import numpy as np
 
 import pyvista
 from pyvista import _vtk
+from .cells import (CellArray, legacy_to_offsets_connectivity, numpy_to_cell_array,
+                    numpy_to_idarr, offsets_connectivity_to_legacy,
+                    offsets_from_legacy_offsets)
+
+# Extension, magic number and buffer alignment of the raw buffer format
+RAW_EXTENSION = '.pvraw'
+_RAW_MAGIC = b'PVRAW\x00\x00\x01'
+_RAW_ALIGNMENT = 64
+
+# Header extension of the partitioned XML formats mapped to the extension
+# of their pieces
+PARTITIONED_EXTENSIONS = {'.pvtu': '.vtu', '.pvtp': '.vtp'}
+
+_PARTITIONED_WRITERS = {'.pvtu': _vtk.vtkXMLPUnstructuredGridWriter,
+                        '.pvtp': _vtk.vtkXMLPPolyDataWriter}
 
 READERS = {
     # Standard dataset readers:
@@ -23,6 +43,7 @@ READERS = {
     '.obj': _vtk.vtkOBJReader,
     '.stl': _vtk.vtkSTLReader,
     '.vtp': _vtk.vtkXMLPolyDataReader,
+    '.pvtp': _vtk.vtkXMLPPolyDataReader,
     '.vts': _vtk.vtkXMLStructuredGridReader,
     '.vtm': _vtk.vtkXMLMultiBlockDataReader,
     '.vtmb': _vtk.vtkXMLMultiBlockDataReader,
@@ -65,6 +86,17 @@ READERS = {
     '.inp': _vtk.vtkAVSucdReader,
 }
 
+# Methods of VTK readers counting, naming and enabling their point and
+# cell arrays, first the generic ones and then the Exodus ones
+_ARRAY_STATUS_METHODS = {
+    'point': [('GetNumberOfPointArrays', 'GetPointArrayName', 'SetPointArrayStatus'),
+              ('GetNumberOfPointResultArrays', 'GetPointResultArrayName',
+               'SetPointResultArrayStatus')],
+    'cell': [('GetNumberOfCellArrays', 'GetCellArrayName', 'SetCellArrayStatus'),
+             ('GetNumberOfElementResultArrays', 'GetElementResultArrayName',
+              'SetElementResultArrayStatus')],
+}
+
 VTK_MAJOR = _vtk.vtkVersion().GetVTKMajorVersion()
 VTK_MINOR = _vtk.vtkVersion().GetVTKMinorVersion()
 
@@ -110,7 +142,139 @@ def set_vtkwriter_mode(vtk_writer, use_binary=True):
     return vtk_writer
 
 
-def standard_reader_routine(reader, filename, attrs=None):
+def set_vtkwriter_compression(vtk_writer, compression='zlib'):
+    """Set the compressor of a vtk XML writer.
+
+    Parameters
+    ----------
+    vtk_writer : vtk.vtkXMLWriter
+        XML writer to configure.
+
+    compression : str, optional
+        One of ``'zlib'``, ``'lz4'``, ``'lzma'`` or ``None`` to
+        disable compression.
+
+    """
+    if compression is None:
+        compression = 'none'
+    setters = {'none': vtk_writer.SetCompressorTypeToNone,
+               'zlib': vtk_writer.SetCompressorTypeToZLib,
+               'lz4': vtk_writer.SetCompressorTypeToLZ4,
+               'lzma': vtk_writer.SetCompressorTypeToLZMA}
+    try:
+        setter = setters[str(compression).lower()]
+    except KeyError:
+        raise ValueError(f'Invalid compression "{compression}".  '
+                         f'Must be one of {list(setters)} or None.') from None
+    setter()
+    return vtk_writer
+
+
+def set_pickle_format(format, compression='zlib'):
+    """Set the format used to pickle pyvista objects.
+
+    Parameters
+    ----------
+    format : str
+        Serialization format.  One of:
+
+        * ``'buffers'`` - Raw NumPy buffers of the points, cells and
+          every data array.  This is the fastest format and supports
+          zero-copy pickling with protocol 5 out-of-band buffers.
+          Objects that cannot be represented as buffers fall back to
+          ``'xml'``.
+        * ``'xml'`` - Binary VTK XML, optionally compressed.
+        * ``'legacy'`` - ASCII legacy VTK format.
+
+    compression : str, optional
+        Compression used by the ``'xml'`` format.  One of ``'zlib'``,
+        ``'lz4'``, ``'lzma'`` or ``None``.
+
+    Examples
+    --------
+    Pickle a mesh using protocol 5 and out-of-band buffers.
+
+    >>> import pickle
+    >>> import pyvista
+    >>> pyvista.set_pickle_format('buffers')
+    >>> mesh = pyvista.Sphere()
+    >>> buffers = []
+    >>> data = pickle.dumps(mesh, protocol=5, buffer_callback=buffers.append)  # doctest:+SKIP
+    >>> mesh_2 = pickle.loads(data, buffers=buffers)  # doctest:+SKIP
+
+    Use compressed XML instead.
+
+    >>> pyvista.set_pickle_format('xml', compression='lz4')
+    >>> pyvista.set_pickle_format('buffers')
+
+    """
+    format = format.lower()
+    if format not in ('buffers', 'xml', 'legacy'):
+        raise ValueError(f'Unsupported pickle format "{format}".  '
+                         'Must be one of "buffers", "xml" or "legacy".')
+    # validate the compressor
+    set_vtkwriter_compression(_vtk.vtkXMLPolyDataWriter(), compression)
+    pyvista.PICKLE_FORMAT = format
+    pyvista.PICKLE_COMPRESSION = compression
+
+
+def _array_status_methods(reader, association):
+    """Return the methods of a reader handling ``'point'`` or ``'cell'`` arrays."""
+    for names in _ARRAY_STATUS_METHODS[association]:
+        if all(hasattr(reader, name) for name in names):
+            return [getattr(reader, name) for name in names]
+    return None
+
+
+def _reader_array_names(reader, association):
+    """Return the names of the point or cell arrays a reader can read.
+
+    ``None`` is returned when the reader cannot list its arrays.  The
+    information of the reader must have been updated.
+
+    """
+    methods = _array_status_methods(reader, association)
+    if methods is None:
+        return None
+    count, get_name, _ = methods
+    return [get_name(i) for i in range(count())]
+
+
+def _select_reader_arrays(reader, point_arrays=None, cell_arrays=None):
+    """Enable only the given point and cell arrays of a reader.
+
+    ``None`` keeps the current selection.  The information of the
+    reader must have been updated.
+
+    """
+    for association, names in (('point', point_arrays), ('cell', cell_arrays)):
+        if names is None:
+            continue
+        if isinstance(names, str):
+            names = [names]
+        available = _reader_array_names(reader, association)
+        if available is None:
+            raise TypeError(f'`{reader.GetClassName()}` does not support selecting '
+                            f'{association} arrays.')
+        missing = [name for name in names if name not in available]
+        if missing:
+            raise KeyError(f'{association.capitalize()} arrays {missing} are not in the '
+                           f'file.  Available arrays are {available}.')
+        set_status = _array_status_methods(reader, association)[2]
+        for name in available:
+            set_status(name, int(name in names))
+
+
+def _set_reader_filename(reader, filename):
+    """Set the file read by a reader, using the case file name when needed."""
+    try:
+        reader.SetCaseFileName(filename)
+    except AttributeError:
+        reader.SetFileName(filename)
+
+
+def standard_reader_routine(reader, filename, attrs=None, point_arrays=None,
+                            cell_arrays=None):
     """Use a given reader in the common VTK reading pipeline routine.
 
     The reader must come from the ``READERS`` mapping.
@@ -129,6 +293,14 @@ def standard_reader_routine(reader, filename, attrs=None):
         arguments passed to those calls. If you do not have any
         attributes to call, pass ``None`` as the value.
 
+    point_arrays : sequence of str, optional
+        Names of the only point arrays to read.  Requires a reader
+        able to select its arrays.
+
+    cell_arrays : sequence of str, optional
+        Names of the only cell arrays to read.  Requires a reader
+        able to select its arrays.
+
     """
     observer = pyvista.utilities.errors.Observer()
     observer.observe(reader)
@@ -138,10 +310,7 @@ def standard_reader_routine(reader, filename, attrs=None):
     if not isinstance(attrs, dict):
         raise TypeError('Attributes must be a dictionary of name and arguments.')
     if filename is not None:
-        try:
-            reader.SetCaseFileName(filename)
-        except AttributeError:
-            reader.SetFileName(filename)
+        _set_reader_filename(reader, filename)
     # Apply any attributes listed
     for name, args in attrs.items():
         attr = getattr(reader, name)
@@ -151,6 +320,9 @@ def standard_reader_routine(reader, filename, attrs=None):
             attr(*args)
         else:
             attr()
+    if point_arrays is not None or cell_arrays is not None:
+        reader.UpdateInformation()
+        _select_reader_arrays(reader, point_arrays, cell_arrays)
     # Perform the read
     reader.Update()
 
@@ -164,6 +336,11 @@ def standard_reader_routine(reader, filename, attrs=None):
     return data
 
 
+def _read_bounds(filename):
+    """Return the bounds of a dataset file while reading as little as possible."""
+    return inspect(filename)['bounds']
+
+
 def read_legacy(filename):
     """Use VTK's legacy reader to read a file."""
     reader = _vtk.vtkDataSetReader()
@@ -181,7 +358,8 @@ def read_legacy(filename):
     return output
 
 
-def read(filename, attrs=None, force_ext=None, file_format=None):
+def read(filename, attrs=None, force_ext=None, file_format=None, lazy=False,
+         point_arrays=None, cell_arrays=None):
     """Read any VTK file.
 
     It will figure out what reader to use then wrap the VTK object for
@@ -192,7 +370,8 @@ def read(filename, attrs=None, force_ext=None, file_format=None):
     filename : str
         The string path to the file to read. If a list of files is
         given, a :class:`pyvista.MultiBlock` dataset is returned with
-        each file being a separate block in the dataset.
+        each file being a separate block in the dataset.  Use
+        :func:`pyvista.read_many` to read many files concurrently.
 
     attrs : dict, optional
         A dictionary of attributes to call on the reader. Keys of
@@ -208,6 +387,22 @@ def read(filename, attrs=None, force_ext=None, file_format=None):
     file_format : str, optional
         Format of file to read with meshio.
 
+    lazy : bool, optional
+        Return a :class:`pyvista.LazyMultiBlock` that reads each
+        block only when it is accessed.  Only supported for ``.vtm``
+        and ``.vtmb`` files and lists of files.
+
+    point_arrays : sequence of str, optional
+        Names of the only point arrays to read.  The other point
+        arrays are never loaded.  Supported by the readers able to
+        select their arrays, such as the XML, OpenFOAM, EnSight and
+        Exodus readers.  Use :func:`pyvista.inspect` to list the
+        arrays of a file.
+
+    cell_arrays : sequence of str, optional
+        Names of the only cell arrays to read.  Supported by the same
+        readers as ``point_arrays``.
+
     Examples
     --------
     Load an example mesh.
@@ -224,10 +419,25 @@ def read(filename, attrs=None, force_ext=None, file_format=None):
     Load a meshio file.
 
     >>> mesh = pyvista.read("mesh.obj")  # doctest:+SKIP
+
+    Load only the pressure and velocity of a large file.
+
+    >>> mesh = pyvista.read('flow.vtu', point_arrays=['p', 'U'], cell_arrays=[])  # doctest:+SKIP
     """
     if file_format is not None and force_ext is not None:
         raise ValueError('Only one of `file_format` and `force_ext` may be specified.')
 
+    if lazy:
+        if not isinstance(filename, (list, tuple)) and \
+           _get_ext_force(filename, force_ext) not in ('.vtm', '.vtmb'):
+            raise ValueError('Lazy reading requires a `.vtm` or `.vtmb` file or '
+                             'a list of files.')
+        if attrs is not None or file_format is not None or \
+           point_arrays is not None or cell_arrays is not None:
+            raise ValueError('`attrs`, `file_format`, `point_arrays` and `cell_arrays` '
+                             'are not supported when reading lazily.')
+        return pyvista.LazyMultiBlock(filename)
+
     if isinstance(filename, (list, tuple)):
         multi = pyvista.MultiBlock()
         for each in filename:
@@ -236,24 +446,39 @@ def read(filename, attrs=None, force_ext=None, file_format=None):
             else:
                 name = None
             multi[-1, name] = read(each, attrs=attrs,
-                                   file_format=file_format)
+                                   file_format=file_format,
+                                   point_arrays=point_arrays,
+                                   cell_arrays=cell_arrays)
         return multi
     filename = os.path.abspath(os.path.expanduser(str(filename)))
     if not os.path.isfile(filename):
         raise FileNotFoundError(f'File ({filename}) not found')
 
     ext = _get_ext_force(filename, force_ext)
+    select_arrays = point_arrays is not None or cell_arrays is not None
 
     # Read file using meshio.read if file_format is present
     if file_format:
+        if select_arrays:
+            raise TypeError('Selecting arrays is not supported when reading with meshio.')
         return read_meshio(filename, file_format)
 
     # From the extension, decide which reader to use
     if attrs is not None:
         reader = get_reader(filename, force_ext=ext)
-        return standard_reader_routine(reader, filename, attrs=attrs)
+        return standard_reader_routine(reader, filename, attrs=attrs,
+                                       point_arrays=point_arrays,
+                                       cell_arrays=cell_arrays)
     elif ext in ['.e', '.exo']:
-        return read_exodus(filename)
+        return read_exodus(filename, point_arrays=point_arrays, cell_arrays=cell_arrays)
+    elif select_arrays:
+        if ext not in READERS:
+            raise TypeError(f'Selecting arrays is not supported for "{ext}" files.')
+        reader = get_reader(filename, force_ext=ext)
+        return standard_reader_routine(reader, filename, point_arrays=point_arrays,
+                                       cell_arrays=cell_arrays)
+    elif ext == RAW_EXTENSION:
+        return read_raw(filename)
     elif ext in ['.vtk']:
         # Attempt to use the legacy reader...
         return read_legacy(filename)
@@ -282,6 +507,297 @@ def read(filename, attrs=None, force_ext=None, file_format=None):
     raise IOError("This file was not able to be automatically read by pyvista.")
 
 
+def _iter_datasets(data):
+    """Yield the datasets of a dataset or of a nested composite dataset."""
+    if isinstance(data, pyvista.MultiBlock):
+        for block in data:
+            if block is not None:
+                yield from _iter_datasets(block)
+    else:
+        yield data
+
+
+def _reader_array_info(reader, association):
+    """Return the type and number of components of the arrays of a reader.
+
+    Both are ``None`` when the reader does not report them before
+    reading.  ``None`` is returned when the reader cannot list its
+    arrays.
+
+    """
+    names = _reader_array_names(reader, association)
+    if names is None:
+        return None
+    arrays = {name: {'dtype': None, 'n_components': None} for name in names}
+
+    if association == 'point':
+        key = _vtk.vtkDataObject.POINT_DATA_VECTOR()
+    else:
+        key = _vtk.vtkDataObject.CELL_DATA_VECTOR()
+    out_info = reader.GetOutputInformation(0)
+    fields = out_info.Get(key) if out_info.Has(key) else None
+    if fields is not None:
+        for i in range(fields.GetNumberOfInformationObjects()):
+            field = fields.GetInformationObject(i)
+            name = field.Get(_vtk.vtkDataObject.FIELD_NAME())
+            if name not in arrays:
+                continue
+            try:
+                dtype = np.dtype(_vtk.get_numpy_array_type(
+                    field.Get(_vtk.vtkDataObject.FIELD_ARRAY_TYPE())))
+            except KeyError:  # string arrays
+                dtype = None
+            arrays[name] = {'dtype': dtype, 'n_components':
+                            field.Get(_vtk.vtkDataObject.FIELD_NUMBER_OF_COMPONENTS())}
+    return arrays
+
+
+def _mesh_array_info(datasets, association):
+    """Return the type and number of components of the arrays of datasets."""
+    arrays = {}
+    for dataset in datasets:
+        data = dataset.point_arrays if association == 'point' else dataset.cell_arrays
+        for name in data.keys():
+            array = data[name]
+            arrays[name] = {'dtype': array.dtype,
+                            'n_components': 1 if array.ndim == 1 else array.shape[1]}
+    return arrays
+
+
+def inspect(filename, force_ext=None):
+    """Describe a dataset file without reading its point and cell arrays.
+
+    The arrays of the file are listed from its metadata, so only the
+    geometry is read to compute its size and bounds.  The size and
+    bounds of XML image data are computed from the header of the file
+    alone.  Files whose reader cannot list its arrays, such as legacy
+    ``.vtk`` and meshio files, are fully read.
+
+    Parameters
+    ----------
+    filename : str, pathlib.Path
+        File to describe.
+
+    force_ext : str, optional
+        Choose the reader by this extension instead of the actual
+        extension of the file.
+
+    Returns
+    -------
+    dict
+        Description of the file with the keys:
+
+        * ``'type'``: name of the PyVista class of the dataset.
+        * ``'n_points'``: number of points, summed over all blocks.
+        * ``'n_cells'``: number of cells, summed over all blocks.
+        * ``'bounds'``: bounds of the dataset.
+        * ``'point_arrays'`` and ``'cell_arrays'``: dictionaries
+          mapping the name of each array to a dictionary with its
+          ``'dtype'`` and ``'n_components'``, which are ``None`` when
+          the reader does not report them before reading.
+
+    Examples
+    --------
+    List the arrays of a file and read only one of them.
+
+    >>> import pyvista
+    >>> from pyvista import examples
+    >>> info = pyvista.inspect(examples.channelsfile)
+    >>> info['type'], info['n_points'], info['n_cells']
+    ('UniformGrid', 6363101, 6250000)
+    >>> list(info['cell_arrays'])
+    ['facies']
+    >>> mesh = pyvista.read(examples.channelsfile, cell_arrays=['facies'])
+
+    """
+    filename = _process_filename(filename)
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f'File ({filename}) not found')
+    ext = _get_ext_force(filename, force_ext)
+
+    reader = None
+    if ext in ('.e', '.exo'):
+        reader = _exodus_reader(filename)
+    elif ext in READERS:
+        reader = get_reader(filename, force_ext=ext)
+        _set_reader_filename(reader, filename)
+        reader.UpdateInformation()
+
+    point_arrays = cell_arrays = None
+    if reader is not None:
+        point_arrays = _reader_array_info(reader, 'point')
+        cell_arrays = _reader_array_info(reader, 'cell')
+
+    if point_arrays is None or cell_arrays is None:
+        data = read(filename, force_ext=force_ext)
+        datasets = list(_iter_datasets(data))
+        point_arrays = _mesh_array_info(datasets, 'point')
+        cell_arrays = _mesh_array_info(datasets, 'cell')
+    elif isinstance(reader, _vtk.vtkXMLImageDataReader):
+        info = reader.GetOutputInformation(0)
+        extent = info.Get(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT())
+        origin = info.Get(_vtk.vtkDataObject.ORIGIN())
+        spacing = info.Get(_vtk.vtkDataObject.SPACING())
+        bounds = []
+        for axis in range(3):
+            bounds.append(origin[axis] + extent[2*axis]*spacing[axis])
+            bounds.append(origin[axis] + extent[2*axis + 1]*spacing[axis])
+        dims = [extent[2*axis + 1] - extent[2*axis] + 1 for axis in range(3)]
+        return {'type': 'UniformGrid',
+                'n_points': int(np.prod(dims)),
+                'n_cells': int(np.prod([max(dim - 1, 1) for dim in dims])),
+                'bounds': bounds,
+                'point_arrays': point_arrays,
+                'cell_arrays': cell_arrays}
+    else:
+        _select_reader_arrays(reader, [], [])
+        reader.Update()
+        data = pyvista.wrap(reader.GetOutputDataObject(0))
+        datasets = list(_iter_datasets(data))
+
+    return {'type': type(data).__name__,
+            'n_points': sum(dataset.n_points for dataset in datasets),
+            'n_cells': sum(dataset.n_cells for dataset in datasets),
+            'bounds': list(data.bounds),
+            'point_arrays': point_arrays,
+            'cell_arrays': cell_arrays}
+
+
+def _timed_read(filename, kwargs):
+    """Read a file and return the mesh and the time spent reading it."""
+    tstart = time.perf_counter()
+    mesh = read(filename, **kwargs)
+    return mesh, time.perf_counter() - tstart
+
+
+def _check_executor(executor):
+    """Raise a ``ValueError`` if an executor argument is invalid."""
+    if executor not in (None, 'thread', 'process') and \
+       not isinstance(executor, concurrent.futures.Executor):
+        raise ValueError(f'Invalid executor "{executor}".  Must be None, "thread", '
+                         '"process" or a concurrent.futures.Executor.')
+
+
+def _get_executor(executor, max_workers):
+    """Return the executor to submit to and the pool to shut down, if any."""
+    if executor == 'thread':
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers)
+        return pool, pool
+    if executor == 'process':
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers)
+        return pool, pool
+    return executor, None
+
+
+def _iter_read(filenames, executor, max_workers, kwargs):
+    """Yield the index, mesh and read time of each file as it is read."""
+    if executor is None:
+        for i, filename in enumerate(filenames):
+            yield (i, *_timed_read(filename, kwargs))
+        return
+
+    executor, pool = _get_executor(executor, max_workers)
+    futures = {}
+    try:
+        for i, filename in enumerate(filenames):
+            futures[executor.submit(_timed_read, filename, kwargs)] = i
+        for future in concurrent.futures.as_completed(futures):
+            yield (futures[future], *future.result())
+    finally:
+        for future in futures:
+            future.cancel()
+        if pool is not None:
+            pool.shutdown()
+
+
+def read_many(filenames, executor=None, max_workers=None, stream=False,
+              return_timings=False, **kwargs):
+    """Read many files, optionally concurrently.
+
+    Files are read one after the other by default.  A thread pool can
+    overlap the latency of slow storage, such as network file systems,
+    and a process pool can also parse several files at once on
+    machines with several cores.
+
+    Parameters
+    ----------
+    filenames : sequence of str
+        Files to read.
+
+    executor : str or concurrent.futures.Executor, optional
+        How the files are read.  ``None`` (default) reads them one
+        after the other, ``'thread'`` in a thread pool and
+        ``'process'`` in a process pool.  An existing executor may
+        also be given.
+
+    max_workers : int, optional
+        Maximum number of workers of the thread or process pool.
+        Defaults to the default of the pool.
+
+    stream : bool, optional
+        Return a generator yielding ``(index, mesh, seconds)`` for each
+        file as soon as it has been read, where ``index`` is the
+        position of the file in ``filenames`` and ``seconds`` the time
+        spent reading it.
+
+    return_timings : bool, optional
+        Also return the time spent reading each file.  Ignored when
+        ``stream`` is ``True``.
+
+    **kwargs : dict, optional
+        Keyword arguments passed to :func:`pyvista.read` for each file,
+        such as ``attrs``, ``force_ext`` or ``file_format``.
+
+    Returns
+    -------
+    pyvista.MultiBlock or generator
+        The meshes in the order of ``filenames`` with each block named
+        after the base name of its file, or a generator when
+        ``stream`` is ``True``.
+
+    list
+        Seconds spent reading each file.  Only returned when
+        ``return_timings`` is ``True``.
+
+    Examples
+    --------
+    Read a few example files.
+
+    >>> import pyvista
+    >>> from pyvista import examples
+    >>> files = [examples.antfile, examples.planefile, examples.hexbeamfile]
+    >>> blocks = pyvista.read_many(files)
+    >>> blocks.keys()
+    ['ant.ply', 'airplane.ply', 'hexbeam.vtk']
+
+    Process the meshes as they are read by a thread pool.
+
+    >>> for index, mesh, seconds in pyvista.read_many(files, executor='thread',
+    ...                                               stream=True):
+    ...     print(f'{files[index]} read in {seconds:.3f} seconds')  # doctest:+SKIP
+
+    """
+    _check_executor(executor)
+    filenames = [str(filename) for filename in filenames]
+
+    results = _iter_read(filenames, executor, max_workers, kwargs)
+    if stream:
+        return results
+
+    meshes = [None] * len(filenames)
+    timings = [None] * len(filenames)
+    for i, mesh, seconds in results:
+        meshes[i] = mesh
+        timings[i] = seconds
+
+    multi = pyvista.MultiBlock()
+    for filename, mesh in zip(filenames, meshes):
+        multi[-1, os.path.basename(filename)] = mesh
+    if return_timings:
+        return multi, timings
+    return multi
+
+
 def read_texture(filename, attrs=None):
     """Load a ``vtkTexture`` from an image file."""
     filename = os.path.abspath(os.path.expanduser(filename))
@@ -299,13 +815,29 @@ def read_texture(filename, attrs=None):
     return pyvista.Texture(imageio.imread(filename))
 
 
+def _exodus_reader(filename):
+    """Return an Exodus reader with updated information."""
+    # lazy import here to avoid loading module on import pyvista
+    try:
+        from vtkmodules.vtkIOExodus import vtkExodusIIReader
+    except ImportError:
+        from vtk import vtkExodusIIReader
+
+    reader = vtkExodusIIReader()
+    reader.SetFileName(filename)
+    reader.UpdateInformation()
+    return reader
+
+
 def read_exodus(filename,
                 animate_mode_shapes=True,
                 apply_displacements=True,
                 displacement_magnitude=1.0,
                 read_point_data=True,
                 read_cell_data=True,
-                enabled_sidesets=None):
+                enabled_sidesets=None,
+                point_arrays=None,
+                cell_arrays=None):
     """Read an ExodusII file (``'.e'`` or ``'.exo'``).
 
     Parameters
@@ -338,6 +870,14 @@ def read_exodus(filename,
         The name of the array that store the mapping from side set
         cells back to the global id of the elements they bound.
 
+    point_arrays : sequence of str, optional
+        Names of the only point arrays to read.  Overrides
+        ``read_point_data``.
+
+    cell_arrays : sequence of str, optional
+        Names of the only cell arrays to read.  Overrides
+        ``read_cell_data``.
+
     Examples
     --------
     >>> import pyvista as pv
@@ -345,24 +885,18 @@ def read_exodus(filename,
     >>> data = read_exodus('mymesh.exo')  # doctest:+SKIP
 
     """
-    # lazy import here to avoid loading module on import pyvista
-    try:
-        from vtkmodules.vtkIOExodus import vtkExodusIIReader
-    except ImportError:
-        from vtk import vtkExodusIIReader
-
-    reader = vtkExodusIIReader()
-    reader.SetFileName(filename)
-    reader.UpdateInformation()
+    reader = _exodus_reader(filename)
     reader.SetAnimateModeShapes(animate_mode_shapes)
     reader.SetApplyDisplacements(apply_displacements)
     reader.SetDisplacementMagnitude(displacement_magnitude)
 
     if read_point_data:  # read in all point data variables
-        reader.SetAllArrayStatus(vtkExodusIIReader.NODAL, 1)
+        reader.SetAllArrayStatus(reader.NODAL, 1)
 
     if read_cell_data:  # read in all cell data variables
-        reader.SetAllArrayStatus(vtkExodusIIReader.ELEM_BLOCK, 1)
+        reader.SetAllArrayStatus(reader.ELEM_BLOCK, 1)
+
+    _select_reader_arrays(reader, point_arrays, cell_arrays)
 
     if enabled_sidesets is None:
         enabled_sidesets = list(range(reader.GetNumberOfSideSetArrays()))
@@ -441,28 +975,61 @@ def read_plot3d(filename, q_filenames=(), auto_detect=True, attrs=None):
     return standard_reader_routine(reader, filename=None, attrs=attrs)
 
 
+def _polyhedron_faces(faces, location):
+    """Return the faces of the polyhedron at ``location`` in the VTK face stream."""
+    n_faces = faces[location]
+    cell_faces = []
+    pos = location + 1
+    for _ in range(n_faces):
+        n_points = faces[pos]
+        cell_faces.append(faces[pos + 1:pos + 1 + n_points])
+        pos += n_points + 1
+    return cell_faces
+
+
 def from_meshio(mesh):
     """Convert a ``meshio`` mesh instance to a PyVista mesh."""
-    from meshio.vtk._vtk import (
-        meshio_to_vtk_type,
-        vtk_type_to_numnodes,
-    )
+    from meshio.vtk._vtk import meshio_to_vtk_type
 
-    # Extract cells from meshio.Mesh object
-    offset = []
-    cells = []
+    # Extract cells from meshio.Mesh object.  Each cell block has a
+    # single cell type and size, so the cells of a block are converted
+    # at once.
     cell_type = []
-    next_offset = 0
+    sizes = []
+    connectivity = []
+    faces = []
+    face_locations = []
+    n_faces = 0
     for c in mesh.cells:
-        vtk_type = meshio_to_vtk_type[c.type]
-        numnodes = vtk_type_to_numnodes[vtk_type]
-        cells.append(
-            np.hstack((np.full((len(c.data), 1), numnodes), c.data)).ravel()
-        )
-        cell_type += [vtk_type] * len(c.data)
-        if not _vtk.VTK9:
-            offset += [next_offset + i * (numnodes + 1) for i in range(len(c.data))]
-            next_offset = offset[-1] + numnodes + 1
+        if c.type.startswith('polyhedron'):
+            # polyhedra are stored as a list of faces for each cell
+            for cell in c.data:
+                stream = [len(cell)]
+                for face in cell:
+                    stream.append(len(face))
+                    stream.extend(face)
+                face_locations.append([n_faces])
+                faces.append(stream)
+                n_faces += len(stream)
+                point_ids = np.unique(np.concatenate(cell))
+                sizes.append([point_ids.size])
+                connectivity.append(point_ids)
+            cell_type.append(np.full(len(c.data), _vtk.VTK_POLYHEDRON, np.uint8))
+            continue
+
+        data = np.asarray(c.data)
+        type_name = 'polygon' if c.type.startswith('polygon') else c.type
+        cell_type.append(np.full(len(data), meshio_to_vtk_type[type_name], np.uint8))
+        sizes.append(np.full(len(data), data.shape[1]))
+        connectivity.append(data.ravel())
+        face_locations.append(np.full(len(data), -1))
+
+    cell_type = np.concatenate(cell_type) if cell_type else np.empty(0, np.uint8)
+    offsets = np.zeros(cell_type.size + 1, dtype=pyvista.ID_TYPE)
+    if sizes:
+        np.cumsum(np.concatenate(sizes), out=offsets[1:])
+    connectivity = (np.concatenate(connectivity).astype(pyvista.ID_TYPE, copy=False)
+                    if connectivity else np.empty(0, pyvista.ID_TYPE))
 
     # Extract cell data from meshio.Mesh object
     cell_data = {k: np.concatenate(v) for k, v in mesh.cell_data.items()}
@@ -472,18 +1039,25 @@ def from_meshio(mesh):
     if points.shape[1] == 2:
         points = np.hstack((points, np.zeros((len(points), 1))))
 
-    if _vtk.VTK9:
-        grid = pyvista.UnstructuredGrid(
-            np.concatenate(cells),
-            np.array(cell_type),
-            np.array(points, np.float64),
-        )
+    points = np.array(points, np.float64)
+    if faces:
+        # polyhedra must be set together with their faces
+        grid = pyvista.UnstructuredGrid()
+        grid.SetPoints(pyvista.vtk_points(points))
+        cells = offsets_connectivity_to_legacy(offsets, connectivity)
+        grid.SetCells(_vtk.numpy_to_vtk(cell_type, deep=True),
+                      CellArray(cells, cell_type.size),
+                      numpy_to_idarr(np.hstack(face_locations)),
+                      numpy_to_idarr(np.hstack(faces)))
+    elif _vtk.VTK9:
+        grid = pyvista.UnstructuredGrid(offsets=offsets, connectivity=connectivity,
+                                        celltypes=cell_type, points=points)
     else:
         grid = pyvista.UnstructuredGrid(
-            np.array(offset),
-            np.concatenate(cells),
-            np.array(cell_type),
-            np.array(points, np.float64),
+            offsets[:-1] + np.arange(cell_type.size),
+            offsets_connectivity_to_legacy(offsets, connectivity),
+            cell_type,
+            points,
         )
 
     # Set point data
@@ -530,10 +1104,12 @@ def save_meshio(filename, mesh, file_format=None, **kwargs):
     if not isinstance(mesh, pyvista.UnstructuredGrid):
         mesh = mesh.cast_to_unstructured_grid()
 
-    # Copy useful arrays to avoid repeated calls to properties
-    vtk_offset = mesh.offset
-    vtk_cells = mesh.cells
     vtk_cell_type = mesh.celltypes
+    if _vtk.VTK9:
+        vtk_offset = mesh.offset
+        vtk_connectivity = mesh.cell_connectivity
+    else:
+        vtk_offset, vtk_connectivity = offsets_from_legacy_offsets(mesh.cells, mesh.offset)
 
     # Check that meshio supports all cell types in input mesh
     pixel_voxel = {8, 11}       # Handle pixels and voxels
@@ -541,43 +1117,43 @@ def save_meshio(filename, mesh, file_format=None, **kwargs):
         if cell_type not in vtk_to_meshio_type.keys() and cell_type not in pixel_voxel:
             raise TypeError(f"meshio does not support VTK type {cell_type}.")
 
-    # Get cells
+    # Split the cells into blocks of consecutive cells sharing the same
+    # type and size, which keeps the order of the cells.  The cells of
+    # each block are then converted at once.
+    sizes = np.diff(vtk_offset)
+    breaks = np.flatnonzero((vtk_cell_type[1:] != vtk_cell_type[:-1]) |
+                            (sizes[1:] != sizes[:-1])) + 1
+    bounds = np.hstack(([0], breaks, [vtk_cell_type.size])) if vtk_cell_type.size else [0]
+
     cells = []
-    c = 0
-    for offset, cell_type in zip(vtk_offset, vtk_cell_type):
-        numnodes = vtk_cells[offset+c]
-        if _vtk.VTK9:  # must offset by cell count
-            cell = vtk_cells[offset+1+c:offset+1+c+numnodes]
-            c += 1
-        else:
-            cell = vtk_cells[offset+1:offset+1+numnodes]
-        cell = (
-            cell if cell_type not in pixel_voxel
-            else cell[[0, 1, 3, 2]] if cell_type == 8
-            else cell[[0, 1, 3, 2, 4, 5, 7, 6]]
-        )
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        cell_type = vtk_cell_type[start]
+        numnodes = sizes[start]
+        if cell_type == _vtk.VTK_POLYHEDRON:
+            # polyhedra are described by the list of their faces
+            faces = _vtk.vtk_to_numpy(mesh.GetFaces())
+            face_locations = _vtk.vtk_to_numpy(mesh.GetFaceLocations())
+            block = np.empty(stop - start, dtype=object)
+            for i, location in enumerate(face_locations[start:stop]):
+                block[i] = _polyhedron_faces(faces, location)
+            cells.append((f"polyhedron{numnodes}", block))
+            continue
+
+        block = vtk_connectivity[vtk_offset[start]:vtk_offset[stop]].reshape(-1, numnodes)
+        if cell_type == _vtk.VTK_PIXEL:
+            block = block[:, [0, 1, 3, 2]]
+        elif cell_type == _vtk.VTK_VOXEL:
+            block = block[:, [0, 1, 3, 2, 4, 5, 7, 6]]
         cell_type = cell_type if cell_type not in pixel_voxel else cell_type+1
-        cell_type = (
-            vtk_to_meshio_type[cell_type] if cell_type != 7
-            else f"polygon{numnodes}"
-        )
-
-        if len(cells) > 0 and cells[-1][0] == cell_type:
-            cells[-1][1].append(cell)
-        else:
-            cells.append((cell_type, [cell]))
-
-    for k, c in enumerate(cells):
-        cells[k] = (c[0], np.array(c[1]))
+        cells.append((vtk_to_meshio_type[cell_type], block))
 
     # Get point data
     point_data = {k.replace(" ", "_"): v for k, v in mesh.point_arrays.items()}
 
     # Get cell data
     vtk_cell_data = mesh.cell_arrays
-    n_cells = np.cumsum([len(c[1]) for c in cells[:-1]])
     cell_data = (
-        {k.replace(" ", "_"): np.split(v, n_cells) for k, v in vtk_cell_data.items()}
+        {k.replace(" ", "_"): np.split(v, breaks) for k, v in vtk_cell_data.items()}
         if vtk_cell_data
         else {}
     )
@@ -593,5 +1169,418 @@ def save_meshio(filename, mesh, file_format=None, **kwargs):
         **kwargs
     )
 
+
+def _raw_data_start(header_size):
+    """Return the position of the first buffer in a raw file."""
+    start = len(_RAW_MAGIC) + 8 + header_size
+    return start + -start % _RAW_ALIGNMENT
+
+
+def save_raw(filename, mesh):
+    """Save a mesh in the raw buffer format.
+
+    The file holds a JSON header followed by the raw, aligned buffers
+    of the points, cells and data arrays of the mesh, so that
+    :func:`pyvista.read_raw` can map it into memory instead of parsing
+    it.  The data is written in the native byte order.
+
+    Parameters
+    ----------
+    filename : str, pathlib.Path
+        Filename of the output file, usually with the ``'.pvraw'``
+        extension.
+
+    mesh : pyvista.DataSet or pyvista.Table
+        Mesh to save.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> pyvista.save_raw('sphere.pvraw', pyvista.Sphere())  # doctest:+SKIP
+
+    """
+    # import here to avoid circular imports
+    from .serialization import _buffer_layout, dataset_to_buffers
+    filename = _process_filename(filename)
+    header, buffers = dataset_to_buffers(mesh)
+    layout, _ = _buffer_layout(buffers, _RAW_ALIGNMENT)
+    metadata = json.dumps({'header': header, 'layout': layout}).encode()
+    data_start = _raw_data_start(len(metadata))
+
+    with open(filename, 'wb') as f:
+        f.write(_RAW_MAGIC)
+        f.write(struct.pack('<Q', len(metadata)))
+        f.write(metadata)
+        for key, buffer in buffers.items():
+            f.write(b'\x00' * (data_start + layout[key][0] - f.tell()))
+            f.write(np.ascontiguousarray(buffer).data.cast('B'))
+
+
+def read_raw(filename, mode='c'):
+    """Read a mesh saved in the raw buffer format.
+
+    The file is mapped into memory with ``numpy.memmap`` and the mesh
+    wraps the mapped buffers without copying, so opening a file is
+    nearly instantaneous whatever its size.  Data is only read from
+    disk when it is accessed.
+
+    Parameters
+    ----------
+    filename : str, pathlib.Path
+        Filename of a file written by :func:`pyvista.save_raw`.
+
+    mode : str, optional
+        Mode of the memory map.  The default ``'c'`` (copy-on-write)
+        allows modifying the mesh without changing the file.  Use
+        ``'r+'`` to write changes of the arrays back to the file.
+
+    Returns
+    -------
+    pyvista.DataSet or pyvista.Table
+        Mesh backed by the memory mapped file.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> pyvista.Sphere().save('sphere.pvraw')  # doctest:+SKIP
+    >>> mesh = pyvista.read('sphere.pvraw')  # doctest:+SKIP
+
+    """
+    # import here to avoid circular imports
+    from .serialization import dataset_from_buffers
+    if mode not in ('c', 'r+'):
+        raise ValueError(f'Invalid mode "{mode}".  Must be "c" or "r+".')
+    filename = _process_filename(filename)
+    with open(filename, 'rb') as f:
+        if f.read(len(_RAW_MAGIC)) != _RAW_MAGIC:
+            raise ValueError(f'{filename} is not a valid raw pyvista file.')
+        header_size, = struct.unpack('<Q', f.read(8))
+        metadata = json.loads(f.read(header_size).decode())
+
+    data_start = _raw_data_start(header_size)
+    memmap = np.memmap(filename, dtype=np.uint8, mode=mode)
+    buffers = {}
+    for key, (offset, dtype, shape) in metadata['layout'].items():
+        buffers[key] = np.ndarray(shape, dtype=dtype, buffer=memmap,
+                                  offset=data_start + offset)
+    return dataset_from_buffers(metadata['header'], buffers)
+
+
+def _cell_offsets_connectivity(cell_array):
+    """Return the offsets and connectivity arrays of a ``vtkCellArray``."""
+    if _vtk.VTK9:
+        return (_vtk.vtk_to_numpy(cell_array.GetOffsetsArray()),
+                _vtk.vtk_to_numpy(cell_array.GetConnectivityArray()))
+    return legacy_to_offsets_connectivity(_vtk.vtk_to_numpy(cell_array.GetData()))
+
+
+def _take_cells(offsets, connectivity, ids):
+    """Return the offsets and connectivity of a subset of cells."""
+    starts = offsets[ids]
+    sizes = offsets[ids + 1] - starts
+    new_offsets = np.zeros(ids.size + 1, dtype=pyvista.ID_TYPE)
+    np.cumsum(sizes, out=new_offsets[1:])
+    index = np.repeat(starts - new_offsets[:-1], sizes) + np.arange(new_offsets[-1])
+    return new_offsets, connectivity[index]
+
+
+def _mesh_cell_sets(mesh):
+    """Return the offsets and connectivity of each cell array of a mesh.
+
+    The cell arrays of a ``PolyData`` are returned in the order of
+    their cell ids and named after their ``Set`` method.
+
+    """
+    if isinstance(mesh, pyvista.PolyData):
+        return [(kind, *_cell_offsets_connectivity(getattr(mesh, f'Get{kind}')()))
+                for kind in ('Verts', 'Lines', 'Polys', 'Strips')]
+    return [(None, *_cell_offsets_connectivity(mesh.GetCells()))]
+
+
+def _copy_arrays(source, target, index):
+    """Copy the tuples of all arrays at ``index`` between attributes."""
+    for i in range(source.GetNumberOfArrays()):
+        array = source.GetAbstractArray(i)
+        if isinstance(array, _vtk.vtkBitArray):
+            # bit arrays have no NumPy view and are copied as chars
+            chars = pyvista.utilities.helpers.vtk_bit_array_to_char(array)
+            values = _vtk.vtk_to_numpy(chars)[index]
+            vtk_array = _vtk.vtkBitArray()
+            vtk_array.DeepCopy(_vtk.numpy_to_vtk(values))
+        elif isinstance(array, _vtk.vtkDataArray):
+            values = _vtk.vtk_to_numpy(array)[index]
+            vtk_array = _vtk.numpy_to_vtk(values, array_type=array.GetDataType())
+        else:
+            # string and variant arrays are copied by VTK
+            ids = _vtk.vtkIdList()
+            ids.SetNumberOfIds(index.size)
+            for j, value in enumerate(index.tolist()):
+                ids.SetId(j, value)
+            vtk_array = array.NewInstance()
+            vtk_array.SetNumberOfComponents(array.GetNumberOfComponents())
+            vtk_array.SetNumberOfTuples(index.size)
+            array.GetTuples(ids, vtk_array)
+        vtk_array.SetName(array.GetName())
+        target.AddArray(vtk_array)
+    for attribute in range(_vtk.vtkDataSetAttributes.NUM_ATTRIBUTES):
+        array = source.GetAbstractAttribute(attribute)
+        if array is not None:
+            target.SetActiveAttribute(array.GetName(), attribute)
+
+
+def _extract_piece(mesh, cell_sets, ids):
+    """Extract the sorted cell ids of a mesh with only the points they use."""
+    if isinstance(mesh, pyvista.UnstructuredGrid) and \
+       np.any(mesh.celltypes[ids] == _vtk.VTK_POLYHEDRON):
+        # polyhedra are extracted by VTK with their faces, which adds
+        # original id arrays to its input
+        piece = mesh.copy(deep=False).extract_cells(ids)
+        for data in (piece.point_arrays, piece.cell_arrays):
+            for name in ('vtkOriginalPointIds', 'vtkOriginalCellIds'):
+                if name in data:
+                    data.remove(name)
+        return piece
+
+    start = 0
+    piece_sets = []
+    for kind, offsets, connectivity in cell_sets:
+        n_cells = offsets.size - 1
+        first, last = np.searchsorted(ids, [start, start + n_cells])
+        piece_sets.append((kind, *_take_cells(offsets, connectivity, ids[first:last] - start)))
+        start += n_cells
+    used = np.unique(np.concatenate([connectivity for _, _, connectivity in piece_sets]))
+    points = mesh.points[used]
+
+    if isinstance(mesh, pyvista.PolyData):
+        piece = pyvista.PolyData(points)
+        piece.GetVerts().Initialize()
+        for kind, offsets, connectivity in piece_sets:
+            connectivity = np.searchsorted(used, connectivity)
+            if _vtk.VTK9:
+                cell_array = numpy_to_cell_array(offsets, connectivity)
+            else:
+                cell_array = CellArray(offsets_connectivity_to_legacy(offsets, connectivity),
+                                       offsets.size - 1)
+            getattr(piece, f'Set{kind}')(cell_array)
+    else:
+        _, offsets, connectivity = piece_sets[0]
+        connectivity = np.searchsorted(used, connectivity)
+        celltypes = mesh.celltypes[ids]
+        if _vtk.VTK9:
+            piece = pyvista.UnstructuredGrid(offsets=offsets, connectivity=connectivity,
+                                             celltypes=celltypes, points=points)
+        else:
+            piece = pyvista.UnstructuredGrid(offsets[:-1] + np.arange(celltypes.size),
+                                             offsets_connectivity_to_legacy(offsets,
+                                                                            connectivity),
+                                             celltypes, points)
+
+    _copy_arrays(mesh.GetPointData(), piece.GetPointData(), used)
+    _copy_arrays(mesh.GetCellData(), piece.GetCellData(), ids)
+    piece.GetFieldData().ShallowCopy(mesh.GetFieldData())
+    return piece
+
+
+def _partition_cells(mesh, cell_sets, n_pieces, partition):
+    """Return the sorted cell ids of each piece of a mesh."""
+    n_cells = mesh.n_cells
+    if partition == 'cells':
+        limits = np.linspace(0, n_cells, n_pieces + 1).astype(pyvista.ID_TYPE)
+        return [np.arange(first, last, dtype=pyvista.ID_TYPE)
+                for first, last in zip(limits[:-1], limits[1:])]
+
+    # sort the cells by the mean coordinate of their points along the
+    # longest axis of the mesh
+    bounds = np.asarray(mesh.bounds).reshape(3, 2)
+    axis = int(np.argmax(bounds[:, 1] - bounds[:, 0]))
+    coordinates = mesh.points[:, axis]
+    centers = []
+    for _, offsets, connectivity in cell_sets:
+        sums = np.zeros(connectivity.size + 1)
+        np.cumsum(coordinates[connectivity], out=sums[1:])
+        sizes = np.diff(offsets)
+        centers.append((sums[offsets[1:]] - sums[offsets[:-1]]) / np.maximum(sizes, 1))
+    order = np.argsort(np.concatenate(centers), kind='stable').astype(pyvista.ID_TYPE)
+    return [np.sort(ids) for ids in np.array_split(order, n_pieces)]
+
+
+def _write_partitioned_header(filename, mesh, piece_files):
+    """Write the header of a partitioned XML file referencing its pieces.
+
+    The header is written by VTK from a mesh with the arrays of
+    ``mesh`` but no points or cells, which declares the arrays
+    without writing any piece.  The pieces are then added to it.
+
+    """
+    structure = mesh.NewInstance()
+    points = _vtk.vtkPoints()
+    if mesh.GetPoints() is not None:
+        points.SetDataType(mesh.GetPoints().GetDataType())
+    structure.SetPoints(points)
+    structure.GetPointData().CopyAllocate(mesh.GetPointData(), 0)
+    structure.GetCellData().CopyAllocate(mesh.GetCellData(), 0)
+
+    writer = _PARTITIONED_WRITERS[get_ext(filename)]()
+    writer.SetFileName(filename)
+    writer.SetInputData(structure)
+    writer.SetNumberOfPieces(len(piece_files))
+    writer.SetStartPiece(0)
+    writer.SetEndPiece(0)
+    observer = pyvista.utilities.errors.Observer()
+    observer.observe(writer)
+    writer.Write()
+    if observer.has_event_occurred():
+        raise IOError(f'Unable to write "{filename}".\n\t"{observer.get_message()}"')
+
+    tree = ElementTree.parse(filename)
+    grid = tree.getroot()[0]
+    for piece in grid.findall('Piece'):
+        grid.remove(piece)
+    # indent the pieces like the elements written by VTK
+    tail = grid[-1].tail
+    for piece_file in piece_files:
+        grid[-1].tail = grid.text
+        ElementTree.SubElement(grid, 'Piece', Source=piece_file)
+    grid[-1].tail = tail
+    tree.write(filename, xml_declaration=True)
+
+
+def _write_xml_piece(filename, piece, binary, compression, compression_level):
+    """Write one piece of a partitioned XML file."""
+    writer = type(piece)._WRITERS[get_ext(filename)]()
+    set_vtkwriter_mode(writer, use_binary=binary)
+    set_vtkwriter_compression(writer, compression)
+    if compression_level is not None:
+        writer.SetCompressionLevel(compression_level)
+    writer.SetFileName(filename)
+    writer.SetInputData(piece)
+    observer = pyvista.utilities.errors.Observer()
+    observer.observe(writer)
+    writer.Write()
+    if observer.has_event_occurred():
+        raise IOError(f'Unable to write "{filename}".\n\t"{observer.get_message()}"')
+
+
+def save_partitioned(filename, mesh, n_pieces=None, partition='cells', compression='zlib',
+                     compression_level=None, executor=None, max_workers=None,
+                     binary=True):
+    """Save a mesh as pieces written concurrently and a partitioned XML header.
+
+    The mesh is split into ``n_pieces`` pieces saved as ``.vtu`` or
+    ``.vtp`` files named after ``filename`` in its directory.  The
+    ``.pvtu`` or ``.pvtp`` header written to ``filename`` references
+    the pieces, so the whole mesh is read back with
+    :func:`pyvista.read`.
+
+    Parameters
+    ----------
+    filename : str, pathlib.Path
+        Name of the ``.pvtu`` or ``.pvtp`` header.
+
+    mesh : pyvista.DataSet
+        Mesh to save.  ``.pvtp`` files require a
+        :class:`pyvista.PolyData` while other datasets are saved in
+        ``.pvtu`` files as unstructured grids.
+
+    n_pieces : int, optional
+        Number of pieces.  Defaults to the number of CPUs and is
+        limited to the number of cells.
+
+    partition : str, optional
+        How cells are distributed among the pieces.  ``'cells'``
+        (default) splits the cells into ranges of consecutive cell
+        ids and ``'spatial'`` into slabs along the longest axis of the
+        mesh.  Pieces only contain the points used by their cells.
+
+    compression : str, optional
+        Compression codec of the pieces.  One of ``'zlib'``
+        (default), ``'lz4'``, ``'lzma'`` or ``None``.
+
+    compression_level : int, optional
+        Compression level from 1 (fastest) to 9 (smallest).  Defaults
+        to the default of VTK.
+
+    executor : str or concurrent.futures.Executor, optional
+        How the pieces are written.  ``None`` (default) writes them
+        one after the other, ``'thread'`` in a thread pool and
+        ``'process'`` in a process pool.  An existing executor may
+        also be given.
+
+    max_workers : int, optional
+        Maximum number of workers of the thread or process pool.
+
+    binary : bool, optional
+        Write binary pieces, else ASCII.  Default ``True``.
+
+    Notes
+    -----
+    Points used by cells of several pieces are stored in each of
+    them, so the mesh read back has duplicate points along the piece
+    boundaries.  Use :func:`pyvista.PolyDataFilters.clean` or
+    :func:`pyvista.DataSetFilters.merge` to merge them.
+
+    The VTK readers of partitioned files do not read the values of
+    string arrays and misread bit arrays, which are read correctly
+    from the pieces themselves.
+
+    Examples
+    --------
+    Save a mesh in four pieces compressed with LZ4 and read it back.
+
+    >>> import pyvista
+    >>> from pyvista import examples
+    >>> mesh = examples.load_hexbeam()
+    >>> pyvista.save_partitioned('beam.pvtu', mesh, n_pieces=4, compression='lz4')  # doctest:+SKIP
+    >>> mesh = pyvista.read('beam.pvtu')  # doctest:+SKIP
+
+    """
+    filename = _process_filename(filename)
+    ext = get_ext(filename)
+    if ext not in PARTITIONED_EXTENSIONS:
+        raise ValueError(f'Invalid extension "{ext}".  '
+                         f'Must be one of {list(PARTITIONED_EXTENSIONS)}.')
+    piece_ext = PARTITIONED_EXTENSIONS[ext]
+    if ext == '.pvtp' and not isinstance(mesh, pyvista.PolyData):
+        raise TypeError(f'Only PolyData can be saved as "{ext}" files.')
+    if ext == '.pvtu' and not isinstance(mesh, pyvista.UnstructuredGrid):
+        mesh = mesh.cast_to_unstructured_grid()
+    if partition not in ('cells', 'spatial'):
+        raise ValueError(f'Invalid partition "{partition}".  Must be "cells" or "spatial".')
+    _check_executor(executor)
+    # validate the compressor before writing anything
+    set_vtkwriter_compression(_vtk.vtkXMLPolyDataWriter(), compression)
+
+    if n_pieces is None:
+        n_pieces = os.cpu_count() or 1
+    n_pieces = max(1, min(int(n_pieces), mesh.n_cells))
+
+    cell_sets = _mesh_cell_sets(mesh)
+    directory, base = os.path.split(os.path.splitext(filename)[0])
+    piece_files = [f'{base}_{i}{piece_ext}' for i in range(n_pieces)]
+
+    # VTK may write an empty first piece along with the header, which
+    # is then overwritten by the actual piece
+    _write_partitioned_header(filename, mesh, piece_files)
+
+    executor, pool = _get_executor(executor, max_workers)
+    futures = []
+    try:
+        for piece_file, ids in zip(piece_files,
+                                   _partition_cells(mesh, cell_sets, n_pieces, partition)):
+            args = (os.path.join(directory, piece_file), _extract_piece(mesh, cell_sets, ids),
+                    binary, compression, compression_level)
+            if executor is None:
+                _write_xml_piece(*args)
+            else:
+                futures.append(executor.submit(_write_xml_piece, *args))
+        for future in futures:
+            future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        if pool is not None:
+            pool.shutdown()
+
+
 def _process_filename(filename):
     return os.path.abspath(os.path.expanduser(str(filename)))
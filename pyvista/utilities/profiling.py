@@ -0,0 +1,249 @@
+"""Profile the filters run within a block of code.
+
+Within a :func:`pyvista.profile` block, each VTK algorithm updated by a
+filter is recorded with its wall time, the size of its input and
+output and the memory used by its output.
+
+"""
+import collections
+import contextlib
+import json
+import os
+import threading
+import time
+from typing import List
+
+from pyvista import _vtk
+
+# profiles being recorded, shared by all threads
+_profiles: List['Profile'] = []
+_lock = threading.Lock()
+
+FilterRecord = collections.namedtuple(
+    'FilterRecord', ['filter', 'algorithm', 'start', 'duration', 'thread',
+                     'n_points_in', 'n_cells_in', 'n_points_out', 'n_cells_out',
+                     'memory'])
+FilterRecord.__doc__ = """Update of a VTK algorithm by a filter.
+
+Times are in seconds, ``start`` being relative to the start of the
+profile.  ``memory`` is the memory used by the output in bytes.
+Input sizes add up all the inputs of the first input port.  Sizes of
+inputs and outputs that are not datasets are ``None``.
+"""
+
+
+def _profiling():
+    """Return ``True`` when a profile is being recorded."""
+    return bool(_profiles)
+
+
+def _size(data_object):
+    """Return the number of points and cells of a dataset or composite dataset."""
+    if isinstance(data_object, list):
+        sizes = [_size(item) for item in data_object]
+        if not sizes or all(size == (None, None) for size in sizes):
+            return None, None
+        return (sum(n_points or 0 for n_points, _ in sizes),
+                sum(n_cells or 0 for _, n_cells in sizes))
+    if isinstance(data_object, _vtk.vtkDataSet):
+        return data_object.GetNumberOfPoints(), data_object.GetNumberOfCells()
+    if isinstance(data_object, _vtk.vtkMultiBlockDataSet):
+        n_points = n_cells = 0
+        for i in range(data_object.GetNumberOfBlocks()):
+            block_points, block_cells = _size(data_object.GetBlock(i))
+            n_points += block_points or 0
+            n_cells += block_cells or 0
+        return n_points, n_cells
+    return None, None
+
+
+def _profiled_update(update, algorithm, filter_name):
+    """Update an algorithm and record it in the active profiles."""
+    start = time.perf_counter()
+    try:
+        update()
+    finally:
+        duration = time.perf_counter() - start
+        # all the inputs of algorithms such as ``vtkAppendFilter``
+        data_in = ([algorithm.GetInputDataObject(0, i)
+                    for i in range(algorithm.GetNumberOfInputConnections(0))]
+                   if algorithm.GetNumberOfInputPorts() else None)
+        data_out = (algorithm.GetOutputDataObject(0)
+                    if algorithm.GetNumberOfOutputPorts() else None)
+        memory = data_out.GetActualMemorySize() * 1024 if data_out is not None else 0
+        with _lock:
+            for profile in _profiles:
+                profile._records.append(FilterRecord(
+                    filter_name, algorithm.GetClassName(), start - profile._start,
+                    duration, threading.get_ident(), *_size(data_in), *_size(data_out),
+                    memory))
+
+
+class Profile:
+    """Filters recorded by :func:`pyvista.profile`.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> sphere = pyvista.Sphere()
+    >>> with pyvista.profile() as prof:
+    ...     _ = sphere.elevation().contour()
+    >>> [record.filter for record in prof.records]
+    ['elevation', 'contour']
+
+    """
+
+    def __init__(self):
+        """Initialize an empty profile."""
+        self._records = []
+        self._start = time.perf_counter()
+
+    def __repr__(self):
+        """Return the table of the recorded filters."""
+        return self.table()
+
+    def __len__(self):
+        """Return the number of recorded algorithm updates."""
+        return len(self._records)
+
+    @property
+    def records(self):
+        """Return the recorded algorithm updates in the order they finished.
+
+        Returns
+        -------
+        list of FilterRecord
+            Named tuples with the ``filter``, ``algorithm``, ``start``,
+            ``duration``, ``thread``, ``n_points_in``, ``n_cells_in``,
+            ``n_points_out``, ``n_cells_out`` and ``memory`` of each
+            update.
+
+        """
+        with _lock:
+            return list(self._records)
+
+    @property
+    def total_time(self):
+        """Return the total time spent updating algorithms in seconds."""
+        return sum(record.duration for record in self.records)
+
+    def table(self, sort=False):
+        """Return the recorded filters as a text table.
+
+        Parameters
+        ----------
+        sort : bool, optional
+            Sort the filters from the slowest to the fastest instead
+            of listing them in the order they finished.
+
+        Returns
+        -------
+        str
+            One row per algorithm update and the total time.
+
+        """
+        records = self.records
+        if sort:
+            records.sort(key=lambda record: record.duration, reverse=True)
+
+        def count(value):
+            return '-' if value is None else str(value)
+
+        header = ('Filter', 'Algorithm', 'Time (ms)', 'Points In', 'Cells In',
+                  'Points Out', 'Cells Out', 'Memory (KiB)')
+        rows = [(record.filter, record.algorithm, f'{record.duration * 1000:.3f}',
+                 count(record.n_points_in), count(record.n_cells_in),
+                 count(record.n_points_out), count(record.n_cells_out),
+                 str(record.memory // 1024)) for record in records]
+        widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+
+        def line(row):
+            # left align the names and right align the numbers
+            cells = [value.ljust(width) if i < 2 else value.rjust(width)
+                     for i, (value, width) in enumerate(zip(row, widths))]
+            return '  '.join(cells).rstrip()
+
+        lines = [line(header), '  '.join('-' * width for width in widths)]
+        lines += [line(row) for row in rows]
+        lines.append(f'Total: {len(rows)} updates in {self.total_time * 1000:.3f} ms')
+        return '\n'.join(lines)
+
+    def chrome_trace(self):
+        """Return the recorded filters in the Chrome trace event format.
+
+        Load the saved trace in ``chrome://tracing`` or
+        https://ui.perfetto.dev to see the filters on a timeline.
+
+        Returns
+        -------
+        dict
+            Trace with one complete event per algorithm update.
+
+        """
+        pid = os.getpid()
+        events = [{'name': record.filter, 'cat': record.algorithm, 'ph': 'X',
+                   'ts': record.start * 1e6, 'dur': record.duration * 1e6,
+                   'pid': pid, 'tid': record.thread,
+                   'args': {'algorithm': record.algorithm,
+                            'n_points_in': record.n_points_in,
+                            'n_cells_in': record.n_cells_in,
+                            'n_points_out': record.n_points_out,
+                            'n_cells_out': record.n_cells_out,
+                            'memory': record.memory}}
+                  for record in self.records]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save_chrome_trace(self, filename):
+        """Save the recorded filters as a Chrome trace JSON file.
+
+        Parameters
+        ----------
+        filename : str, pathlib.Path
+            Filename of the trace, usually with a ``.json`` extension.
+
+        """
+        with open(filename, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+@contextlib.contextmanager
+def profile():
+    """Record the filters run within a ``with`` block.
+
+    Each VTK algorithm updated by a filter, from any thread, is
+    recorded with the name of the filter, the class of the algorithm,
+    its wall time, the number of points and cells of its input and
+    output and the memory used by its output.  Filters run outside a
+    profile are not instrumented.
+
+    Yields
+    ------
+    Profile
+        The recorded filters, completed when the block exits.
+
+    Examples
+    --------
+    Find the slowest stage of a pipeline.
+
+    >>> import pyvista
+    >>> from pyvista import examples
+    >>> mesh = examples.load_uniform()
+    >>> with pyvista.profile() as prof:
+    ...     _ = mesh.threshold(300).extract_surface().triangulate().decimate(0.5)
+    >>> print(prof.table(sort=True))  # doctest:+SKIP
+    Filter           Algorithm                 Time (ms)  Points In  ...
+    ...
+
+    Save a trace to view in ``chrome://tracing``.
+
+    >>> prof.save_chrome_trace('trace.json')  # doctest:+SKIP
+
+    """
+    prof = Profile()
+    with _lock:
+        _profiles.append(prof)
+    try:
+        yield prof
+    finally:
+        with _lock:
+            _profiles.remove(prof)
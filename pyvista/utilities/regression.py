@@ -1,8 +1,21 @@
 """Image regression module."""
+import os
+import pathlib
+
 import numpy as np
 
 import pyvista
 from pyvista import _vtk
+from .fileio import _check_executor, _get_executor, get_ext
+
+# rows of pixels compared at once by the numpy comparison
+_TILE_ROWS = 64
+
+# side in pixels of the square windows of the structural similarity
+_SSIM_WINDOW = 8
+
+# extensions of the images compared by ``compare_images_batch``
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.pnm')
 
 
 def remove_alpha(img):
@@ -14,6 +27,16 @@ def remove_alpha(img):
     return pyvista.wrap(ec.GetOutput())
 
 
+def _check_image_array(arr):
+    """Raise a ``ValueError`` if an array is not an RGB or RGBA image."""
+    if arr.ndim != 3:
+        raise ValueError('Expecting a X by Y by (3 or 4) array')
+    if arr.shape[2] not in [3, 4]:
+        raise ValueError('Expecting a X by Y by (3 or 4) array')
+    if arr.dtype != np.uint8:
+        raise ValueError('Expecting a np.uint8 array')
+
+
 def wrap_image_array(arr):
     """Wrap a numpy array as a pyvista.UniformGrid.
 
@@ -24,13 +47,7 @@ def wrap_image_array(arr):
         ``(768, 1024, 3)``.
 
     """
-    if arr.ndim != 3:
-        raise ValueError('Expecting a X by Y by (3 or 4) array')
-    if arr.shape[2] not in [3, 4]:
-        raise ValueError('Expecting a X by Y by (3 or 4) array')
-    if arr.dtype != np.uint8:
-        raise ValueError('Expecting a np.uint8 array')
-
+    _check_image_array(arr)
     img = _vtk.vtkImageData()
     img.SetDimensions(arr.shape[1], arr.shape[0], 1)
     wrap_img = pyvista.wrap(img)
@@ -51,7 +68,150 @@ def image_from_window(ren_win, as_vtk=False, ignore_alpha=False):
     return data
 
 
-def compare_images(im1, im2, threshold=1, use_vtk=True):
+def _to_img(img):
+    """Convert a supported image to ``pyvista.UniformGrid``."""
+    from pyvista import wrap, UniformGrid, read, Plotter
+
+    if isinstance(img, UniformGrid):  # pragma: no cover
+        return img
+    elif isinstance(img, _vtk.vtkImageData):
+        return wrap(img)
+    elif isinstance(img, (str, pathlib.Path)):
+        return read(img)
+    elif isinstance(img, np.ndarray):
+        return wrap_image_array(img)
+    elif isinstance(img, Plotter):
+        return image_from_window(_rendered_window(img), True, ignore_alpha=True)
+    else:
+        raise TypeError(f'Unsupported data type {type(img)}.  Should be '
+                        'Either a np.ndarray, vtkRenderWindow, or vtkImageData')
+
+
+def _rendered_window(plotter):
+    """Return the render window of a plotter after rendering it once."""
+    if plotter._first_time:  # must be rendered first else segfault
+        plotter._on_first_render_request()
+        plotter.render()
+    return plotter.ren_win
+
+
+def _image_array(img):
+    """Convert a supported image to a ``(height, width, 3)`` ``np.uint8`` array.
+
+    The rows are ordered from top to bottom as in a numpy image.
+    """
+    if isinstance(img, pyvista.Plotter):
+        return image_from_window(_rendered_window(img), ignore_alpha=True)
+    if isinstance(img, np.ndarray):
+        _check_image_array(img)
+        return img[:, :, :3]
+
+    img = _to_img(img)
+    nx, ny, _ = img.dimensions
+    arr = np.asarray(img.point_arrays[0]).reshape(ny, nx, -1)[::-1]
+    if arr.dtype != np.uint8:
+        raise ValueError(f'Expecting an image of np.uint8 pixels, not {arr.dtype}')
+    if arr.shape[2] < 3:
+        # gray levels
+        return np.repeat(arr[:, :, :1], 3, axis=2)
+    return arr[:, :, :3]
+
+
+def _luminance(arr):
+    """Return the luminance of uint8 RGB pixels scaled by 1000 as integers."""
+    # uint8 times a uint32 scalar stays uint8 with NumPy 1.x
+    arr = arr.astype(np.uint32)
+    return arr[..., 0] * 299 + arr[..., 1] * 587 + arr[..., 2] * 114
+
+
+def _abs_diff(arr1, arr2):
+    """Return the absolute difference of unsigned integer arrays without overflow."""
+    return np.maximum(arr1, arr2) - np.minimum(arr1, arr2)
+
+
+def _mean_tile_error(tile1, tile2):
+    """Return the sum of the absolute differences of the channels."""
+    return _abs_diff(tile1, tile2).sum(dtype=np.uint64)
+
+
+def _luminance_tile_error(tile1, tile2):
+    """Return the sum of the absolute differences of the luminance."""
+    return _abs_diff(_luminance(tile1), _luminance(tile2)).sum(dtype=np.uint64) / 1000
+
+
+def _ssim_tile_error(tile1, tile2):
+    """Return the sum of one minus the structural similarity of each window."""
+    window = _SSIM_WINDOW
+    n_rows = tile1.shape[0] // window
+    n_cols = tile1.shape[1] // window
+
+    def windows(tile):
+        lum = _luminance(tile[:n_rows*window, :n_cols*window]) / 1000
+        return lum.reshape(n_rows, window, n_cols, window).swapaxes(1, 2).reshape(
+            n_rows, n_cols, -1)
+
+    x = windows(tile1)
+    y = windows(tile2)
+    mu_x = x.mean(axis=-1)
+    mu_y = y.mean(axis=-1)
+    # computed alike so that identical windows have a similarity of one
+    var_x = (x*x).mean(axis=-1) - mu_x**2
+    var_y = (y*y).mean(axis=-1) - mu_y**2
+    cov = (x*y).mean(axis=-1) - mu_x*mu_y
+    c1 = (0.01*255)**2
+    c2 = (0.03*255)**2
+    ssim = ((2*mu_x*mu_y + c1)*(2*cov + c2)
+            / ((mu_x**2 + mu_y**2 + c1)*(var_x + var_y + c2)))
+    # the similarity is at most one, up to rounding errors
+    return float(np.clip(1 - ssim, 0, None).sum())
+
+
+_METRICS = {'mean': _mean_tile_error,
+            'luminance': _luminance_tile_error,
+            'ssim': _ssim_tile_error}
+
+
+def _check_metric(metric, max_error, use_vtk):
+    """Raise a ``ValueError`` for an invalid metric or maximum error."""
+    if metric not in _METRICS:
+        raise ValueError(f'Invalid metric "{metric}".  Must be one of '
+                         + ', '.join(f'"{name}"' for name in _METRICS) + '.')
+    if max_error is not None and max_error < 0:
+        raise ValueError(f'Invalid max_error ({max_error}).  Must not be negative.')
+    if use_vtk and (metric != 'mean' or max_error is not None):
+        raise ValueError('`metric` and `max_error` require `use_vtk=False`.')
+
+
+def _tiled_error(arr1, arr2, metric='mean', max_error=None):
+    """Compare two uint8 images tile by tile.
+
+    Every tile adds a non-negative amount to the error, so the
+    comparison stops as soon as ``max_error`` is exceeded.
+    """
+    tile_error = _METRICS[metric]
+
+    height, width, _ = arr1.shape
+    if metric == 'ssim':
+        norm = (height // _SSIM_WINDOW) * (width // _SSIM_WINDOW)
+        if not norm:
+            raise ValueError(f'The structural similarity requires images of at least '
+                             f'{_SSIM_WINDOW} by {_SSIM_WINDOW} pixels.')
+        # tiles must not split the windows
+        tile_rows = _TILE_ROWS - _TILE_ROWS % _SSIM_WINDOW
+    else:
+        norm = height * width
+        tile_rows = _TILE_ROWS
+
+    error = 0
+    for start in range(0, height, tile_rows):
+        error += tile_error(arr1[start:start + tile_rows], arr2[start:start + tile_rows])
+        if max_error is not None and error / norm > max_error:
+            break
+    return float(error / norm)
+
+
+def compare_images(im1, im2, threshold=1, use_vtk=True, metric='mean',
+                   max_error=None):
     """Compare two different images of the same size.
 
     Parameters
@@ -70,17 +230,38 @@ def compare_images(im1, im2, threshold=1, use_vtk=True):
         on identical images.
 
     use_vtk : bool
-        When disabled, computes the mean pixel error over the entire
-        image using numpy.  The difference between pixel is calculated
-        for each RGB channel, summed, and then divided by the number
-        of pixels.  This is faster than using
-        ``vtk.vtkImageDifference`` but potentially less accurate.
+        When disabled, compares the ``np.uint8`` pixels of the images
+        with numpy according to ``metric``.  This is much faster than
+        using ``vtk.vtkImageDifference`` but potentially less
+        accurate.
+
+    metric : str, optional
+        Error computed when ``use_vtk=False``, which is required for
+        any other metric than ``'mean'``:
+
+        * ``'mean'``: the difference between pixels is calculated for
+          each RGB channel, summed, and then divided by the number of
+          pixels.  This is the default.
+        * ``'luminance'``: mean absolute difference of the luminance of
+          the pixels, between 0 and 255.  Less sensitive to changes of
+          hue than ``'mean'``.
+        * ``'ssim'``: one minus the mean structural similarity of the
+          luminance over windows of 8 by 8 pixels, between 0 for
+          identical images and 2.  Insensitive to uniform changes of
+          brightness and noise but sensitive to changes of structure.
+
+    max_error : float, optional
+        Stop comparing the images once the error is known to exceed
+        ``max_error`` when ``use_vtk=False``.  The images are compared
+        in tiles of rows and the error returned is then only the error
+        of the tiles compared so far, which is larger than
+        ``max_error``.  Requires ``use_vtk=False``.
 
     Returns
     -------
     error : float
         Total error between the images if using ``use_vtk=True``, and
-        the mean pixel error when ``use_vtk=False``.
+        the error according to ``metric`` when ``use_vtk=False``.
 
     Examples
     --------
@@ -100,43 +281,134 @@ def compare_images(im1, im2, threshold=1, use_vtk=True):
     >>> img2 = pyvista.read('img2.png')  # doctest:+SKIP
     >>> pyvista.compare_images(img1, img2)  # doctest:+SKIP
 
+    Quickly check whether two screenshots differ by more than a mean
+    pixel error of 10.
+
+    >>> import numpy as np
+    >>> img1 = np.zeros((768, 1024, 3), np.uint8)
+    >>> img2 = np.full((768, 1024, 3), 255, np.uint8)
+    >>> pyvista.compare_images(img1, img2, use_vtk=False, max_error=10) > 10
+    True
+
     """
-    from pyvista import wrap, UniformGrid, read, Plotter
+    _check_metric(metric, max_error, use_vtk)
+    if not use_vtk:
+        arr1 = _image_array(im1)
+        arr2 = _image_array(im2)
+        if arr1.shape != arr2.shape:
+            raise RuntimeError('Input images are not the same size.')
+        return _tiled_error(arr1, arr2, metric, max_error)
 
-    def to_img(img):
-        if isinstance(img, UniformGrid):  # pragma: no cover
-            return img
-        elif isinstance(img, _vtk.vtkImageData):
-            return wrap(img)
-        elif isinstance(img, str):
-            return read(img)
-        elif isinstance(img, np.ndarray):
-            return wrap_image_array(img)
-        elif isinstance(img, Plotter):
-            if img._first_time:  # must be rendered first else segfault
-                img._on_first_render_request()
-                img.render()
-            return image_from_window(img.ren_win, True, ignore_alpha=True)
-        else:
-            raise TypeError(f'Unsupported data type {type(img)}.  Should be '
-                            'Either a np.ndarray, vtkRenderWindow, or vtkImageData')
-
-    im1 = remove_alpha(to_img(im1))
-    im2 = remove_alpha(to_img(im2))
+    im1 = remove_alpha(_to_img(im1))
+    im2 = remove_alpha(_to_img(im2))
 
     if im1.GetDimensions() != im2.GetDimensions():
         raise RuntimeError('Input images are not the same size.')
 
-    if use_vtk:
-        img_diff = _vtk.vtkImageDifference()
-        img_diff.SetThreshold(threshold)
-        img_diff.SetInputData(im1)
-        img_diff.SetImageData(im2)
-        img_diff.AllowShiftOff()  # vastly increases compute time when enabled
-        # img_diff.AveragingOff()  # increases compute time
-        img_diff.Update()
-        return img_diff.GetError()
-
-    # otherwise, simply compute the mean pixel difference
-    diff = np.abs(im1.point_arrays[0] - im2.point_arrays[0])
-    return np.sum(diff) / im1.point_arrays[0].shape[0]
+    img_diff = _vtk.vtkImageDifference()
+    img_diff.SetThreshold(threshold)
+    img_diff.SetInputData(im1)
+    img_diff.SetImageData(im2)
+    img_diff.AllowShiftOff()  # vastly increases compute time when enabled
+    # img_diff.AveragingOff()  # increases compute time
+    img_diff.Update()
+    return img_diff.GetError()
+
+
+def compare_images_batch(images1, images2, threshold=1, use_vtk=False, metric='mean',
+                         max_error=None, executor=None, max_workers=None):
+    """Compare many pairs of images, optionally concurrently.
+
+    Parameters
+    ----------
+    images1 : str, pathlib.Path or sequence
+        Directory of images, for example cached screenshots, or a
+        sequence of images supported by :func:`pyvista.compare_images`.
+
+    images2 : str, pathlib.Path or sequence
+        Directory containing an image with the same name for each
+        image of ``images1``, or a sequence of images of the same
+        length as ``images1``.
+
+    threshold : int, optional
+        Threshold tolerance for pixel differences when
+        ``use_vtk=True``.
+
+    use_vtk : bool, optional
+        Compare the images with ``vtk.vtkImageDifference``.  Default
+        ``False``.
+
+    metric : str, optional
+        Error computed when ``use_vtk=False``.  See
+        :func:`pyvista.compare_images`.
+
+    max_error : float, optional
+        Stop comparing a pair of images once its error is known to
+        exceed ``max_error`` when ``use_vtk=False``.
+
+    executor : str or concurrent.futures.Executor, optional
+        How the images are compared.  ``None`` (default) compares them
+        one after the other, ``'thread'`` in a thread pool and
+        ``'process'`` in a process pool.  An existing executor may
+        also be given.  Plotters can only be compared in threads.
+
+    max_workers : int, optional
+        Maximum number of workers of the thread or process pool.
+        Defaults to the default of the pool.
+
+    Returns
+    -------
+    dict or list
+        Error of each image of ``images1`` keyed by file name when
+        comparing directories, otherwise a list of errors in the order
+        of the images.
+
+    Examples
+    --------
+    Compare new screenshots with cached ones and list the images
+    that changed.
+
+    >>> import pyvista
+    >>> errors = pyvista.compare_images_batch('cache', 'screenshots', max_error=5)  # doctest:+SKIP
+    >>> [name for name, error in errors.items() if error > 5]  # doctest:+SKIP
+    ['sphere.png']
+
+    """
+    _check_executor(executor)
+    _check_metric(metric, max_error, use_vtk)
+    if isinstance(images1, (str, pathlib.Path)):
+        directory1 = str(images1)
+        directory2 = str(images2)
+        if not os.path.isdir(directory1) or not os.path.isdir(directory2):
+            raise ValueError('Expecting either two directories or two sequences of images.')
+        names = sorted(name for name in os.listdir(directory1)
+                       if get_ext(name).lower() in _IMAGE_EXTENSIONS)
+        missing = [name for name in names
+                   if not os.path.isfile(os.path.join(directory2, name))]
+        if missing:
+            raise FileNotFoundError(f'Images missing from {directory2}: {", ".join(missing)}')
+        pairs = [(os.path.join(directory1, name), os.path.join(directory2, name))
+                 for name in names]
+    else:
+        names = None
+        pairs = list(zip(images1, images2))
+        if len(pairs) != len(images1) or len(pairs) != len(images2):
+            raise ValueError('Expecting the same number of images in both sequences.')
+
+    kwargs = {'threshold': threshold, 'use_vtk': use_vtk, 'metric': metric,
+              'max_error': max_error}
+    if executor is None:
+        errors = [compare_images(im1, im2, **kwargs) for im1, im2 in pairs]
+    else:
+        executor, pool = _get_executor(executor, max_workers)
+        try:
+            futures = [executor.submit(compare_images, im1, im2, **kwargs)
+                       for im1, im2 in pairs]
+            errors = [future.result() for future in futures]
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    if names is None:
+        return errors
+    return dict(zip(names, errors))
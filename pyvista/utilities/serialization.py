@@ -0,0 +1,277 @@
+"""Decompose datasets into plain NumPy buffers and rebuild them.
+
+A dataset is split into a small ``header`` containing only JSON
+compatible values (the dataset type, its extent, origin, array names,
+etc.) and a dictionary of contiguous NumPy ``buffers`` containing the
+heavy data (points, cell connectivity and every data array).
+
+The buffers are views of the underlying VTK memory, and rebuilding a
+dataset from buffers wraps them without copying whenever their dtype
+already matches what VTK expects.  This makes the pair well suited for
+pickling with protocol 5 out-of-band buffers, shared memory and memory
+mapped files.
+
+"""
+import numpy as np
+
+import pyvista
+from pyvista import _vtk
+from .cells import numpy_to_cell_array, numpy_to_idarr
+from .helpers import convert_array
+
+# Supported ``pyvista`` types and the VTK class they wrap, most
+# derived VTK classes first.
+_DATASET_TYPES = [
+    ('ExplicitStructuredGrid', _vtk.vtkExplicitStructuredGrid),
+    ('UniformGrid', _vtk.vtkImageData),
+    ('RectilinearGrid', _vtk.vtkRectilinearGrid),
+    ('StructuredGrid', _vtk.vtkStructuredGrid),
+    ('PolyData', _vtk.vtkPolyData),
+    ('UnstructuredGrid', _vtk.vtkUnstructuredGrid),
+    ('Table', _vtk.vtkTable),
+]
+
+_POLY_CELLS = ('verts', 'lines', 'polys', 'strips')
+
+# Data attributes and the accessor used to fetch them
+_FIELDS = {
+    'point': 'GetPointData',
+    'cell': 'GetCellData',
+    'field': 'GetFieldData',
+    'row': 'GetRowData',
+}
+
+
+def _buffer_layout(buffers, alignment):
+    """Place ``buffers`` one after the other in a single block.
+
+    Returns the ``(offset, dtype, shape)`` of each buffer, with every
+    offset a multiple of ``alignment``, and the size of the block.
+
+    """
+    layout = {}
+    size = 0
+    for key, buffer in buffers.items():
+        size += -size % alignment
+        layout[key] = (size, buffer.dtype.str, buffer.shape)
+        size += buffer.nbytes
+    return layout, size
+
+
+def _get_type_name(dataset):
+    """Return the name of the pyvista type matching ``dataset``."""
+    for type_name, vtk_type in _DATASET_TYPES:
+        if isinstance(dataset, vtk_type):
+            return type_name
+    raise TypeError(f'Unable to convert {type(dataset).__name__} to buffers.')
+
+
+def _cell_array_to_buffers(cell_array, key, buffers):
+    """Add the arrays of a ``vtkCellArray`` to ``buffers``."""
+    if not _vtk.VTK9:  # pragma: no cover
+        raise TypeError('Converting cells to buffers requires VTK 9 or newer.')
+    buffers[f'{key}_offsets'] = _vtk.vtk_to_numpy(cell_array.GetOffsetsArray())
+    buffers[f'{key}_connectivity'] = _vtk.vtk_to_numpy(cell_array.GetConnectivityArray())
+
+
+def _cell_array_from_buffers(key, buffers):
+    """Create a ``vtkCellArray`` from ``buffers``."""
+    return numpy_to_cell_array(buffers[f'{key}_offsets'], buffers[f'{key}_connectivity'])
+
+
+def _points_to_buffers(dataset, buffers):
+    points = dataset.GetPoints()
+    if points is not None:
+        buffers['points'] = _vtk.vtk_to_numpy(points.GetData())
+
+
+def _points_from_buffers(dataset, buffers):
+    if 'points' in buffers:
+        vtk_points = _vtk.vtkPoints()
+        vtk_points.SetData(convert_array(buffers['points']))
+        dataset.SetPoints(vtk_points)
+
+
+def _arrays_to_buffers(dataset, header, buffers):
+    """Add every data array of ``dataset`` to ``buffers``."""
+    arrays = []
+    for field, getter in _FIELDS.items():
+        if not hasattr(dataset, getter):
+            continue
+        attributes = getattr(dataset, getter)()
+        for i in range(attributes.GetNumberOfArrays()):
+            vtk_arr = attributes.GetAbstractArray(i)
+            if isinstance(vtk_arr, _vtk.vtkBitArray) or not isinstance(
+                    vtk_arr, (_vtk.vtkDataArray, _vtk.vtkStringArray)):
+                raise TypeError(f'Unable to convert {vtk_arr.GetClassName()} '
+                                f'"{vtk_arr.GetName()}" to a buffer.')
+            attribute = -1
+            if isinstance(attributes, _vtk.vtkDataSetAttributes):
+                attribute = attributes.IsArrayAnAttribute(i)
+            key = f'{field}_data_{i}'
+            buffers[key] = convert_array(vtk_arr)
+            arrays.append({'field': field,
+                           'name': vtk_arr.GetName(),
+                           'key': key,
+                           'vtk_type': vtk_arr.GetDataType(),
+                           'attribute': attribute})
+    header['arrays'] = arrays
+
+
+def _arrays_from_buffers(dataset, header, buffers):
+    for info in header['arrays']:
+        attributes = getattr(dataset, _FIELDS[info['field']])()
+        vtk_arr = convert_array(np.asarray(buffers[info['key']]), name=info['name'],
+                                array_type=info['vtk_type'])
+        attributes.AddArray(vtk_arr)
+        if info['attribute'] >= 0 and info['name'] is not None:
+            attributes.SetActiveAttribute(info['name'], info['attribute'])
+
+
+def dataset_to_buffers(dataset):
+    """Split a dataset into a header and a dictionary of NumPy buffers.
+
+    The buffers share memory with ``dataset``; no data is copied.
+
+    Parameters
+    ----------
+    dataset : pyvista.DataSet or pyvista.Table
+        Dataset to decompose.
+
+    Returns
+    -------
+    header : dict
+        JSON serializable description of the dataset.
+
+    buffers : dict
+        Mapping of buffer names to contiguous ``numpy.ndarray`` objects.
+
+    Raises
+    ------
+    TypeError
+        If the dataset type or one of its arrays cannot be represented
+        as buffers (for example ``vtkBitArray``).
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> from pyvista.utilities.serialization import dataset_to_buffers
+    >>> header, buffers = dataset_to_buffers(pyvista.Sphere())
+    >>> header['type']
+    'PolyData'
+
+    """
+    type_name = _get_type_name(dataset)
+    header = {'type': type_name}
+    buffers = {}
+
+    if type_name in ('UniformGrid', 'RectilinearGrid', 'StructuredGrid',
+                     'ExplicitStructuredGrid'):
+        header['extent'] = list(dataset.GetExtent())
+    if type_name == 'UniformGrid':
+        header['origin'] = list(dataset.GetOrigin())
+        header['spacing'] = list(dataset.GetSpacing())
+    elif type_name == 'RectilinearGrid':
+        buffers['x'] = _vtk.vtk_to_numpy(dataset.GetXCoordinates())
+        buffers['y'] = _vtk.vtk_to_numpy(dataset.GetYCoordinates())
+        buffers['z'] = _vtk.vtk_to_numpy(dataset.GetZCoordinates())
+    elif type_name == 'StructuredGrid':
+        _points_to_buffers(dataset, buffers)
+    elif type_name == 'ExplicitStructuredGrid':
+        _points_to_buffers(dataset, buffers)
+        _cell_array_to_buffers(dataset.GetCells(), 'cells', buffers)
+    elif type_name == 'PolyData':
+        _points_to_buffers(dataset, buffers)
+        for key in _POLY_CELLS:
+            cell_array = getattr(dataset, f'Get{key.capitalize()}')()
+            header[f'n_{key}'] = cell_array.GetNumberOfCells()
+            if cell_array.GetNumberOfCells():
+                _cell_array_to_buffers(cell_array, key, buffers)
+    elif type_name == 'UnstructuredGrid':
+        _points_to_buffers(dataset, buffers)
+        header['n_cells'] = dataset.GetNumberOfCells()
+        if dataset.GetNumberOfCells():
+            _cell_array_to_buffers(dataset.GetCells(), 'cells', buffers)
+            buffers['celltypes'] = _vtk.vtk_to_numpy(dataset.GetCellTypesArray())
+            if dataset.GetFaces() is not None:
+                buffers['faces'] = _vtk.vtk_to_numpy(dataset.GetFaces())
+                buffers['face_locations'] = _vtk.vtk_to_numpy(dataset.GetFaceLocations())
+
+    _arrays_to_buffers(dataset, header, buffers)
+    return header, buffers
+
+
+def dataset_from_buffers(header, buffers, dataset=None):
+    """Rebuild a dataset from a header and buffers.
+
+    Buffers are wrapped without copying when they are contiguous and
+    their dtype matches the one VTK requires, so they must outlive the
+    returned dataset.  Read-only buffers are supported, but the
+    resulting dataset must then be treated as read-only.
+
+    Parameters
+    ----------
+    header : dict
+        Header created by :func:`dataset_to_buffers`.
+
+    buffers : dict
+        Buffers created by :func:`dataset_to_buffers`.
+
+    dataset : pyvista.DataSet or pyvista.Table, optional
+        Empty dataset to populate.  A new dataset of the type given in
+        ``header`` is created by default.
+
+    Returns
+    -------
+    pyvista.DataSet or pyvista.Table
+        The rebuilt dataset.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> from pyvista.utilities.serialization import (dataset_to_buffers,
+    ...                                              dataset_from_buffers)
+    >>> header, buffers = dataset_to_buffers(pyvista.Sphere())
+    >>> mesh = dataset_from_buffers(header, buffers)
+    >>> mesh.n_points
+    842
+
+    """
+    type_name = header['type']
+    if dataset is None:
+        dataset = getattr(pyvista, type_name)()
+
+    if 'extent' in header:
+        dataset.SetExtent(header['extent'])
+    if type_name == 'UniformGrid':
+        dataset.SetOrigin(header['origin'])
+        dataset.SetSpacing(header['spacing'])
+    elif type_name == 'RectilinearGrid':
+        dataset.SetXCoordinates(convert_array(buffers['x']))
+        dataset.SetYCoordinates(convert_array(buffers['y']))
+        dataset.SetZCoordinates(convert_array(buffers['z']))
+    elif type_name == 'StructuredGrid':
+        _points_from_buffers(dataset, buffers)
+    elif type_name == 'ExplicitStructuredGrid':
+        _points_from_buffers(dataset, buffers)
+        dataset.SetCells(_cell_array_from_buffers('cells', buffers))
+    elif type_name == 'PolyData':
+        _points_from_buffers(dataset, buffers)
+        for key in _POLY_CELLS:
+            if header[f'n_{key}']:
+                cell_array = _cell_array_from_buffers(key, buffers)
+                getattr(dataset, f'Set{key.capitalize()}')(cell_array)
+    elif type_name == 'UnstructuredGrid':
+        _points_from_buffers(dataset, buffers)
+        if header['n_cells']:
+            cell_array = _cell_array_from_buffers('cells', buffers)
+            celltypes = convert_array(buffers['celltypes'], array_type=_vtk.VTK_UNSIGNED_CHAR)
+            if 'faces' in buffers:
+                dataset.SetCells(celltypes, cell_array,
+                                 numpy_to_idarr(buffers['face_locations']),
+                                 numpy_to_idarr(buffers['faces']))
+            else:
+                dataset.SetCells(celltypes, cell_array)
+
+    _arrays_from_buffers(dataset, header, buffers)
+    return dataset
@@ -0,0 +1,224 @@
+"""Share datasets between processes through shared memory.
+
+A :class:`SharedDataSet` copies the points, cells and data arrays of a
+dataset once into a single :class:`multiprocessing.shared_memory.SharedMemory`
+block.  Its small, picklable :attr:`SharedDataSet.handle` can then be
+sent to worker processes, which rebuild the dataset on top of the
+shared block without copying.
+
+Requires Python 3.8 or newer.
+
+"""
+import mmap
+import os
+
+import numpy as np
+
+from .serialization import _buffer_layout, dataset_from_buffers, dataset_to_buffers
+
+# alignment of each buffer within the shared block in bytes
+_ALIGNMENT = 64
+
+
+def _get_shared_memory_class():
+    try:
+        from multiprocessing.shared_memory import SharedMemory
+    except ImportError:  # pragma: no cover
+        raise ImportError('Sharing datasets requires Python 3.8 or newer.') from None
+    return SharedMemory
+
+
+def _map_copy_on_write(name):
+    """Map a shared memory block privately, so that writes stay in this process.
+
+    On POSIX systems, the block is opened without ``SharedMemory``,
+    which would register it with the resource tracker of this process.
+    The tracker would then unlink the block, or report it as leaked,
+    when this process exits, while only the process that created the
+    block should unlink it.
+    """
+    if os.name == 'nt':  # pragma: no cover
+        shm = _get_shared_memory_class()(name=name)
+        try:
+            return mmap.mmap(-1, shm.size, tagname=name, access=mmap.ACCESS_COPY)
+        finally:
+            shm.close()
+    _get_shared_memory_class()  # requires Python 3.8
+    import _posixshmem
+    fd = _posixshmem.shm_open('/' + name, os.O_RDONLY, mode=0o600)
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_COPY)
+    finally:
+        os.close(fd)
+
+
+class SharedDataSetHandle:
+    """Picklable reference to a dataset stored in shared memory.
+
+    Created by :class:`SharedDataSet`.  Send it to another process and
+    call :func:`SharedDataSetHandle.attach` there to access the
+    dataset.
+
+    """
+
+    def __init__(self, name, header, layout):
+        """Initialize the handle."""
+        self.name = name
+        self.header = header
+        self.layout = layout
+
+    def __repr__(self):
+        """Return the representation of the handle."""
+        return f'{type(self).__name__}({self.name!r}, {self.header["type"]})'
+
+    def attach(self):
+        """Rebuild the shared dataset without copying.
+
+        The arrays of the returned dataset are copy-on-write views of
+        the shared memory block: changing them copies the changed
+        memory pages into this process, so changes are never seen by
+        the other processes using the block.  The block stays mapped
+        while the dataset or any of its arrays are alive.
+
+        Returns
+        -------
+        pyvista.DataSet or pyvista.Table
+            Dataset backed by shared memory.
+
+        """
+        block = _map_copy_on_write(self.name)
+        buffers = {key: np.ndarray(shape, dtype=dtype, buffer=block, offset=offset)
+                   for key, (offset, dtype, shape) in self.layout.items()}
+        dataset = dataset_from_buffers(self.header, buffers)
+        # closing the mapping while arrays are exported is an error, so
+        # keep it open as long as the dataset lives
+        dataset._shared_memory = block
+        return dataset
+
+
+class SharedDataSet:
+    """Publish a dataset into shared memory.
+
+    The dataset is copied once into a shared memory block.  The block
+    is reference counted: it starts with a count of one, every
+    :func:`SharedDataSet.acquire` adds one and every
+    :func:`SharedDataSet.release` removes one.  The block is unlinked
+    when the count reaches zero or when :func:`SharedDataSet.unlink`
+    is called.  Processes that have already attached the dataset keep
+    their mapping until they release it.
+
+    Parameters
+    ----------
+    dataset : pyvista.DataSet or pyvista.Table
+        Dataset to share.  All types supported by
+        :func:`pyvista.utilities.serialization.dataset_to_buffers` are
+        supported.
+
+    Examples
+    --------
+    Share a mesh and attach it, usually from a worker process that
+    received ``shared.handle``.
+
+    >>> import pyvista
+    >>> with pyvista.SharedDataSet(pyvista.Sphere()) as shared:
+    ...     mesh = shared.handle.attach()
+    ...     print(mesh.n_points)
+    842
+
+    Share a mesh with the workers of a process pool.
+
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> def n_points(handle):
+    ...     return handle.attach().n_points
+    >>> with pyvista.SharedDataSet(pyvista.Sphere()) as shared:  # doctest:+SKIP
+    ...     with ProcessPoolExecutor() as executor:
+    ...         print(executor.submit(n_points, shared.handle).result())
+    842
+
+    """
+
+    def __init__(self, dataset):
+        """Initialize the shared dataset."""
+        header, buffers = dataset_to_buffers(dataset)
+
+        layout, size = _buffer_layout(buffers, _ALIGNMENT)
+        self._shm = _get_shared_memory_class()(create=True, size=max(size, 1))
+        for key, buffer in buffers.items():
+            offset, dtype, shape = layout[key]
+            target = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset)
+            target[...] = buffer
+            del target
+
+        self._handle = SharedDataSetHandle(self._shm.name, header, layout)
+        self._refcount = 1
+
+    def __repr__(self):
+        """Return the representation of the shared dataset."""
+        state = 'unlinked' if self._shm is None else f'refcount={self._refcount}'
+        return f'{type(self).__name__}({self._handle.name!r}, {state})'
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Release the dataset when leaving the context manager."""
+        self.release()
+
+    @property
+    def handle(self):
+        """Return the picklable handle used to attach the dataset.
+
+        Returns
+        -------
+        SharedDataSetHandle
+            Handle of the shared dataset.
+
+        """
+        return self._handle
+
+    @property
+    def name(self):
+        """Return the name of the shared memory block."""
+        return self._handle.name
+
+    @property
+    def refcount(self):
+        """Return the current reference count."""
+        return self._refcount
+
+    @property
+    def unlinked(self):
+        """Return ``True`` when the shared memory block has been unlinked."""
+        return self._shm is None
+
+    def acquire(self):
+        """Increase the reference count.
+
+        Returns
+        -------
+        SharedDataSetHandle
+            Handle of the shared dataset.
+
+        """
+        if self._shm is None:
+            raise ValueError('The shared dataset has already been unlinked.')
+        self._refcount += 1
+        return self._handle
+
+    def release(self):
+        """Decrease the reference count and unlink the block when it reaches zero."""
+        if self._shm is None:
+            return
+        self._refcount -= 1
+        if self._refcount <= 0:
+            self.unlink()
+
+    def unlink(self):
+        """Close and unlink the shared memory block regardless of the reference count."""
+        if self._shm is None:
+            return
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+        self._refcount = 0
@@ -0,0 +1,229 @@
+"""Read transient datasets one time step at a time.
+
+Supports ParaView ``.pvd`` collections as well as every VTK reader
+reporting time steps, such as OpenFOAM (``.foam``), EnSight
+(``.case``) and Exodus (``.e``, ``.exo``) readers.
+
+"""
+import concurrent.futures
+import os
+import warnings
+from xml.etree import ElementTree
+
+import numpy as np
+
+import pyvista
+from pyvista import _vtk
+from .fileio import (_exodus_reader, _process_filename, _select_reader_arrays,
+                     _set_reader_filename, get_ext, get_reader, standard_reader_routine)
+
+
+class _CollectionSteps:
+    """Time steps of a ``.pvd`` collection, each made of one or more files."""
+
+    def __init__(self, filename, point_arrays, cell_arrays):
+        directory = os.path.dirname(filename)
+        collection = ElementTree.parse(filename).getroot().find('Collection')
+        if collection is None:
+            raise ValueError(f'{filename} does not contain a collection.')
+
+        steps = {}
+        for element in collection.iter('DataSet'):
+            time_value = float(element.get('timestep', 0.0))
+            path = os.path.join(directory, element.get('file'))
+            steps.setdefault(time_value, []).append(path)
+        self.time_values = sorted(steps)
+        self._files = [steps[time_value] for time_value in self.time_values]
+        self._point_arrays = point_arrays
+        self._cell_arrays = cell_arrays
+
+    def _read_file(self, filename):
+        return standard_reader_routine(get_reader(filename), filename,
+                                       point_arrays=self._point_arrays,
+                                       cell_arrays=self._cell_arrays)
+
+    def read(self, index):
+        files = self._files[index]
+        if len(files) == 1:
+            return self._read_file(files[0])
+        return pyvista.MultiBlock([self._read_file(filename) for filename in files])
+
+
+class _ReaderSteps:
+    """Time steps reported by a VTK reader."""
+
+    def __init__(self, filename, point_arrays, cell_arrays):
+        if get_ext(filename) in ('.e', '.exo'):
+            reader = _exodus_reader(filename)
+            reader.SetAllArrayStatus(reader.NODAL, 1)
+            reader.SetAllArrayStatus(reader.ELEM_BLOCK, 1)
+        else:
+            reader = get_reader(filename)
+            _set_reader_filename(reader, filename)
+            reader.UpdateInformation()
+        _select_reader_arrays(reader, point_arrays, cell_arrays)
+
+        info = reader.GetOutputInformation(0)
+        key = _vtk.vtkStreamingDemandDrivenPipeline.TIME_STEPS()
+        self.time_values = list(info.Get(key)) if info.Has(key) else [0.0]
+        self._reader = reader
+
+    def read(self, index):
+        observer = pyvista.utilities.errors.Observer()
+        observer.observe(self._reader)
+        self._reader.UpdateTimeStep(self.time_values[index])
+        if observer.has_event_occurred():
+            warnings.warn(f'The VTK reader `{self._reader.GetClassName()}` raised an error '
+                          f'while reading the file.\n\t"{observer.get_message()}"')
+
+        # the reader reuses its output, so return a shallow copy
+        data = pyvista.wrap(self._reader.GetOutputDataObject(0)).copy(deep=False)
+        data._post_file_load_processing()
+        return data
+
+
+class TimeSeriesReader:
+    """Read a transient dataset one time step at a time.
+
+    Iterating over the reader yields the dataset at each time step.
+    With ``prefetch=True``, the next step is read in a background
+    thread while one step is being processed.
+
+    Supports ParaView ``.pvd`` collections and the files of every VTK
+    reader reporting time steps, such as OpenFOAM (``.foam``), EnSight
+    (``.case``) and Exodus (``.e``, ``.exo``) files.  Files without
+    time information have a single time step at time ``0.0``.
+
+    Parameters
+    ----------
+    filename : str, pathlib.Path
+        File to read.
+
+    point_arrays : sequence of str, optional
+        Names of the only point arrays to read.  All point arrays are
+        read by default.
+
+    cell_arrays : sequence of str, optional
+        Names of the only cell arrays to read.  All cell arrays are
+        read by default.
+
+    prefetch : bool, optional
+        Read the next time step in a background thread while
+        iterating.  This only saves time when a core is free for the
+        reading while each step is processed.  Default ``False``.
+
+    Examples
+    --------
+    Compute the maximum pressure at each time step of a simulation.
+
+    >>> import pyvista
+    >>> reader = pyvista.TimeSeriesReader('simulation.pvd', point_arrays=['p'])  # doctest:+SKIP
+    >>> reader.n_time_steps  # doctest:+SKIP
+    100
+    >>> for time_value, mesh in zip(reader.time_values, reader):  # doctest:+SKIP
+    ...     print(time_value, mesh['p'].max())
+
+    Read a single time step.
+
+    >>> reader.set_active_time(0.5)  # doctest:+SKIP
+    >>> mesh = reader.read()  # doctest:+SKIP
+
+    """
+
+    def __init__(self, filename, point_arrays=None, cell_arrays=None, prefetch=False):
+        """Initialize the reader."""
+        filename = _process_filename(filename)
+        if not os.path.isfile(filename):
+            raise FileNotFoundError(f'File ({filename}) not found')
+        if get_ext(filename) == '.pvd':
+            self._steps = _CollectionSteps(filename, point_arrays, cell_arrays)
+        else:
+            self._steps = _ReaderSteps(filename, point_arrays, cell_arrays)
+        self._filename = filename
+        self._active_step = 0
+        # a single worker keeps the VTK readers from being used concurrently
+        self._executor = concurrent.futures.ThreadPoolExecutor(1) if prefetch else None
+
+    def __repr__(self):
+        """Return the representation of the reader."""
+        return f'{type(self).__name__}({self._filename!r}, n_time_steps={self.n_time_steps})'
+
+    def __len__(self):
+        """Return the number of time steps."""
+        return self.n_time_steps
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the reader when leaving the context manager."""
+        self.close()
+
+    def __iter__(self):
+        """Yield the dataset at each time step.
+
+        The active time step follows the iteration.
+        """
+        future = None
+        for index in range(self.n_time_steps):
+            mesh = self._read_step(index) if future is None else future.result()
+            future = None
+            if self._executor is not None and index + 1 < self.n_time_steps:
+                future = self._executor.submit(self._steps.read, index + 1)
+            self._active_step = index
+            yield mesh
+
+    @property
+    def filename(self):
+        """Return the name of the file read."""
+        return self._filename
+
+    @property
+    def n_time_steps(self):
+        """Return the number of time steps."""
+        return len(self._steps.time_values)
+
+    @property
+    def time_values(self):
+        """Return the time value of each time step."""
+        return list(self._steps.time_values)
+
+    @property
+    def active_time_value(self):
+        """Return the time value of the active time step."""
+        return self._steps.time_values[self._active_step]
+
+    def set_active_time(self, time_value):
+        """Set the time step closest to a time value as the active time step.
+
+        Parameters
+        ----------
+        time_value : float
+            Time value.
+
+        """
+        self._active_step = int(np.argmin(np.abs(np.asarray(self._steps.time_values)
+                                                 - time_value)))
+
+    def read(self):
+        """Read the dataset at the active time step.
+
+        Returns
+        -------
+        pyvista.DataSet or pyvista.MultiBlock
+            Dataset at the active time step.
+
+        """
+        return self._read_step(self._active_step)
+
+    def _read_step(self, index):
+        """Read a time step, in the background thread when prefetching."""
+        if self._executor is None:
+            return self._steps.read(index)
+        return self._executor.submit(self._steps.read, index).result()
+
+    def close(self):
+        """Stop the background thread of the reader, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
@@ -7,7 +7,8 @@ import pyvista as pv
 has_ipygany = True
 try:
     from ipygany.ipygany import Scene, IsoColor
-    from pyvista.jupyter.pv_ipygany import check_colormap
+    from pyvista.jupyter.pv_ipygany import (check_colormap, pyvista_polydata_to_polymesh,
+                                            IpyganySession, _triangulated_surface)
 except:
     has_ipygany = False
 
@@ -68,3 +69,64 @@ def test_ipygany_scalar_bar(sphere):
     viewer = sphere.plot(notebook=True, jupyter_backend='ipygany',
                          return_viewer=False, show_scalar_bar=True)
     assert viewer is None
+
+
+@skip_no_ipygany
+def test_polymesh_arrays(sphere):
+    sphere['point_values'] = sphere.points
+    sphere['cell_values'] = np.arange(sphere.n_cells)
+    pmesh = pyvista_polydata_to_polymesh(sphere, arrays='all')
+    assert pmesh.vertices.dtype == np.float32
+    assert pmesh.triangle_indices.dtype == np.uint32
+    assert pmesh.triangle_indices.size == sphere.n_faces*3
+    names = [data.name for data in pmesh.data]
+    assert 'point_values' in names
+    assert 'cell_values' in names
+
+    pmesh = pyvista_polydata_to_polymesh(sphere, arrays=['point_values'])
+    assert [data.name for data in pmesh.data] == ['point_values']
+    assert len(pmesh.data[0].components) == 3
+
+    with pytest.raises(ValueError, match='Invalid arrays'):
+        pyvista_polydata_to_polymesh(sphere, arrays='none')
+
+
+@skip_no_ipygany
+def test_polymesh_max_triangles():
+    mesh = examples.load_hexbeam()
+    surf = _triangulated_surface(mesh)
+    assert _triangulated_surface(mesh) is surf
+    mesh.points[0] = 0
+    assert _triangulated_surface(mesh) is not surf
+
+    pmesh = pyvista_polydata_to_polymesh(mesh, max_triangles=50)
+    assert pmesh.triangle_indices.size <= 50*3
+
+
+@skip_no_ipygany
+def test_ipygany_session(sphere):
+    sphere['height'] = sphere.points[:, 2]
+    pl = pv.Plotter(notebook=True)
+    pl.add_mesh(sphere, scalars='height')
+    session = IpyganySession(pl)
+    assert len(session.scene.children) == 1
+    assert session.update() == 0
+
+    # only the changed buffers are sent
+    pl.update_scalars(-sphere.points[:, 2], mesh=sphere, render=False)
+    assert session.update() == 1
+    pl.update_coordinates(sphere.points*2, mesh=sphere, render=False)
+    assert session.update() == 1
+
+    pl.add_mesh(pv.Cube())
+    session.update()
+    assert len(session.scene.children) == 2
+
+
+@skip_no_ipygany
+def test_ipygany_session_reused(sphere):
+    pl = pv.Plotter(notebook=True)
+    pl.add_mesh(sphere)
+    scene = pl.show(jupyter_backend='ipygany', return_viewer=True)
+    assert isinstance(pl._jupyter_session, IpyganySession)
+    assert pl.show(jupyter_backend='ipygany', return_viewer=True) is scene
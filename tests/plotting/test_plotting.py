@@ -20,6 +20,8 @@ import pyvista
 from pyvista._vtk import VTK9
 from pyvista import examples
 from pyvista.plotting import system_supports_plotting
+from pyvista.plotting.colors import get_cmap_safe
+from pyvista.plotting.lod import lod_levels
 from pyvista.plotting.plotting import SUPPORTED_FORMATS
 from pyvista.core.errors import DeprecationError
 
@@ -1009,6 +1011,90 @@ def test_multi_block_plot():
     multi.plot(multi_colors=True, before_close_callback=verify_cache_image)
 
 
+@skip_no_plotting
+def test_multi_block_plot_composite():
+    multi = pyvista.MultiBlock({'sphere': pyvista.Sphere(),
+                                'uniform': examples.load_uniform(),
+                                'nested': pyvista.MultiBlock([pyvista.Cone(), None])})
+    multi['sphere']['z'] = multi['sphere'].points[:, 2]
+    multi['uniform']['z'] = multi['uniform'].points[:, 2]
+    multi['nested'][0]['z'] = multi['nested'][0].points[:, 2]
+
+    plotter = pyvista.Plotter()
+    actor = plotter.add_mesh(multi, composite=True, scalars='z', multi_colors=True,
+                             show_scalar_bar=False)
+    assert isinstance(actor.GetMapper(), vtk.vtkCompositePolyDataMapper2)
+    assert len(plotter.renderer.actors) == 1
+
+    attributes = pyvista.CompositeAttributes(actor)
+    assert attributes.dataset.keys() == ['sphere', 'uniform', 'nested']
+    attributes.set_block_visibility('uniform', False)
+    assert not attributes.block_visibility('uniform')
+    assert attributes.block_visibility('sphere')
+    attributes.set_block_color(('nested', 0), 'red')
+    assert attributes.block_color(('nested', 0)) == (1.0, 0.0, 0.0)
+    attributes.set_block_opacity(-1, 0.5)
+    assert attributes.block_opacity('nested') == 0.5
+    attributes.set_block_opacity(-1, None)
+    assert attributes.block_opacity('nested') is None
+
+    with pytest.raises(KeyError):
+        attributes.set_block_color('missing', 'red')
+    with pytest.raises(KeyError, match='empty'):
+        attributes.set_block_color(('nested', 1), 'red')
+    with pytest.raises(IndexError):
+        attributes.set_block_visibility(3, False)
+    with pytest.raises(ValueError):
+        plotter.add_mesh(multi, composite=True, opacity='linear')
+    for option in [{'below_color': 'blue'}, {'annotations': {0: 'zero'}},
+                   {'categories': True}, {'component': 0}, {'label': 'blocks'}]:
+        with pytest.raises(ValueError, match='not supported'):
+            plotter.add_mesh(multi, composite=True, **option)
+    with pytest.raises(TypeError):
+        pyvista.CompositeAttributes(plotter.add_mesh(pyvista.Sphere()))
+
+    attributes.reset()
+    assert attributes.block_visibility('uniform')
+    assert actor.GetMapper().GetArrayName() == 'z'
+    assert actor.GetMapper().GetScalarRange() == multi.get_data_range('z')
+
+    # the properties are set as by ``add_mesh``
+    actor = plotter.add_mesh(multi, composite=True, style='wireframe', line_width=3,
+                             pbr=True, metallic=0.5)
+    prop = actor.GetProperty()
+    assert prop.GetRepresentation() == vtk.VTK_WIREFRAME
+    assert prop.GetLineWidth() == 3
+    assert prop.GetInterpolation() == vtk.VTK_PBR
+    assert prop.GetMetallic() == 0.5
+    plotter.show()
+
+
+@skip_no_plotting
+def test_add_mesh_lod():
+    sphere = pyvista.Sphere(theta_resolution=200, phi_resolution=200)
+    sphere['z'] = sphere.points[:, 2]
+    levels = lod_levels(sphere, (0.9, 0.99), scalars='z')
+    assert [level.active_scalars_name for level in levels] == ['z', 'z']
+    assert sphere.n_faces > levels[0].n_faces > levels[1].n_faces
+    with pytest.raises(ValueError):
+        lod_levels(sphere, [1.5])
+
+    plotter = pyvista.Plotter()
+    actor = plotter.add_mesh(sphere, lod=True)
+    assert isinstance(actor, vtk.vtkLODActor)
+    assert actor.GetLODMappers().GetNumberOfItems() == 2
+    with pytest.raises(ValueError):
+        plotter.add_mesh(examples.load_globe(), texture=True, lod=True)
+
+    def check_levels(plotter):
+        # the levels computed when adding the mesh are used from the first render
+        mappers = actor.GetLODMappers()
+        n_cells = [mappers.GetItemAsObject(i).GetInput().GetNumberOfCells() for i in range(2)]
+        assert sphere.n_cells > n_cells[0] > n_cells[1]
+
+    plotter.show(before_close_callback=check_levels)
+
+
 @skip_no_plotting
 def test_clear(sphere):
     plotter = pyvista.Plotter()
@@ -1497,6 +1583,38 @@ def test_volume_rendering():
     pyvista.plot(arr, volume=True, opacity='linear')
 
 
+@skip_no_plotting
+def test_update_volume_transfer_function():
+    vol = examples.load_uniform()
+    plotter = pyvista.Plotter()
+    volume = plotter.add_volume(vol, opacity='sigmoid', cmap='viridis', name='vol')
+    color_tf = volume.GetProperty().GetRGBTransferFunction()
+    opacity_tf = volume.GetProperty().GetScalarOpacity()
+    assert color_tf.GetSize() == opacity_tf.GetSize() == 256
+    assert np.allclose(color_tf.GetColor(0), get_cmap_safe('viridis')(0)[:3])
+
+    assert color_tf.GetRange() == (0, 255)
+
+    plotter.update_volume_transfer_function(cmap='bone', n_colors=16, opacity=[0, 1])
+    assert color_tf.GetSize() == opacity_tf.GetSize() == 16
+    assert np.allclose(color_tf.GetColor(0), get_cmap_safe('bone')(0)[:3])
+    assert np.allclose(color_tf.GetColor(15), get_cmap_safe('bone')(1.0)[:3])
+    assert plotter.mapper.lookup_table.GetNumberOfTableValues() == 16
+    # as with ``add_volume(n_colors=16)``
+    assert color_tf.GetRange() == opacity_tf.GetRange() == (0, 15)
+
+    plotter.update_volume_transfer_function('vol', clim=[200, 500])
+    assert plotter.mapper.lookup_table.GetRange() == (200, 500)
+    assert color_tf.GetRange() == pytest.approx((200 / 729 * 255, 500 / 729 * 255))
+
+    plotter.update_volume_transfer_function(n_colors=32)
+    assert color_tf.GetRange() == pytest.approx((200 / 729 * 255, 500 / 729 * 255))
+
+    with pytest.raises(ValueError):
+        plotter.update_volume_transfer_function('missing')
+    plotter.show()
+
+
 @skip_no_plotting
 def test_plot_compare_four():
     # Really just making sure no errors are thrown
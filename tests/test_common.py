@@ -1,4 +1,6 @@
+import concurrent.futures
 import pickle
+import sys
 import numpy as np
 import pytest
 import vtk
@@ -895,6 +897,182 @@ def test_find_closest_cells():
     assert np.allclose(indices[~mask], np.arange(mesh.n_faces)[~mask])
 
 
+def test_find_closest_cell_outside():
+    mesh = pyvista.UniformGrid((5, 5, 5)).cast_to_unstructured_grid()
+    points = np.array([[0.5, 0.5, 0.5], [3.5, 1.5, 2.5], [10, 10, 10]])
+    indices = mesh.find_closest_cell(points)
+    assert np.array_equal(indices, [0, 39, -1])
+
+    # same cells as a locator queried one point at a time
+    locator = pyvista._vtk.vtkCellLocator()
+    locator.SetDataSet(mesh)
+    locator.BuildLocator()
+    points = np.random.default_rng(0).random((100, 3)) * 6 - 1
+    indices = mesh.find_closest_cell(points)
+    assert np.array_equal(indices, [locator.FindCell(node) for node in points])
+    assert (indices == -1).any()
+
+    # the cell ids of the locator are not added to the mesh
+    assert not mesh.cell_arrays
+
+
+def test_find_nearest_cells():
+    mesh = pyvista.Sphere()
+    fcent = mesh.cell_centers().points
+    offset = fcent + mesh.cell_normals * 0.01
+    indices, closest, distance = mesh.find_nearest_cells(offset, return_closest_point=True,
+                                                         return_distance=True)
+    assert np.array_equal(indices, np.arange(mesh.n_cells))
+    assert np.allclose(closest, fcent, atol=1e-6)
+    assert np.allclose(distance, 0.01)
+
+    index, closest = mesh.find_nearest_cells(offset[5], return_closest_point=True)
+    assert index == 5
+    assert np.allclose(closest, fcent[5], atol=1e-6)
+
+    index, distance = mesh.find_nearest_cells(offset[5], return_distance=True)
+    assert isinstance(distance, float)
+    assert np.isclose(distance, 0.01)
+
+    # bsp locators do not support closest point queries
+    mesh.build_locator('cell', 'bsp')
+    assert mesh.find_nearest_cells(offset[5]) == 5
+
+    indices = pyvista.PolyData().find_nearest_cells(offset[:2])
+    assert np.array_equal(indices, [-1, -1])
+
+
+def test_find_nearest_cells_inside():
+    mesh = pyvista.UniformGrid((5, 5, 5)).cast_to_unstructured_grid()
+    points = np.array([[0.5, 0.5, 0.5], [5, 0.5, 0.5]])
+    indices, closest, distance = mesh.find_nearest_cells(points, return_closest_point=True,
+                                                         return_distance=True)
+    assert np.array_equal(indices, [0, 3])
+    assert np.allclose(closest, [[0.5, 0.5, 0.5], [4, 0.5, 0.5]])
+    assert np.allclose(distance, [0, 1])
+
+
+@pytest.mark.parametrize('k', [1, 3])
+def test_find_closest_points(k):
+    mesh = pyvista.Sphere()
+    rng = np.random.default_rng(0)
+    points = rng.random((20, 3)) - 0.5
+    dist = np.linalg.norm(points[:, np.newaxis] - mesh.points, axis=-1)
+    expected = np.argsort(dist, axis=1)[:, :k]
+
+    indices, distances = mesh.find_closest_points(points, k=k)
+    if k == 1:
+        assert indices.shape == distances.shape == (20,)
+        expected = expected[:, 0]
+    else:
+        assert indices.shape == distances.shape == (20, k)
+    assert np.array_equal(indices, expected)
+    assert np.allclose(distances, np.take_along_axis(dist, expected.reshape(20, -1),
+                                                     axis=1).reshape(indices.shape))
+
+    indices = mesh.find_closest_points(points[0], k=k, return_distances=False)
+    assert np.array_equal(indices, expected[0])
+
+
+@pytest.mark.parametrize('k', [1, 3])
+def test_find_closest_points_executor(k):
+    mesh = pyvista.Sphere()
+    mesh.build_locator('point', 'kdtree')
+    points = np.random.default_rng(0).random((50, 3)) - 0.5
+    expected = mesh.find_closest_points(points, k=k, return_distances=False)
+
+    indices, distances = mesh.find_closest_points(points, k=k, executor='process',
+                                                  max_workers=2)
+    assert np.array_equal(indices, expected)
+    assert distances.shape == expected.shape
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        indices = mesh.find_closest_points(points, k=k, return_distances=False,
+                                           executor=executor, max_workers=3)
+    assert np.array_equal(indices, expected)
+
+    with pytest.raises(ValueError):
+        mesh.find_closest_points(points, executor='not an executor')
+
+
+def test_find_closest_points_uniform_grid():
+    grid = pyvista.UniformGrid((5, 5, 5))
+    indices, _ = grid.find_closest_points([[1.1, 2.2, 3.6], [0, 0, 0]])
+    assert np.array_equal(indices, [111, 0])
+    with pytest.raises(TypeError):
+        grid.build_locator('point', 'static')
+
+
+def test_find_closest_points_invalid():
+    mesh = pyvista.Sphere()
+    with pytest.raises(ValueError):
+        mesh.find_closest_points([[0, 0]])
+    with pytest.raises(ValueError):
+        mesh.find_closest_points([0, 0, 0], k=0)
+    with pytest.raises(ValueError):
+        mesh.find_closest_points([0, 0, 0], k=mesh.n_points + 1)
+
+
+@pytest.mark.parametrize('locator_type', list(pyvista.core.dataset.POINT_LOCATORS))
+def test_build_locator_point(locator_type):
+    sphere = pyvista.Sphere()
+    locator = sphere.build_locator('point', locator_type)
+    assert isinstance(locator, pyvista.core.dataset.POINT_LOCATORS[locator_type])
+    assert sphere.find_closest_point(sphere.points[10]) == 10
+    # cached locator type is reused
+    assert sphere.build_locator('point') is locator
+
+
+@pytest.mark.parametrize('locator_type', list(pyvista.core.dataset.CELL_LOCATORS))
+def test_build_locator_cell(locator_type):
+    mesh = pyvista.Sphere()
+    locator = mesh.build_locator('cell', locator_type)
+    assert isinstance(locator, pyvista.core.dataset.CELL_LOCATORS[locator_type])
+    assert mesh.find_closest_cell(mesh.cell_centers().points[10]) == 10
+
+
+def test_build_locator_invalid():
+    sphere = pyvista.Sphere()
+    with pytest.raises(ValueError):
+        sphere.build_locator('not a kind')
+    with pytest.raises(ValueError):
+        sphere.build_locator('cell', 'not a type')
+
+
+def test_locator_cache_invalidation():
+    sphere = pyvista.Sphere()
+    locator = sphere.build_locator('point')
+    assert sphere.build_locator('point') is locator
+
+    # new arrays do not invalidate the locator
+    sphere['data'] = np.arange(sphere.n_points)
+    assert sphere.build_locator('point') is locator
+    assert sphere.build_locator('point', force=True) is not locator
+
+    locator = sphere.build_locator('point')
+    sphere.points = sphere.points * 2
+    assert sphere.build_locator('point') is not locator
+    assert sphere.find_closest_point([0, 0, 1]) == 1
+
+    locator = sphere.build_locator('cell')
+    sphere.drop_locator('cell')
+    assert sphere.build_locator('cell') is not locator
+    sphere.drop_locator()
+    assert not pyvista.core.dataset._LOCATORS[id(sphere)]
+
+
+def test_locator_released_with_dataset():
+    sphere = pyvista.Sphere()
+    sphere.build_locator('point')
+    sphere.build_locator('cell')
+    points = sphere.GetPoints()
+    key = id(sphere)
+    del sphere
+    assert key not in pyvista.core.dataset._LOCATORS
+    # the locators no longer keep the dataset alive
+    assert points.GetReferenceCount() == 1
+
+
 def test_setting_points_from_self(grid):
     grid_copy = grid.copy()
     grid.points = grid_copy.points
@@ -990,8 +1168,15 @@ def test_cell_type(grid):
     assert isinstance(ctype, int)
 
 
+@pytest.fixture()
+def pickle_format(request):
+    pyvista.set_pickle_format(request.param)
+    yield request.param
+    pyvista.set_pickle_format('buffers')
+
 
-def test_serialize_deserialize(datasets):
+@pytest.mark.parametrize('pickle_format', ['buffers', 'xml', 'legacy'], indirect=True)
+def test_serialize_deserialize(datasets, pickle_format):
     for dataset in datasets:
         dataset_2 = pickle.loads(pickle.dumps(dataset))
 
@@ -1026,6 +1211,43 @@ def test_serialize_deserialize(datasets):
             assert arr_have == pytest.approx(arr_expected)
 
 
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='Requires pickle protocol 5')
+def test_serialize_deserialize_out_of_band(datasets):
+    for dataset in datasets:
+        dataset.field_arrays['labels'] = ['a', 'b']
+        buffers = []
+        data = pickle.dumps(dataset, protocol=5, buffer_callback=buffers.append)
+        assert buffers
+        dataset_2 = pickle.loads(data, buffers=buffers)
+        assert isinstance(dataset_2, type(dataset))
+        assert dataset_2.n_points == dataset.n_points
+        assert dataset_2.n_cells == dataset.n_cells
+        assert dataset_2.active_scalars_name == dataset.active_scalars_name
+        assert np.array_equal(dataset_2.field_arrays['labels'], ['a', 'b'])
+        assert np.allclose(dataset_2.points, dataset.points)
+        for name in dataset.point_arrays:
+            assert np.allclose(dataset_2.point_arrays[name], dataset.point_arrays[name])
+
+
+def test_serialize_deserialize_buffers_fallback(hexbeam):
+    # bit arrays cannot be stored as buffers and fall back to xml
+    bit_array = vtk.vtkBitArray()
+    bit_array.SetName('bits')
+    bit_array.SetNumberOfValues(hexbeam.n_points)
+    hexbeam.GetPointData().AddArray(bit_array)
+    hexbeam_2 = pickle.loads(pickle.dumps(hexbeam))
+    assert hexbeam_2.n_cells == hexbeam.n_cells
+    assert 'bits' in hexbeam_2.point_arrays
+
+
+def test_set_pickle_format_invalid():
+    with pytest.raises(ValueError):
+        pyvista.set_pickle_format('not a format')
+    with pytest.raises(ValueError):
+        pyvista.set_pickle_format('xml', compression='not a compressor')
+    assert pyvista.PICKLE_FORMAT == 'buffers'
+
+
 def test_rotations_should_match_by_a_360_degree_difference():
     mesh = examples.load_airplane()
 
@@ -410,3 +410,146 @@ def test_multi_block_data_range():
     mi, ma = slices.get_data_range(volume.active_scalars_name)
     assert mi is not None
     assert ma is not None
+
+
+@pytest.mark.parametrize('executor', [None, 'thread', 'process'])
+def test_multi_block_map(executor):
+    blocks = MultiBlock({'sphere': pyvista.Sphere(), 'cube': pyvista.Cube()})
+    blocks['nested'] = MultiBlock({'cone': pyvista.Cone(), 'empty': None})
+
+    clipped = blocks.map('clip', executor=executor, max_workers=2, normal='x')
+    assert clipped.keys() == ['sphere', 'cube', 'nested']
+    assert clipped['nested'].keys() == ['cone', 'empty']
+    assert clipped['nested']['empty'] is None
+    assert np.allclose(clipped['sphere'].points, blocks['sphere'].clip(normal='x').points)
+    assert clipped['nested']['cone'].n_points == blocks['nested']['cone'].clip(normal='x').n_points
+
+    def translate(block, xyz):
+        block = block.copy()
+        block.translate(xyz)
+        return block
+
+    if executor != 'process':
+        translated = blocks.map(translate, [1, 0, 0], executor=executor)
+        assert np.allclose(translated['cube'].center, [1, 0, 0])
+
+
+def test_multi_block_map_executor_instance():
+    from concurrent.futures import ThreadPoolExecutor
+
+    blocks = MultiBlock([pyvista.Sphere(), pyvista.Cube()])
+    with ThreadPoolExecutor(2) as executor:
+        surfaces = blocks.map('extract_surface', executor=executor)
+    assert surfaces.n_blocks == 2
+    assert surfaces.keys() == blocks.keys()
+
+
+def test_multi_block_map_invalid():
+    blocks = MultiBlock([pyvista.Sphere()])
+    with pytest.raises(ValueError):
+        blocks.map('clip', executor='not an executor')
+    with pytest.raises(TypeError):
+        blocks.map(lambda block: block.n_points)
+
+
+@pytest.fixture()
+def multi_block_file(tmpdir):
+    blocks = MultiBlock({'sphere': pyvista.Sphere(), 'wavelet': pyvista.Wavelet()})
+    blocks['nested'] = MultiBlock({'cone': pyvista.Cone()})
+    blocks[3, 'empty'] = None
+    blocks['rectilinear'] = RectilinearGrid(np.array([0, 1, 2.0]), np.array([0, 1.0]),
+                                            np.array([0, 3.0]))
+    filename = str(tmpdir.join('blocks.vtm'))
+    blocks.save(filename)
+    return filename, blocks
+
+
+def test_lazy_multi_block(multi_block_file):
+    filename, blocks = multi_block_file
+    lazy = pyvista.read(filename, lazy=True)
+    assert isinstance(lazy, pyvista.LazyMultiBlock)
+    assert lazy.keys() == ['sphere', 'wavelet', 'nested', None, 'rectilinear']
+    assert len(lazy) == lazy.n_blocks == 5
+    assert lazy['nested'].keys() == ['cone']
+    assert lazy[3] is None
+    assert lazy.get_block_bounds(3) is None
+    assert lazy.get_filename('nested') is None
+
+    # bounds come from metadata
+    assert np.allclose(lazy.bounds, blocks.bounds)
+    assert np.allclose(lazy.get_block_bounds('wavelet'), blocks['wavelet'].bounds)
+    assert lazy.n_cached_blocks == 0
+
+    sphere = lazy['sphere']
+    assert np.allclose(sphere.points, blocks['sphere'].points)
+    assert lazy[0] is sphere
+    assert lazy.n_cached_blocks == 1
+    assert lazy['nested'][0].n_points == blocks['nested'][0].n_points
+    assert lazy.n_cached_blocks == 2
+    assert lazy.cached_memory_size > 0
+
+    loaded = lazy.load()
+    assert isinstance(loaded, MultiBlock)
+    assert loaded['nested'].keys() == ['cone']
+    assert np.allclose(loaded['wavelet'].points, blocks['wavelet'].points)
+
+    lazy.clear_cache()
+    assert lazy.n_cached_blocks == 0
+    with pytest.raises(IndexError):
+        lazy[5]
+    with pytest.raises(KeyError):
+        lazy['not a block']
+
+
+def test_lazy_multi_block_cache_limits(multi_block_file):
+    filename, _ = multi_block_file
+    lazy = pyvista.LazyMultiBlock(filename, max_blocks=2)
+    sphere = lazy[0]
+    lazy[1]
+    lazy[0]
+    lazy[-1]
+    # the wavelet was the least recently used block
+    assert lazy.n_cached_blocks == 2
+    assert lazy[0] is sphere
+
+    lazy.max_blocks = None
+    lazy.memory_budget = 1
+    assert lazy.n_cached_blocks == 1
+    lazy[1]
+    assert lazy.n_cached_blocks == 1
+    assert lazy.memory_budget == 1
+
+
+def test_lazy_multi_block_from_list(tmpdir):
+    filenames = [ex.antfile, ex.planefile]
+    lazy = pyvista.read(filenames, lazy=True)
+    assert lazy.keys() == ['ant.ply', 'airplane.ply']
+    assert [block.n_points for block in lazy] == [486, 1335]
+    assert np.allclose(lazy.bounds, pyvista.read(filenames).bounds)
+
+
+def test_lazy_multi_block_load(multi_block_file):
+    filename, blocks = multi_block_file
+    lazy = pyvista.read(filename, lazy=True)
+    assert not isinstance(lazy, pyvista.MultiBlock)
+
+    # the loaded blocks can be used wherever a MultiBlock is expected
+    multi = lazy.load()
+    assert isinstance(multi, pyvista.MultiBlock)
+    assert multi.n_blocks == lazy.n_blocks
+    assert multi.keys()[:3] == lazy.keys()[:3]
+    assert multi.combine().n_points == pyvista.read(filename).combine().n_points
+    assert np.allclose(multi.extract_geometry().bounds, lazy.bounds)
+
+
+def test_lazy_multi_block_invalid(tmpdir):
+    with pytest.raises(ValueError):
+        pyvista.read(ex.antfile, lazy=True)
+    with pytest.raises(FileNotFoundError):
+        pyvista.LazyMultiBlock(['not a file.vtp'])
+    with pytest.raises(TypeError):
+        pyvista.LazyMultiBlock(1)
+    filename = str(tmpdir.join('sphere.vtp'))
+    pyvista.Sphere().save(filename)
+    with pytest.raises(ValueError):
+        pyvista.LazyMultiBlock(filename)
@@ -1,5 +1,8 @@
+import gzip
+import json
 import os
 import sys
+import zipfile
 
 import numpy as np
 import pytest
@@ -7,6 +10,7 @@ import pytest
 import pyvista
 from pyvista import examples as ex
 from pyvista.plotting import system_supports_plotting
+from pyvista.plotting.export_vtkjs import _array_to_buffer, _SceneWriter
 
 if __name__ != '__main__':
     OFF_SCREEN = 'pytest' in sys.modules
@@ -95,3 +99,50 @@ def test_vtkjs_url():
     vtkjs_url = 'http://viewer.pyvista.org/?fileURL=https://dl.dropbox.com/s/6m5ttdbv5bf4ngj/ripple.vtkjs?dl=0'
     assert vtkjs_url in pyvista.get_vtkjs_url(file_url)
     assert vtkjs_url in pyvista.get_vtkjs_url('dropbox', file_url)
+
+
+@pytest.mark.skipif(not system_supports_plotting(), reason="Requires system to support plotting")
+@pytest.mark.parametrize('compress_arrays', [False, True])
+def test_export_vtkjs_arrays(tmpdir, compress_arrays):
+    filename = str(tmpdir.mkdir("tmpdir").join('scene-arrays'))
+    mesh = pyvista.Sphere()
+    plotter = pyvista.Plotter(off_screen=OFF_SCREEN)
+    plotter.add_mesh(mesh)
+    plotter.add_mesh(mesh.copy())
+    plotter.export_vtkjs(filename, compress_arrays=compress_arrays)
+    plotter.close()
+
+    with zipfile.ZipFile(f'{filename}.vtkjs') as archive:
+        for name in ('data_0_0', 'data_0_1'):
+            root = json.loads(archive.read(f'scene-arrays/{name}/index.json'))
+            for key, expected in (('points', mesh.points.ravel()),
+                                  ('polys', mesh.faces)):
+                ref = root[key]['ref']
+                path = f"scene-arrays/{name}/{ref['basepath']}/{ref['id']}"
+                if compress_arrays:
+                    data = gzip.decompress(archive.read(f'{path}.gz'))
+                else:
+                    data = archive.read(path)
+                dtype = np.uint32 if key == 'polys' else np.float32
+                assert np.array_equal(np.frombuffer(data, dtype), expected)
+
+
+def test_export_vtkjs_id_array():
+    ids = pyvista._vtk.numpy_to_vtkIdTypeArray(np.array([0, 3, -1, -5, 7]))
+    buffer = _array_to_buffer(ids)
+    assert buffer.dtype == np.uint32
+    assert np.array_equal(buffer.view(np.int32), [0, 3, -1, -1, 7])
+
+
+@pytest.mark.parametrize('max_workers', [None, 2])
+def test_scene_writer_compress(tmpdir, max_workers):
+    data_dir = str(tmpdir.join('data'))
+    values = np.arange(100, dtype=np.float32)
+    writer = _SceneWriter(compress=True, max_workers=max_workers)
+    md5 = writer.add_array(data_dir, values)
+    assert writer.add_array(data_dir, values.copy()) == md5
+    writer.close()
+
+    assert os.listdir(data_dir) == [f'{md5}.gz']
+    with open(os.path.join(data_dir, f'{md5}.gz'), 'rb') as f:
+        assert np.array_equal(np.frombuffer(gzip.decompress(f.read()), np.float32), values)
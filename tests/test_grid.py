@@ -148,6 +148,50 @@ def test_init_from_arrays(specify_offset):
         with pytest.raises(AttributeError):
             grid.cell_connectivity
 
+
+@pytest.mark.skipif(not VTK9, reason='Requires VTK 9')
+@pytest.mark.parametrize('deep', [False, True])
+def test_init_from_offsets_connectivity(deep):
+    _, cells, cell_type, points = create_hex_example()
+    offsets = np.array([0, 8, 16], pyvista.ID_TYPE)
+    connectivity = np.arange(16, dtype=pyvista.ID_TYPE)
+    cell_type = cell_type.astype(np.uint8)
+    grid = pyvista.UnstructuredGrid(offsets=offsets, connectivity=connectivity,
+                                    celltypes=cell_type, points=points, deep=deep)
+    assert grid.n_cells == 2
+    assert np.array_equal(grid.cells, cells)
+    assert np.array_equal(grid.offset, offsets)
+    assert np.array_equal(grid.cell_connectivity, connectivity)
+    assert np.shares_memory(grid.offset, offsets) is not deep
+    assert np.shares_memory(grid.cell_connectivity, connectivity) is not deep
+    assert np.shares_memory(grid.celltypes, cell_type) is not deep
+
+    # arrays stay valid after the inputs are released
+    grid = pyvista.UnstructuredGrid(offsets=offsets.tolist(),
+                                    connectivity=connectivity.astype(np.int32),
+                                    celltypes=cell_type.tolist(), points=points)
+    assert np.array_equal(grid.cell_connectivity, connectivity)
+    assert np.array_equal(grid.celltypes, cell_type)
+
+
+@pytest.mark.skipif(not VTK9, reason='Requires VTK 9')
+def test_init_from_offsets_connectivity_invalid():
+    _, _, cell_type, points = create_hex_example()
+    connectivity = np.arange(16)
+    kwargs = dict(connectivity=connectivity, celltypes=cell_type, points=points)
+    with pytest.raises(ValueError):
+        pyvista.UnstructuredGrid(offsets=np.array([0, 8, 15]), **kwargs)
+    with pytest.raises(ValueError):
+        pyvista.UnstructuredGrid(offsets=np.array([0, 9, 8, 16]), **kwargs)
+    with pytest.raises(ValueError):
+        pyvista.UnstructuredGrid(offsets=np.array([0, 16]), **kwargs)
+    with pytest.raises(TypeError):
+        pyvista.UnstructuredGrid(connectivity=connectivity, celltypes=cell_type,
+                                 points=points)
+    with pytest.raises(TypeError):
+        pyvista.UnstructuredGrid(points, offsets=np.array([0, 8, 16]), **kwargs)
+
+
 @pytest.mark.parametrize('multiple_cell_types', [False, True])
 @pytest.mark.parametrize('flat_cells', [False, True])
 def test_init_from_dict(multiple_cell_types, flat_cells):
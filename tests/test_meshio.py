@@ -9,6 +9,13 @@ from pyvista import examples
 beam = pyvista.UnstructuredGrid(examples.hexbeamfile)
 airplane = examples.load_airplane().cast_to_unstructured_grid()
 uniform = examples.load_uniform().cast_to_unstructured_grid()
+# interleaved triangles, quads and polygons of several sizes
+mixed = pyvista.PolyData(
+    np.random.random((10, 3)),
+    [3, 0, 1, 2, 4, 2, 3, 4, 5, 3, 5, 6, 7, 5, 0, 1, 2, 3, 4,
+     6, 4, 5, 6, 7, 8, 9, 5, 5, 6, 7, 8, 9, 4, 6, 7, 8, 9],
+).cast_to_unstructured_grid()
+mixed.cell_arrays['cell_ids'] = np.arange(mixed.n_cells)
 
 
 @pytest.mark.parametrize("mesh_in", [beam, airplane, uniform])
@@ -20,6 +27,7 @@ def test_meshio(mesh_in, tmpdir):
 
     # Assert mesh is still the same
     assert np.allclose(mesh_in.points, mesh.points)
+    assert np.array_equal(mesh_in.celltypes, mesh.celltypes) or (mesh_in.celltypes == 11).all()
     if (mesh_in.celltypes == 11).all():
         cells = mesh_in.cells.reshape((mesh_in.n_cells, 9))[:,[0,1,2,4,3,5,6,8,7]].ravel()
         assert np.allclose(cells, mesh.cells)
@@ -31,6 +39,39 @@ def test_meshio(mesh_in, tmpdir):
         assert np.allclose(v, mesh.cell_arrays[k.replace(" ", "_")])
 
 
+def test_meshio_mixed(tmpdir):
+    filename = str(tmpdir.mkdir("tmpdir").join("test_mesh.vtu"))
+    pyvista.save_meshio(filename, mixed)
+    mesh = pyvista.read_meshio(filename)
+    assert np.array_equal(mesh.celltypes, mixed.celltypes)
+    assert np.array_equal(mesh.cells, mixed.cells)
+    assert np.array_equal(mesh.cell_arrays['cell_ids'], mixed.cell_arrays['cell_ids'])
+
+
+def test_meshio_polyhedron(tmpdir):
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+                       [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+                       [0.5, 0.5, 2]], float)
+    faces = [6, 4, 0, 3, 2, 1, 4, 4, 5, 6, 7, 4, 0, 1, 5, 4,
+             4, 1, 2, 6, 5, 4, 2, 3, 7, 6, 4, 3, 0, 4, 7,
+             5, 4, 4, 5, 6, 7, 3, 4, 5, 8, 3, 5, 6, 8, 3, 6, 7, 8, 3, 7, 4, 8]
+    cells = [8, 0, 1, 2, 3, 4, 5, 6, 7, 5, 4, 5, 6, 7, 8]
+    mesh_in = pyvista.UnstructuredGrid()
+    mesh_in.SetPoints(pyvista.vtk_points(points))
+    mesh_in.SetCells(pyvista._vtk.numpy_to_vtk(np.array([42, 42], np.uint8), deep=True),
+                     pyvista.utilities.cells.CellArray(cells, 2),
+                     pyvista.utilities.cells.numpy_to_idarr([0, 31]),
+                     pyvista.utilities.cells.numpy_to_idarr(faces))
+
+    filename = str(tmpdir.mkdir("tmpdir").join("test_mesh.vtu"))
+    pyvista.save_meshio(filename, mesh_in)
+    mesh = pyvista.read_meshio(filename)
+    assert np.array_equal(mesh.celltypes, [42, 42])
+    assert np.array_equal(mesh.cells, cells)
+    assert np.array_equal(pyvista._vtk.vtk_to_numpy(mesh.GetFaces()), faces)
+    assert np.isclose(mesh.volume, mesh_in.volume)
+
+
 def test_pathlib_read_write(tmpdir, sphere):
     path = pathlib.Path(str(tmpdir.mkdir("tmpdir").join('tmp.vtk')))
     pyvista.save_meshio(path, sphere)
@@ -265,6 +265,36 @@ def test_multi_ray_trace(sphere):
     assert np.any(ind_t)
 
 
+def test_multi_ray_trace_vtk(sphere):
+    origins = [[0.2, 0.1, 1], [0, 0, 1], [2, 0, 1]]
+    directions = [[0, 0, -1]] * 3
+    points, ind_r, ind_t = sphere.multi_ray_trace(origins, directions, engine='vtk')
+    assert np.array_equal(ind_r, [0, 0, 1, 1])
+    assert np.allclose(np.linalg.norm(points, axis=1), 0.5, atol=2e-2)
+    # hits are sorted by distance along each ray
+    assert points[0, 2] > points[1, 2] and points[2, 2] > points[3, 2]
+    _, cells = sphere.ray_trace(origins[0], [0.2, 0.1, -1])
+    assert np.array_equal(ind_t[:2], cells)
+
+    points, ind_r, ind_t = sphere.multi_ray_trace(origins, directions, first_point=True,
+                                                  engine='vtk')
+    assert np.array_equal(ind_r, [0, 1])
+    assert np.allclose(points[1], [0, 0, 0.5])
+
+    points, ind_r, ind_t = sphere.multi_ray_trace(origins[2:], directions[2:], engine='vtk')
+    assert points.shape == (0, 3)
+    assert ind_r.size == ind_t.size == 0
+
+
+def test_multi_ray_trace_invalid(sphere):
+    with pytest.raises(ValueError):
+        sphere.multi_ray_trace([[0, 0, 0]], [[0, 0, 1]], engine='not an engine')
+    with pytest.raises(ValueError):
+        sphere.multi_ray_trace([[0, 0, 0]], [[0, 0, 1], [0, 0, 1]])
+    with pytest.raises(ValueError):
+        sphere.multi_ray_trace([[0, 0, 0]], [[0, 0, 0]], engine='vtk')
+
+
 @pytest.mark.skipif(not system_supports_plotting(), reason="Requires system to support plotting")
 def test_plot_curvature(sphere):
     sphere.plot_curvature(off_screen=True)
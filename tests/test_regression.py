@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
 import pyvista as pv
+from pyvista.utilities.regression import wrap_image_array
 
 def test_compare_images_two_plotters_same(sphere, tmpdir):
     filename = str(tmpdir.mkdir("tmpdir").join('tmp.png'))
@@ -51,3 +53,77 @@ def test_compare_images_two_plotter_different(sphere, airplane, tmpdir):
 
     with pytest.raises(TypeError):
         pv.compare_images(im1, pl1.ren_win)
+
+
+@pytest.mark.parametrize('metric', ['mean', 'luminance', 'ssim'])
+def test_compare_images_numpy_metrics(metric):
+    rng = np.random.default_rng(0)
+    img1 = rng.integers(0, 256, (100, 120, 3), dtype=np.uint8)
+    img2 = img1.copy()
+    img2[10:50, 20:80] = 0
+
+    assert pv.compare_images(img1, img1.copy(), use_vtk=False, metric=metric) == 0
+    error = pv.compare_images(img1, img2, use_vtk=False, metric=metric)
+    assert error > 0
+
+    # the comparison stops once the maximum error is exceeded
+    partial = pv.compare_images(img1, img2, use_vtk=False, metric=metric,
+                                max_error=error / 10)
+    assert error / 10 < partial <= error
+
+
+def test_compare_images_numpy_uint8():
+    black = np.zeros((10, 10, 3), np.uint8)
+    white = np.full((10, 10, 4), 255, np.uint8)
+    # uint8 differences must not wrap around
+    assert pv.compare_images(black, white, use_vtk=False) == 3*255
+    assert pv.compare_images(white, black, use_vtk=False) == 3*255
+    assert pv.compare_images(wrap_image_array(white), white, use_vtk=False) == 0
+
+    with pytest.raises(ValueError, match='Invalid metric'):
+        pv.compare_images(black, black, use_vtk=False, metric='foo')
+    with pytest.raises(ValueError, match='Invalid metric'):
+        pv.compare_images(black, black, metric='foo')
+    with pytest.raises(ValueError, match='use_vtk=False'):
+        pv.compare_images(black, black, metric='ssim')
+    with pytest.raises(ValueError, match='use_vtk=False'):
+        pv.compare_images(black, black, max_error=1)
+    with pytest.raises(ValueError, match='Invalid max_error'):
+        pv.compare_images(black, black, use_vtk=False, max_error=-1)
+    with pytest.raises(RuntimeError, match='not the same size'):
+        pv.compare_images(black, black[1:], use_vtk=False)
+
+
+def test_compare_images_luminance():
+    black = np.zeros((10, 10, 3), np.uint8)
+    white = np.full((10, 10, 3), 255, np.uint8)
+    # the weighted channels must not overflow
+    assert pv.compare_images(black, white, use_vtk=False, metric='luminance') == 255
+    assert pv.compare_images(white, black, use_vtk=False, metric='luminance') == 255
+
+
+@pytest.mark.parametrize('executor', [None, 'thread'])
+def test_compare_images_batch(tmpdir, executor):
+    imageio = pytest.importorskip('imageio')
+    cache = tmpdir.mkdir('cache')
+    screenshots = tmpdir.mkdir('screenshots')
+    black = np.zeros((16, 16, 3), np.uint8)
+    white = np.full((16, 16, 3), 255, np.uint8)
+    imageio.imwrite(str(cache.join('a.png')), black)
+    imageio.imwrite(str(cache.join('b.png')), black)
+    imageio.imwrite(str(screenshots.join('a.png')), black)
+    imageio.imwrite(str(screenshots.join('b.png')), white)
+
+    errors = pv.compare_images_batch(str(cache), str(screenshots), executor=executor)
+    assert errors == {'a.png': 0, 'b.png': 3*255}
+
+    errors = pv.compare_images_batch([black, white], [black, black], executor=executor)
+    assert errors == [0, 3*255]
+
+    imageio.imwrite(str(cache.join('c.png')), black)
+    with pytest.raises(FileNotFoundError, match='c.png'):
+        pv.compare_images_batch(str(cache), str(screenshots))
+    with pytest.raises(ValueError, match='same number'):
+        pv.compare_images_batch([black], [black, black])
+    with pytest.raises(ValueError, match='Invalid executor'):
+        pv.compare_images_batch([black], [black], executor='foo')
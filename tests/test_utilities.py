@@ -1,8 +1,12 @@
 """ test pyvista.utilities """
+import concurrent.futures
+import json
+import threading
 import warnings
 import pathlib
 import os
 import shutil
+import sys
 
 import numpy as np
 import pytest
@@ -86,6 +90,35 @@ def test_read(tmpdir, use_pathlib):
     assert multi[1].n_blocks == 2
 
 
+@pytest.mark.parametrize('executor', [None, 'thread', 'process'])
+def test_read_many(executor):
+    files = [ex.antfile, ex.planefile, ex.hexbeamfile]
+    multi, timings = pyvista.read_many(files, executor=executor, return_timings=True)
+    assert multi.keys() == [os.path.basename(filename) for filename in files]
+    for filename, mesh in zip(files, multi):
+        assert np.array_equal(mesh.points, pyvista.read(filename).points)
+    assert len(timings) == len(files)
+    assert all(seconds >= 0 for seconds in timings)
+
+    results = list(pyvista.read_many(files, executor=executor, stream=True))
+    assert sorted(index for index, _, _ in results) == [0, 1, 2]
+    for index, mesh, _ in results:
+        assert mesh.n_points == multi[index].n_points
+
+
+def test_read_many_executor():
+    from concurrent.futures import ThreadPoolExecutor
+    files = [ex.antfile, ex.planefile]
+    with ThreadPoolExecutor(2) as executor:
+        multi = pyvista.read_many(files, executor=executor, force_ext='.ply')
+    assert multi.n_blocks == 2
+
+    with pytest.raises(ValueError):
+        pyvista.read_many(files, executor='fork')
+    with pytest.raises(FileNotFoundError):
+        pyvista.read_many(files + ['not_a_file.vtu'])
+
+
 def test_read_force_ext(tmpdir):
     fnames = (ex.antfile, ex.planefile, ex.hexbeamfile, ex.spherefile,
               ex.uniformfile, ex.rectfile)
@@ -185,6 +218,296 @@ def test_read_plot3d(srr_mock, auto_detect):
     assert kwargs['attrs'] == {'SetAutoDetectFormat': auto_detect}
 
 
+@pytest.mark.parametrize('dataset', [pyvista.Sphere(), ex.load_hexbeam(),
+                                     ex.load_uniform(), ex.load_rectilinear(),
+                                     ex.load_structured()])
+def test_read_raw(tmpdir, dataset):
+    filename = str(tmpdir.join('mesh.pvraw'))
+    dataset = dataset.copy()
+    dataset.field_arrays['name'] = ['mesh', 'grid']
+    dataset.point_arrays['values'] = np.arange(dataset.n_points, dtype=float)
+    dataset.save(filename)
+
+    mesh = pyvista.read(filename)
+    assert isinstance(mesh, type(dataset))
+    assert np.array_equal(mesh.points, dataset.points)
+    assert mesh.n_cells == dataset.n_cells
+    for name in dataset.array_names:
+        assert np.array_equal(mesh[name], dataset[name])
+
+    # changes are only written back to the file with "r+"
+    mesh.point_arrays['values'][0] = -1
+    assert pyvista.read(filename).point_arrays['values'][0] == 0
+    mesh = pyvista.read_raw(filename, mode='r+')
+    mesh.point_arrays['values'][0] = -1
+    del mesh
+    assert type(dataset)(filename).point_arrays['values'][0] == -1
+
+
+def test_read_raw_invalid(tmpdir):
+    filename = str(tmpdir.join('mesh.pvraw'))
+    with open(filename, 'wb') as f:
+        f.write(b'not a mesh')
+    with pytest.raises(ValueError):
+        pyvista.read(filename)
+    pyvista.Sphere().save(filename)
+    with pytest.raises(ValueError):
+        pyvista.read_raw(filename, mode='r')
+
+
+@pytest.mark.parametrize('executor', [None, 'thread'])
+@pytest.mark.parametrize('partition', ['cells', 'spatial'])
+def test_save_partitioned(tmpdir, partition, executor):
+    grid = ex.load_hexbeam()
+    grid.point_arrays['vectors'] = np.random.random((grid.n_points, 3)).astype(np.float32)
+    grid.cell_arrays['names'] = np.array([f'cell {i}' for i in range(grid.n_cells)])
+    grid.field_arrays['info'] = [1, 2]
+    filename = str(tmpdir.join('grid.pvtu'))
+    pyvista.save_partitioned(filename, grid, n_pieces=3, partition=partition,
+                             executor=executor)
+    assert len(tmpdir.listdir()) == 4
+
+    mesh = pyvista.read(filename)
+    assert isinstance(mesh, pyvista.UnstructuredGrid)
+    assert mesh.n_cells == grid.n_cells
+    assert set(mesh.array_names) == set(grid.array_names)
+    assert mesh.point_arrays['vectors'].dtype == np.float32
+    # points shared by several pieces are duplicated
+    order = np.argsort(mesh.cell_arrays['sample_cell_scalars'])
+    assert np.allclose(mesh.cell_centers().points[order], grid.cell_centers().points)
+    if partition == 'cells':
+        assert np.array_equal(order, np.arange(grid.n_cells))
+
+
+def test_save_partitioned_polydata(tmpdir):
+    mesh = pyvista.Sphere() + pyvista.Line() + pyvista.PolyData(np.random.random((3, 3)))
+    mesh.cell_arrays['ids'] = np.arange(mesh.n_cells)
+    filename = str(tmpdir.join('mesh.pvtp'))
+    mesh.save(filename)
+    read_mesh = pyvista.read(filename)
+    assert isinstance(read_mesh, pyvista.PolyData)
+    assert np.array_equal(np.sort(read_mesh['ids']), mesh['ids'])
+    assert read_mesh.GetNumberOfVerts() == mesh.GetNumberOfVerts()
+    assert read_mesh.GetNumberOfLines() == mesh.GetNumberOfLines()
+    assert read_mesh.GetNumberOfPolys() == mesh.GetNumberOfPolys()
+
+    for compression in ['lz4', 'lzma', None]:
+        pyvista.save_partitioned(filename, mesh, n_pieces=2, compression=compression,
+                                 compression_level=9)
+        assert pyvista.read(filename).n_cells == mesh.n_cells
+
+    with pytest.raises(ValueError):
+        pyvista.save_partitioned(filename, mesh, compression='gzip')
+    with pytest.raises(ValueError):
+        pyvista.save_partitioned(filename, mesh, partition='random')
+    with pytest.raises(ValueError):
+        pyvista.save_partitioned(filename, mesh, executor='cluster')
+    with pytest.raises(ValueError):
+        pyvista.save_partitioned(str(tmpdir.join('mesh.vtp')), mesh)
+    with pytest.raises(TypeError):
+        pyvista.save_partitioned(filename, ex.load_hexbeam())
+
+
+def test_save_partitioned_bool_arrays(tmpdir):
+    grid = ex.load_hexbeam()
+    grid.point_arrays['ids'] = np.arange(grid.n_points)
+    grid.point_arrays['mask'] = np.arange(grid.n_points) % 2 == 0
+    bits = np.arange(grid.n_cells) % 3 == 0
+    bit_array = pyvista._vtk.vtkBitArray()
+    bit_array.DeepCopy(pyvista._vtk.numpy_to_vtk(bits.astype(np.uint8)))
+    bit_array.SetName('bits')
+    grid.GetCellData().AddArray(bit_array)
+
+    filename = str(tmpdir.join('grid.pvtu'))
+    pyvista.save_partitioned(filename, grid, n_pieces=3)
+    mesh = pyvista.read(filename)
+    # the partitioned reader of VTK misreads bit arrays, unlike the
+    # reader of the pieces
+    pieces = [pyvista.read(str(tmpdir.join(f'grid_{i}.vtu'))) for i in range(3)]
+    assert isinstance(pieces[0].GetCellData().GetAbstractArray('bits'),
+                      pyvista._vtk.vtkBitArray)
+    assert np.array_equal(np.concatenate([piece.cell_arrays['bits'] for piece in pieces]),
+                          bits)
+    assert np.array_equal(mesh.cell_arrays['sample_cell_scalars'],
+                          grid.cell_arrays['sample_cell_scalars'])
+    ids = mesh.point_arrays['ids']
+    assert np.array_equal(mesh.point_arrays['mask'] != 0, grid.point_arrays['mask'][ids])
+
+
+def test_save_partitioned_polyhedron(tmpdir):
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+                       [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+                       [0.5, 0.5, 2]], float)
+    faces = [6, 4, 0, 3, 2, 1, 4, 4, 5, 6, 7, 4, 0, 1, 5, 4,
+             4, 1, 2, 6, 5, 4, 2, 3, 7, 6, 4, 3, 0, 4, 7,
+             5, 4, 4, 5, 6, 7, 3, 4, 5, 8, 3, 5, 6, 8, 3, 6, 7, 8, 3, 7, 4, 8]
+    grid = pyvista.UnstructuredGrid()
+    grid.SetPoints(pyvista.vtk_points(points))
+    grid.SetCells(pyvista._vtk.numpy_to_vtk(np.array([42, 42], np.uint8), deep=True),
+                  cells.CellArray([8, 0, 1, 2, 3, 4, 5, 6, 7, 5, 4, 5, 6, 7, 8], 2),
+                  cells.numpy_to_idarr([0, 31]), cells.numpy_to_idarr(faces))
+    grid.cell_arrays['ids'] = [0, 1]
+
+    filename = str(tmpdir.join('grid.pvtu'))
+    grid.save(filename)
+    mesh = pyvista.read(filename)
+    assert np.array_equal(mesh.celltypes, [42, 42])
+    assert mesh.array_names == ['ids']
+    assert np.isclose(mesh.volume, grid.volume)
+
+
+def test_read_arrays(tmpdir):
+    grid = ex.load_hexbeam()
+    grid.point_arrays['a'] = np.arange(grid.n_points)
+    grid.point_arrays['b'] = np.ones((grid.n_points, 3))
+    filename = str(tmpdir.join('grid.vtu'))
+    grid.save(filename)
+
+    mesh = pyvista.read(filename, point_arrays=['a'], cell_arrays=[])
+    assert mesh.point_arrays.keys() == ['a']
+    assert not mesh.cell_arrays.keys()
+    assert np.array_equal(mesh['a'], grid['a'])
+    mesh = pyvista.read(filename, point_arrays='b')
+    assert mesh.point_arrays.keys() == ['b']
+    assert mesh.cell_arrays.keys() == grid.cell_arrays.keys()
+    multi = pyvista.read([filename, filename], cell_arrays=[])
+    assert not multi[1].cell_arrays.keys()
+
+    with pytest.raises(KeyError):
+        pyvista.read(filename, point_arrays=['missing'])
+    with pytest.raises(ValueError):
+        pyvista.read([filename], point_arrays=['a'], lazy=True)
+    filename = str(tmpdir.join('grid.vtk'))
+    grid.save(filename)
+    with pytest.raises(TypeError):
+        pyvista.read(filename, point_arrays=['a'])
+
+
+def test_inspect(tmpdir):
+    grid = ex.load_hexbeam()
+    grid.point_arrays['b'] = np.ones((grid.n_points, 3), dtype=np.float32)
+    filename = str(tmpdir.join('grid.vtu'))
+    grid.save(filename)
+    info = pyvista.inspect(filename)
+    assert info['type'] == 'UnstructuredGrid'
+    assert info['n_points'] == grid.n_points
+    assert info['n_cells'] == grid.n_cells
+    assert np.allclose(info['bounds'], grid.bounds)
+    assert set(info['point_arrays']) == set(grid.point_arrays.keys())
+    assert info['point_arrays']['b'] == {'dtype': np.float32, 'n_components': 3}
+    assert set(info['cell_arrays']) == set(grid.cell_arrays.keys())
+
+    # image data is described from the header alone
+    image = ex.load_uniform()
+    filename = str(tmpdir.join('image.vti'))
+    image.save(filename)
+    info = pyvista.inspect(filename)
+    assert info['type'] == 'UniformGrid'
+    assert info['n_points'] == image.n_points
+    assert info['n_cells'] == image.n_cells
+    assert np.allclose(info['bounds'], image.bounds)
+
+    # legacy files are fully read
+    info = pyvista.inspect(ex.hexbeamfile)
+    assert info['n_cells'] == grid.n_cells
+    assert info['point_arrays']['sample_point_scalars']['n_components'] == 1
+
+    multi = pyvista.MultiBlock([grid, image])
+    filename = str(tmpdir.join('multi.vtm'))
+    multi.save(filename)
+    info = pyvista.inspect(filename)
+    assert info['type'] == 'MultiBlock'
+    assert info['n_points'] == grid.n_points + image.n_points
+    assert np.allclose(info['bounds'], multi.bounds)
+
+    with pytest.raises(FileNotFoundError):
+        pyvista.inspect(str(tmpdir.join('missing.vtu')))
+
+
+def _time_series_pvd(tmpdir, n_steps=3):
+    sphere = pyvista.Sphere()
+    lines = ['<VTKFile type="Collection" version="0.1">', '<Collection>']
+    for i in range(n_steps):
+        sphere.point_arrays['p'] = np.full(sphere.n_points, i, dtype=float)
+        sphere.point_arrays['q'] = np.zeros(sphere.n_points)
+        sphere.cell_arrays['c'] = np.ones(sphere.n_cells)
+        sphere.save(str(tmpdir.join(f'step_{i}.vtp')))
+        lines.append(f'<DataSet timestep="{i * 0.5}" file="step_{i}.vtp"/>')
+    lines += ['</Collection>', '</VTKFile>']
+    filename = str(tmpdir.join('series.pvd'))
+    with open(filename, 'w') as f:
+        f.write('\n'.join(lines))
+    return filename
+
+
+def _time_series_ensight(tmpdir, n_steps=3):
+    grid = ex.load_hexbeam()
+    grid.cell_arrays['BlockId'] = np.ones(grid.n_cells, dtype=np.int32)
+    writer = vtk.vtkEnSightWriter()
+    writer.SetPath(str(tmpdir))
+    writer.SetBaseName('beam')
+    for i in range(n_steps):
+        grid.point_arrays['p'] = np.full(grid.n_points, i, dtype=float)
+        writer.SetInputData(grid)
+        writer.SetTimeStep(i)
+        writer.Write()
+    # the case file of the writer is only flushed at exit, so write it here
+    filename = str(tmpdir.join('beam.case'))
+    with open(filename, 'w') as f:
+        f.write('FORMAT\ntype: ensight gold\n'
+                'GEOMETRY\nmodel: beam.0.00000.geo\n'
+                'VARIABLE\nscalar per node: 1 p_n beam.0.*****_n.p\n'
+                'scalar per element: 1 BlockId_c beam.0.*****_c.BlockId\n'
+                f'TIME\ntime set: 1\nnumber of steps: {n_steps}\n'
+                'filename start number: 00000\nfilename increment: 00001\n'
+                f'time values: {" ".join(str(i) for i in range(n_steps))}\n')
+    return filename
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_time_series_reader_pvd(tmpdir, prefetch):
+    filename = _time_series_pvd(tmpdir)
+    with pyvista.TimeSeriesReader(filename, point_arrays=['p'], prefetch=prefetch) as reader:
+        assert reader.n_time_steps == len(reader) == 3
+        assert reader.time_values == [0.0, 0.5, 1.0]
+        for i, mesh in enumerate(reader):
+            assert reader.active_time_value == reader.time_values[i]
+            assert np.all(mesh['p'] == i)
+            assert 'q' not in mesh.point_arrays
+            assert 'c' in mesh.cell_arrays
+
+        reader.set_active_time(0.6)
+        assert reader.active_time_value == 0.5
+        assert np.all(reader.read()['p'] == 1)
+
+
+def test_time_series_reader_ensight(tmpdir):
+    filename = _time_series_ensight(tmpdir)
+    reader = pyvista.TimeSeriesReader(filename)
+    assert reader.n_time_steps == 3
+    meshes = list(reader)
+    for i, mesh in enumerate(meshes):
+        assert np.all(mesh[0]['p_n'] == i)
+    reader.set_active_time(reader.time_values[1])
+    assert np.all(reader.read()[0]['p_n'] == 1)
+    reader.close()
+
+    reader = pyvista.TimeSeriesReader(filename, cell_arrays=[])
+    assert 'BlockId_c' not in reader.read()[0].cell_arrays
+    reader.close()
+
+
+def test_time_series_reader_invalid(tmpdir):
+    with pytest.raises(FileNotFoundError):
+        pyvista.TimeSeriesReader(str(tmpdir.join('missing.pvd')))
+    with pytest.raises(KeyError):
+        pyvista.TimeSeriesReader(_time_series_pvd(tmpdir), point_arrays=['missing']).read()
+    filename = str(tmpdir.join('mesh.vtk'))
+    pyvista.Sphere().save(filename)
+    with pytest.raises(TypeError):
+        pyvista.TimeSeriesReader(filename, point_arrays=['Normals'])
+
+
 def test_get_array():
     grid = pyvista.UnstructuredGrid(ex.hexbeamfile)
     # add array to both point/cell data with same name
@@ -449,6 +772,46 @@ def test_cells_dict_utils():
            cells.generate_cell_offsets(cells_arr, np.array([255, 255])))
 
 
+def test_generate_cell_offsets_variable_size():
+    # triangle, polygon, hexahedron, empty polygon
+    cells_arr = np.array([3, 0, 1, 2, 5, 0, 1, 2, 3, 4, 8, 0, 1, 2, 3, 4, 5, 6, 7, 0])
+    cells_types = np.array([vtk.VTK_TRIANGLE, vtk.VTK_POLYGON, vtk.VTK_HEXAHEDRON,
+                            vtk.VTK_POLYGON])
+    expected = [0, 4, 10, 19]
+    assert np.array_equal(cells.generate_cell_offsets(cells_arr, cells_types), expected)
+    assert np.array_equal(cells.generate_cell_offsets_loop(cells_arr, cells_types), expected)
+
+    # last cell is larger than the remaining array
+    with pytest.raises(ValueError):
+        cells.generate_cell_offsets_loop(np.array([3, 0, 1, 2, 5, 0, 1]), cells_types[:2])
+
+    # negative cell size
+    with pytest.raises(ValueError):
+        cells.generate_cell_offsets_loop(np.array([3, 0, 1, 2, -1, 0]), cells_types[:2])
+
+
+def test_legacy_offsets_connectivity_conversion():
+    legacy = np.array([3, 0, 1, 2, 5, 9, 8, 7, 6, 5, 0, 4, 3, 2, 1, 0])
+    offsets, connectivity = cells.legacy_to_offsets_connectivity(legacy)
+    assert np.array_equal(offsets, [0, 3, 8, 8, 12])
+    assert np.array_equal(connectivity, [0, 1, 2, 9, 8, 7, 6, 5, 3, 2, 1, 0])
+    assert np.array_equal(cells.offsets_connectivity_to_legacy(offsets, connectivity), legacy)
+
+    legacy_offsets = cells.generate_cell_offsets_loop(legacy, np.zeros(4, dtype=np.uint8))
+    offsets_b, connectivity_b = cells.offsets_from_legacy_offsets(legacy, legacy_offsets)
+    assert np.array_equal(offsets_b, offsets)
+    assert np.array_equal(connectivity_b, connectivity)
+
+    with pytest.raises(ValueError):
+        cells.legacy_to_offsets_connectivity([3, 0, 1, 2, 4, 0])
+    with pytest.raises(ValueError):
+        cells.legacy_to_offsets_connectivity([3.0, 0, 1, 2])
+    with pytest.raises(ValueError):
+        cells.offsets_connectivity_to_legacy([0, 3, 2], [0, 1])
+    with pytest.raises(ValueError):
+        cells.offsets_connectivity_to_legacy([0, 3, 2], [0, 1, 2])
+
+
 def test_apply_transformation_to_points():
     mesh = ex.load_airplane()
     points = mesh.points
@@ -586,3 +949,185 @@ def test_reflection():
         transformations.reflection(normal, point=[1, 0, 0, 0])
     with pytest.raises(ValueError):
         transformations.reflection([0, 0, 0])
+
+
+def _shared_mesh_sum(handle):
+    mesh = handle.attach()
+    return mesh.n_cells, float(mesh.points.sum()), float(mesh['values'].sum())
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='Requires Python 3.8')
+@pytest.mark.parametrize('dataset', [pyvista.Sphere(), ex.load_hexbeam(),
+                                     pyvista.UniformGrid((3, 4, 5))])
+def test_shared_dataset(dataset):
+    from concurrent.futures import ProcessPoolExecutor
+
+    dataset['values'] = np.arange(dataset.n_points)
+    with pyvista.SharedDataSet(dataset) as shared:
+        mesh = shared.handle.attach()
+        assert isinstance(mesh, type(dataset))
+        assert np.array_equal(mesh.points, dataset.points)
+        assert np.array_equal(mesh['values'], dataset['values'])
+        assert isinstance(mesh.point_arrays['values'], pyvista.pyvista_ndarray)
+        assert mesh.n_cells == dataset.n_cells
+
+        with ProcessPoolExecutor(1) as executor:
+            result = executor.submit(_shared_mesh_sum, shared.handle).result()
+        assert result == (dataset.n_cells, float(dataset.points.sum()),
+                          float(dataset['values'].sum()))
+    assert shared.unlinked
+
+    # the attached mesh stays valid after unlinking
+    assert np.array_equal(mesh.points, dataset.points)
+
+
+def _shared_mesh_write(handle):
+    mesh = handle.attach()
+    mesh.points[:] = 0
+    mesh['values'][:] = -1
+    return float(np.abs(mesh.points).sum())
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='Requires Python 3.8')
+def test_shared_dataset_copy_on_write():
+    from concurrent.futures import ProcessPoolExecutor
+
+    sphere = pyvista.Sphere()
+    sphere['values'] = np.arange(sphere.n_points)
+    with pyvista.SharedDataSet(sphere) as shared:
+        mesh = shared.handle.attach()
+        mesh.points += 1
+        assert np.allclose(mesh.points, sphere.points + 1)
+        assert np.array_equal(shared.handle.attach().points, sphere.points)
+
+        with ProcessPoolExecutor(1) as executor:
+            assert executor.submit(_shared_mesh_write, shared.handle).result() == 0
+        other = shared.handle.attach()
+        assert np.array_equal(other.points, sphere.points)
+        assert np.array_equal(other['values'], sphere['values'])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8) or os.name == 'nt',
+                    reason='Requires Python 3.8 and a resource tracker')
+def test_shared_dataset_attach_untracked():
+    from multiprocessing import resource_tracker
+
+    with pyvista.SharedDataSet(pyvista.Sphere()) as shared:
+        with mock.patch.object(resource_tracker, 'register') as register, \
+             mock.patch.object(resource_tracker, 'unregister') as unregister:
+            shared.handle.attach()
+    register.assert_not_called()
+    unregister.assert_not_called()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='Requires Python 3.8')
+def test_shared_dataset_refcount():
+    shared = pyvista.SharedDataSet(pyvista.Sphere())
+    assert shared.refcount == 1
+    handle = shared.acquire()
+    assert handle is shared.handle
+    assert shared.refcount == 2
+    shared.release()
+    assert not shared.unlinked
+    shared.release()
+    assert shared.unlinked
+    with pytest.raises(ValueError):
+        shared.acquire()
+    with pytest.raises(FileNotFoundError):
+        handle.attach()
+
+    shared = pyvista.SharedDataSet(pyvista.Sphere())
+    shared.acquire()
+    shared.unlink()
+    assert shared.unlinked
+    assert shared.refcount == 0
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason='Requires Python 3.8')
+def test_shared_dataset_string_array():
+    mesh = pyvista.Sphere()
+    mesh.field_arrays['name'] = ['sphere', 'ball']
+    with pyvista.SharedDataSet(mesh) as shared:
+        assert shared.handle.attach().field_arrays['name'].tolist() == ['sphere', 'ball']
+
+
+def test_filter_executor():
+    mesh = pyvista.Sphere()
+    progress = []
+    with pyvista.FilterExecutor() as executor:
+        future = executor.submit(mesh.delaunay_3d, alpha=2.0)
+        future.add_progress_callback(lambda future, value: progress.append(value))
+        tetra = future.result()
+        assert isinstance(future, pyvista.FilterFuture)
+        assert not future.cancelled()
+        assert not future.cancel()
+        assert not future.abort()
+        assert tetra.n_cells == mesh.delaunay_3d(alpha=2.0).n_cells > 0
+
+        future = executor.submit(mesh.threshold, [1000, 2000], scalars='missing')
+        with pytest.raises(ValueError):
+            future.result()
+
+
+def test_filter_executor_cancel():
+    points = pyvista.PolyData(np.random.random((20000, 3)))
+    started = threading.Event()
+    with pyvista.FilterExecutor() as executor:
+        running = executor.submit(points.delaunay_3d)
+        running.add_progress_callback(lambda future, value: started.set())
+        pending = executor.submit(points.delaunay_3d)
+        assert pending.cancel()
+        assert pending.cancelled()
+
+        assert started.wait(60)
+        # running filters are aborted, not cancelled
+        assert not running.cancel()
+        assert running.abort()
+        with pytest.raises(concurrent.futures.CancelledError):
+            running.result()
+        assert running.cancelled()
+        assert 0 < running.progress < 1
+
+        # pending filters are cancelled when aborted
+        blocking = executor.submit(points.delaunay_3d)
+        pending = executor.submit(points.delaunay_3d)
+        assert pending.abort()
+        assert pending.cancelled()
+        assert blocking.abort()
+
+
+def test_profile(tmpdir):
+    mesh = ex.load_uniform()
+    blocks = pyvista.MultiBlock([pyvista.Sphere(), pyvista.Cube()])
+    with pyvista.profile() as prof:
+        surface = mesh.threshold(300).extract_surface()
+        combined = blocks.combine()
+        with pyvista.profile() as inner:
+            surface.triangulate()
+    mesh.threshold(300)
+
+    assert [record.filter for record in prof.records] == ['threshold', 'extract_surface',
+                                                          'combine', 'triangulate']
+    assert len(inner) == 1
+    threshold = prof.records[0]
+    assert threshold.algorithm == 'vtkThreshold'
+    assert (threshold.n_points_in, threshold.n_cells_in) == (mesh.n_points, mesh.n_cells)
+    assert threshold.duration > 0
+    assert threshold.memory > 0
+    assert prof.records[1].n_points_out == surface.n_points
+    assert prof.records[2].n_points_in == blocks[0].n_points + blocks[1].n_points
+    assert prof.records[2].n_cells_out == combined.n_cells
+    assert prof.total_time >= threshold.duration
+
+    table = prof.table(sort=True)
+    assert 'vtkDataSetSurfaceFilter' in table
+    assert repr(prof) == prof.table()
+
+    filename = str(tmpdir.join('trace.json'))
+    prof.save_chrome_trace(filename)
+    with open(filename) as f:
+        trace = json.load(f)
+    assert [event['name'] for event in trace['traceEvents']] == [
+        record.filter for record in prof.records]
+    assert trace['traceEvents'][0]['ph'] == 'X'
+    assert trace['traceEvents'][0]['args']['algorithm'] == 'vtkThreshold'